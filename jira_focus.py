@@ -1,16 +1,29 @@
 import json
+import bisect
+import csv
+import datetime
+import email.utils
 import os
+import queue
+import random
 import re
 import sys
 import time
+import threading
 import traceback
+import urllib.parse
+import uuid
 import weakref
-from collections import Counter
-from functools import lru_cache
-from tkinter import messagebox
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FutureTimeout
+from tkinter import filedialog, messagebox
 
 import customtkinter as ctk
 
+# imported on first use by _requests(); keeps the HTTP stack off the startup critical path
+requests = None
+
 # Dark theme
 DARK_TERMINAL_GREEN = "#0A84FF"
 DARK_TERMINAL_GREEN_BRIGHT = "#5E9DFF"
@@ -63,6 +76,1188 @@ FONT_MONO_LARGE = (FONT_FAMILY_MONO, 15)
 FONT_MONO_XLARGE = (FONT_FAMILY_MONO, 20, "bold")
 FONT_MONO_SMALL = (FONT_FAMILY_MONO, 11)
 
+HTTP_POOL_SIZE = 10
+HTTP_CONNECT_TIMEOUT = 5
+HTTP_READ_TIMEOUT = 30
+HTTP_MAX_ATTEMPTS = 4
+RETRY_BASE_DELAY_SECONDS = 0.5
+RETRY_MAX_DELAY_SECONDS = 60
+# sleeping on the Tk thread freezes the window, so UI-thread calls only take short retries
+RETRY_UI_THREAD_MAX_DELAY_SECONDS = 2
+RETRY_STATUSES = {429, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+RATE_LIMIT_PER_SECOND = 10
+RATE_LIMIT_BURST = 10
+RATE_LIMIT_MIN_PER_SECOND = 0.5
+RATE_LIMIT_RECOVERY_STEP = 0.1
+LATENCY_WINDOW = 200
+LATENCY_MIN_SAMPLES = 20
+# read timeout = multiplier x p99 of the endpoint class, kept within [min, configured read timeout]
+ADAPTIVE_TIMEOUT_MULTIPLIER = 3
+ADAPTIVE_READ_TIMEOUT_MIN = 5
+# handshakes are a fraction of a typical round trip; connect timeout = multiplier x overall p50
+ADAPTIVE_CONNECT_MULTIPLIER = 4
+ADAPTIVE_CONNECT_TIMEOUT_MIN = 1.5
+HEDGE_PERCENTILE = 0.95
+HEDGE_MIN_DELAY_SECONDS = 0.05
+PERF_MAX_SPANS = 2000
+PERF_PANEL_REFRESH_MS = 2000
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_PROBE_MIN_MS = 5000
+CIRCUIT_PROBE_MAX_MS = 60000
+IO_WORKERS = 4
+UI_POLL_MS = 25
+LABEL_SCAN_CONCURRENCY = 4
+LABEL_EDITOR_MODES = ("typeahead", "exhaustive")
+LABEL_TYPEAHEAD_DEBOUNCE_MS = 250
+TASK_ROW_HEIGHT = 30
+TASK_PAGE_SIZE = 50
+TASK_MAX_PAGES = 20
+WORKLOG_PAGE_SIZE = 100
+WORKLOG_JOURNAL_FILE = "worklog_journal.jsonl"
+WORKLOG_RETRY_MIN_MS = 5000
+WORKLOG_RETRY_MAX_MS = 300000
+# statuses worth retrying a worklog POST on; any other 4xx (including 401/403) will not succeed by waiting
+WORKLOG_RETRY_STATUSES = {408, 409, 429}
+TIMER_CHECKPOINT_MS = 30000
+BOOTSTRAP_SNAPSHOT_FILE = "bootstrap_snapshot.json"
+BOOTSTRAP_SNAPSHOT_SAVE_DELAY_MS = 1000
+PROJECT_PAGE_SIZE = 100
+PROJECT_LOAD_CONCURRENCY = 4
+RECENT_PROJECTS_MAX = 8
+PROJECT_SEARCH_ENTRY = "> search all projects..."
+ISSUE_TYPES_TTL_SECONDS = 1800
+ISSUE_TYPES_PAGE_SIZE = 50
+TRANSITION_GRAPH_FILE = "transition_graph.json"
+TRANSITION_MAX_HOPS = 6
+NOTICE_INFO_MS = 4000
+BULK_MAX_ISSUES = 1000
+BULK_FAN_OUT_CONCURRENCY = 4
+BULK_FALLBACK_STATUSES = {403, 404, 405, 501}
+BULK_POLL_INTERVAL_SECONDS = 1.0
+BULK_POLL_TIMEOUT_SECONDS = 120
+BULK_STATUS_TARGETS = ("To Do", "In Progress", "Done")
+BULK_CREATE_CHUNK = 50
+LABEL_ROW_HEIGHT = 26
+
+
+def _requests():
+    """Import requests on first use (normally from a worker thread) and return the module."""
+    global requests
+    if requests is None:
+        import requests as requests_module
+        requests = requests_module
+    return requests
+
+
+def _retry_after_seconds(headers, use_reset=False):
+    """Seconds the server asks us to wait (Retry-After, else X-RateLimit-Reset if use_reset), or None.
+
+    Unbounded: callers must cap it before sleeping on it.
+    """
+    value = headers.get('Retry-After')
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                when = email.utils.parsedate_to_datetime(value)
+                return max(0.0, (when - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+    reset = headers.get('X-RateLimit-Reset') if use_reset else None
+    if reset:
+        try:
+            when = datetime.datetime.fromisoformat(reset.replace('Z', '+00:00'))
+            if when.tzinfo is None:
+                when = when.replace(tzinfo=datetime.timezone.utc)
+            return max(0.0, (when - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+        except ValueError:
+            pass
+    return None
+
+
+class PerfSpan:
+    """One timed request or user action; finish() records it. Usable as a context manager."""
+
+    def __init__(self, recorder, kind, name):
+        self.recorder = recorder
+        self.kind = kind
+        self.name = name
+        self.started_at = time.time()
+        self._t0 = time.perf_counter()
+        self.finished = False
+
+    def finish(self, **fields):
+        if self.finished:
+            return
+        self.finished = True
+        self.recorder.add(self.kind, self.name, time.perf_counter() - self._t0, started_at=self.started_at, **fields)
+
+    def then(self, callback):
+        """Wrap a background job callback so the span ends when the result arrives."""
+        def finish_and_call(*args):
+            self.finish(ok=not (args and isinstance(args[0], Exception)))
+            return callback(*args)
+        return finish_and_call
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.finish(ok=exc_type is None)
+        return False
+
+
+def timed_action(name):
+    """Method decorator recording each call as an 'action' span in self.perf."""
+    def decorate(method):
+        def wrapper(self, *args, **kwargs):
+            with self.perf.span('action', name):
+                return method(self, *args, **kwargs)
+        wrapper.__name__ = method.__name__
+        wrapper.__doc__ = method.__doc__
+        return wrapper
+    return decorate
+
+
+class PerfRecorder:
+    """Ring buffer of the last PERF_MAX_SPANS spans, with per-name percentiles and JSON/CSV export."""
+
+    FIELDS = ('kind', 'name', 'started_at', 'duration_ms', 'bytes_out', 'bytes_in', 'cache', 'retries', 'status', 'ok')
+
+    def __init__(self, max_spans=PERF_MAX_SPANS):
+        self.spans = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+
+    def span(self, kind, name):
+        return PerfSpan(self, kind, name)
+
+    def add(self, kind, name, seconds, started_at=None, **fields):
+        record = dict.fromkeys(self.FIELDS)
+        record.update(fields, kind=kind, name=name, started_at=started_at or time.time(),
+                      duration_ms=round(seconds * 1000, 1))
+        with self._lock:
+            self.spans.append(record)
+
+    def clear(self):
+        with self._lock:
+            self.spans.clear()
+
+    def summary(self):
+        """[(kind, name, count, p50_ms, p95_ms, kb_in, cache_hits, retries)] sorted by total time spent."""
+        with self._lock:
+            spans = list(self.spans)
+        groups = {}
+        for span in spans:
+            groups.setdefault((span['kind'], span['name']), []).append(span)
+        rows = []
+        for (kind, name), group in groups.items():
+            durations = sorted(span['duration_ms'] for span in group)
+            rows.append((kind, name, len(group), durations[len(durations) // 2],
+                         durations[min(len(durations) - 1, int(0.95 * len(durations)))],
+                         sum(span['bytes_in'] or 0 for span in group) / 1024,
+                         sum(span['cache'] in ('hit', 'stale') for span in group),
+                         sum(span['retries'] or 0 for span in group), sum(durations)))
+        rows.sort(key=lambda row: row[-1], reverse=True)
+        return [row[:-1] for row in rows]
+
+    def export(self, path):
+        """Write all spans to path: CSV for a .csv name, JSON (spans plus summary) otherwise."""
+        with self._lock:
+            spans = list(self.spans)
+        if path.lower().endswith('.csv'):
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=self.FIELDS)
+                writer.writeheader()
+                writer.writerows(spans)
+        else:
+            summary = [dict(zip(('kind', 'name', 'count', 'p50_ms', 'p95_ms', 'kb_in', 'cache_hits', 'retries'), row))
+                       for row in self.summary()]
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'exported_at': time.time(), 'summary': summary, 'spans': spans}, f, indent=2)
+        return len(spans)
+
+
+class StartupProfiler:
+    """Phase timings for --startup-profile; does nothing unless enabled."""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.t0 = time.perf_counter()
+        self.marks = []
+        self._reported = False
+
+    def mark(self, phase):
+        if self.enabled:
+            self.marks.append((phase, time.perf_counter()))
+
+    def report(self):
+        if not self.enabled or self._reported:
+            return
+        self._reported = True
+        print("## Startup profile ##")
+        previous = self.t0
+        for phase, t in self.marks:
+            print(f"   {phase:<24} +{(t - previous) * 1000:8.1f} ms   @{(t - self.t0) * 1000:8.1f} ms")
+            previous = t
+
+
+class JiraTransport:
+    """Shared keep-alive HTTP session used for every Jira REST call."""
+
+    def __init__(self, auth, headers, pool_size=HTTP_POOL_SIZE, connect_timeout=HTTP_CONNECT_TIMEOUT,
+                 read_timeout=HTTP_READ_TIMEOUT):
+        self.auth = auth
+        self.headers = headers
+        self.pool_size = max(1, int(pool_size))
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._closed = False
+
+    def _get_session(self):
+        if self._session is not None:
+            return self._session
+        # workers can hit the first request together; only one of them may build the pool
+        with self._session_lock:
+            if self._session is not None:
+                return self._session
+            _requests()
+            session = requests.Session()
+            session.auth = self.auth
+            session.headers.update(self.headers)
+            # pool_block keeps the number of open sockets bounded by pool_size
+            adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size,
+                                                    pool_block=True, max_retries=0)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+            print(f"[HTTP] Session opened (pool size {self.pool_size}, "
+                  f"timeouts {self.connect_timeout}s/{self.read_timeout}s)")
+            return session
+
+    def request(self, method, url, **kwargs):
+        _requests()
+        if self._closed:
+            raise requests.exceptions.RequestException("HTTP transport already closed.")
+        kwargs.setdefault('timeout', (self.connect_timeout, self.read_timeout))
+        return self._get_session().request(method, url, **kwargs)
+
+    def close(self):
+        self._closed = True
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            try:
+                session.close()
+                print("[HTTP] Session closed.")
+            except Exception as e:
+                print(f"[HTTP] Error closing session: {e}")
+
+
+class TokenBucket:
+    """Client-side pacing for fan-out requests that adapts to Jira's rate limiting.
+
+    acquire() blocks until a token is available. A throttled response halves the refill rate
+    and can pause every caller until Retry-After has passed; each success earns a little rate
+    back, so long runs settle just under what the server accepts.
+    """
+
+    def __init__(self, rate=RATE_LIMIT_PER_SECOND, capacity=RATE_LIMIT_BURST, min_rate=RATE_LIMIT_MIN_PER_SECOND):
+        self.max_rate = self.rate = max(min_rate, float(rate))
+        self.min_rate = min_rate
+        self.capacity = max(1.0, float(capacity))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, paced=True):
+        """Wait out any pause and, when paced, take a token. Returns False if the job was cancelled."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if not paced:
+                        return True
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return True
+                    wait = (1 - self._tokens) / self.rate
+            if current_job_cancelled():
+                return False
+            time.sleep(min(wait, 0.25))
+
+    def throttled(self, retry_after=None):
+        if retry_after:
+            retry_after = min(retry_after, RETRY_MAX_DELAY_SECONDS)
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+        print(f"[RateLimit] Throttled; pacing at {self.rate:.1f} req/s"
+              f"{f', paused {retry_after:.1f}s' if retry_after else ''}.")
+
+    def near_limit(self):
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * 0.75)
+
+    def succeeded(self):
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + RATE_LIMIT_RECOVERY_STEP)
+
+
+class LatencyTracker:
+    """Rolling request latencies per endpoint class ("GET search", "POST issue", ...).
+
+    Keeps the last LATENCY_WINDOW samples of each class and derives percentiles, per-class
+    timeouts and the hedging delay from them. Thread-safe.
+    """
+
+    def __init__(self, window=LATENCY_WINDOW, min_samples=LATENCY_MIN_SAMPLES):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples = {}
+        self._all = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(method, endpoint):
+        endpoint_class = (ResponseCache.endpoint_class(endpoint)
+                          or endpoint.split('?', 1)[0].strip('/').split('/', 1)[0] or 'other')
+        return f"{method} {endpoint_class}"
+
+    def record(self, key, seconds):
+        with self._lock:
+            self._samples.setdefault(key, deque(maxlen=self.window)).append(seconds)
+            self._all.append(seconds)
+
+    def percentile(self, key, fraction):
+        """Latency below which `fraction` of the class' samples fall, or None with too few samples."""
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()) if key is not None else self._all)
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+    def timeouts(self, key, connect_default, read_default):
+        """(connect, read) timeouts for a class, tightened from the configured ones as history builds up."""
+        overall_p50 = self.percentile(None, 0.5)
+        connect = connect_default
+        if overall_p50 is not None:
+            connect = min(connect_default, max(ADAPTIVE_CONNECT_TIMEOUT_MIN, ADAPTIVE_CONNECT_MULTIPLIER * overall_p50))
+        p99 = self.percentile(key, 0.99)
+        read = read_default
+        if p99 is not None:
+            read = min(read_default, max(ADAPTIVE_READ_TIMEOUT_MIN, ADAPTIVE_TIMEOUT_MULTIPLIER * p99))
+        return connect, read
+
+
+class CircuitBreaker:
+    """Tracks whether the Jira server is reachable at all.
+
+    CIRCUIT_FAILURE_THRESHOLD consecutive connection failures (connect timeouts included) open the
+    circuit; read timeouts do not count, since the server answered the connection and is only slow.
+    While open, requests fail immediately instead of waiting out their timeouts. Any response, even an
+    HTTP error, proves the server is up and closes it again. on_change(is_open) is called from
+    whichever thread flipped the state.
+    """
+
+    def __init__(self, threshold=CIRCUIT_FAILURE_THRESHOLD, on_change=None):
+        self.threshold = threshold
+        self.on_change = on_change
+        self.failures = 0
+        self.is_open = False
+        self._lock = threading.Lock()
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            changed, self.is_open = self.is_open, False
+        if changed and self.on_change:
+            self.on_change(False)
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            changed = not self.is_open and self.failures >= self.threshold
+            if changed:
+                self.is_open = True
+        if changed and self.on_change:
+            self.on_change(True)
+
+
+# Seconds a successful GET stays fresh, per endpoint class. Classes missing here are never cached.
+CACHE_TTL_SECONDS = {
+    'projects': 600,
+    'createmeta': 600,
+    'transitions': 60,
+    'search': 30,
+    'issue': 30,
+    'myself': 3600,
+    'suggestions': 300,
+}
+CACHE_MAX_ENTRIES = 256
+CACHE_IGNORED_PARAMS = {'_'}
+ISSUE_ENDPOINT_RE = re.compile(r"^issue/([A-Za-z][A-Za-z0-9_]*-\d+|\d+)(?:/|$)")
+
+
+class ResponseCache:
+    """TTL cache for successful Jira GET responses, invalidated by writes to the issues they contain."""
+
+    def __init__(self, ttls=None, max_entries=CACHE_MAX_ENTRIES):
+        self.ttls = dict(CACHE_TTL_SECONDS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def endpoint_class(endpoint):
+        path = endpoint.split('?', 1)[0].strip('/')
+        if path.startswith('project'):
+            return 'projects'
+        if path.startswith('issue/createmeta'):
+            return 'createmeta'
+        if path == 'search' or path.startswith('search/'):
+            return 'search'
+        if path == 'myself':
+            return 'myself'
+        if path.startswith('jql/autocompletedata'):
+            return 'suggestions'
+        if ISSUE_ENDPOINT_RE.match(path):
+            return 'transitions' if path.endswith('/transitions') else 'issue'
+        return None
+
+    @staticmethod
+    def normalize_key(endpoint):
+        path, _, query = endpoint.partition('?')
+        params = [(k, v) for k, v in urllib.parse.parse_qsl(query, keep_blank_values=True)
+                  if k not in CACHE_IGNORED_PARAMS]
+        params.sort()
+        normalized = path.strip('/')
+        if params:
+            normalized += '?' + urllib.parse.urlencode(params)
+        return normalized
+
+    @staticmethod
+    def _issue_keys_in(endpoint, result):
+        keys = set()
+        match = ISSUE_ENDPOINT_RE.match(endpoint.split('?', 1)[0].strip('/'))
+        if match:
+            keys.add(match.group(1))
+        data = result.get('data') if isinstance(result, dict) else None
+        if isinstance(data, dict):
+            for issue in data.get('issues') or []:
+                if issue.get('key'): keys.add(issue['key'])
+                if issue.get('id'): keys.add(str(issue['id']))
+        return keys
+
+    def get(self, endpoint, allow_stale=False):
+        """Fresh cached result for endpoint; expired ones too with allow_stale (offline mode)."""
+        key = self.normalize_key(endpoint)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, result, _issue_keys = entry
+            # expired entries stay until evicted or invalidated, so offline mode can still show them
+            if time.monotonic() >= expires_at and not allow_stale:
+                return None
+            self._entries.move_to_end(key)
+            return result
+
+    def put(self, endpoint, result):
+        if not result or not result.get('success'):
+            return
+        ttl = self.ttls.get(self.endpoint_class(endpoint))
+        if not ttl:
+            return
+        key = self.normalize_key(endpoint)
+        issue_keys = self._issue_keys_in(endpoint, result)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, result, issue_keys)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_for_write(self, method, endpoint):
+        """Drop everything a POST/PUT/DELETE on `endpoint` may have made stale."""
+        path = endpoint.split('?', 1)[0].strip('/')
+        match = ISSUE_ENDPOINT_RE.match(path)
+        if match:
+            self.invalidate_issue(match.group(1))
+        elif path.startswith('issue'):
+            # issue creation (single or bulk) changes every search result for the project
+            self.invalidate_class('search')
+
+    def invalidate_issue(self, issue_key):
+        with self._lock:
+            stale = [k for k, (_exp, _res, issue_keys) in self._entries.items() if issue_key in issue_keys]
+            for k in stale:
+                del self._entries[k]
+        if stale:
+            print(f"[Cache] Invalidated {len(stale)} entries touching {issue_key}.")
+
+    def invalidate_class(self, endpoint_class):
+        with self._lock:
+            stale = [k for k in self._entries if self.endpoint_class(k) == endpoint_class]
+            for k in stale:
+                del self._entries[k]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class PrefixIndex:
+    """Sorted, case-insensitive prefix index from search terms to items, for instant local typeahead."""
+
+    def __init__(self):
+        self._terms = []
+        self._seen = set()
+
+    def add(self, item, *terms):
+        for term in terms or (item,):
+            entry = (str(term).lower(), item)
+            if entry not in self._seen:
+                self._seen.add(entry)
+                bisect.insort(self._terms, entry)
+
+    def search(self, prefix, limit=None):
+        prefix = prefix.lower()
+        matches = []
+        seen_items = set()
+        i = bisect.bisect_left(self._terms, (prefix,))
+        while i < len(self._terms) and self._terms[i][0].startswith(prefix):
+            item = self._terms[i][1]
+            if item not in seen_items:
+                seen_items.add(item)
+                matches.append(item)
+                if limit and len(matches) >= limit:
+                    break
+            i += 1
+        return matches
+
+    def __len__(self):
+        return len(self._seen)
+
+
+_job_context = threading.local()
+
+
+def current_job_cancelled():
+    """True when called from a BackgroundRunner job whose handle has been cancelled."""
+    handle = getattr(_job_context, 'handle', None)
+    return handle is not None and handle.cancelled
+
+
+def current_job_quiet():
+    """True when the running job handles its own errors and wants no error dialogs."""
+    return getattr(_job_context, 'quiet', False)
+
+
+class JobHandle:
+    """Handle for a background job. Cancelling it drops the result instead of delivering it."""
+
+    def __init__(self, name):
+        self.name = name
+        self.cancelled = False
+        self.future = None
+
+    def cancel(self):
+        self.cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+
+    def done(self):
+        return self.future is not None and self.future.done()
+
+
+class _Flight:
+    """One shared in-flight call. Counts as cancelled only once every caller waiting on it is."""
+
+    def __init__(self):
+        self.handles = []
+        self.result = None
+        self.finished = threading.Event()
+
+    @property
+    def cancelled(self):
+        return all(handle is not None and handle.cancelled for handle in self.handles)
+
+
+class SingleFlight:
+    """Lets concurrent callers asking for the same key share one call instead of repeating it.
+
+    The first caller runs fn(); later ones wait for its result and can leave early when their
+    own job is cancelled. While fn() runs, current_job_cancelled() reports the whole group, so
+    retries and backoff stop only when nobody wants the answer any more.
+    """
+
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    def do(self, key, fn):
+        handle = getattr(_job_context, 'handle', None)
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.shared += 1
+            flight.handles.append(handle)
+
+        if leader:
+            _job_context.handle = flight
+            try:
+                flight.result = fn()
+                return flight.result
+            except Exception as e:
+                flight.result = {'success': False, 'error': str(e), 'status_code': None}
+                raise
+            finally:
+                _job_context.handle = handle
+                with self._lock:
+                    del self._flights[key]
+                flight.finished.set()
+
+        print(f"[SingleFlight] Joined in-flight request for {key.split('?')[0]}")
+        while not flight.finished.wait(0.25):
+            if handle is not None and handle.cancelled:
+                return {'success': False, 'error': 'Cancelled.', 'status_code': None}
+        return flight.result
+
+
+class BackgroundRunner:
+    """Runs blocking Jira I/O on a worker pool and hands results back to the Tk thread through after()."""
+
+    def __init__(self, root, max_workers=IO_WORKERS, poll_ms=UI_POLL_MS, on_unhandled_error=None):
+        self.root = root
+        self.poll_ms = poll_ms
+        # called as on_unhandled_error(job_name, exc) on the Tk thread for failed jobs without on_error
+        self.on_unhandled_error = on_unhandled_error
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jira-io")
+        self._ui_queue = queue.Queue()
+        self._in_flight = 0
+        self._polling = False
+        self._shutdown = False
+
+    def submit(self, fn, *args, on_done=None, on_error=None, owner=None, name=None, quiet=False, **kwargs):
+        """Run fn(*args, **kwargs) on a worker; on_done/on_error are called on the Tk thread.
+
+        A quiet job reports its own errors, so request helpers skip their error dialogs inside it.
+        Without on_error a failure goes to on_unhandled_error instead of being dropped.
+        """
+        handle = JobHandle(name or getattr(fn, '__name__', 'job'))
+        if self._shutdown:
+            handle.cancelled = True
+            return handle
+
+        def work():
+            if handle.cancelled:
+                return
+            _job_context.handle = handle
+            _job_context.quiet = quiet
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                print(f"[Worker] Job '{handle.name}' failed: {e}")
+                traceback.print_exc()
+                error_callback = on_error or (lambda err: self._report_unhandled(handle, err))
+                self._ui_queue.put((self._deliver, (handle, error_callback, e, owner)))
+            else:
+                self._ui_queue.put((self._deliver, (handle, on_done, result, owner)))
+            finally:
+                _job_context.handle = None
+                _job_context.quiet = False
+
+        self._in_flight += 1
+        handle.future = self._executor.submit(work)
+        handle.future.add_done_callback(lambda _f: self._ui_queue.put((self._job_finished, ())))
+        self._ensure_polling()
+        return handle
+
+    def post(self, fn, *args):
+        """Thread-safe: schedule fn(*args) on the Tk thread."""
+        self._ui_queue.put((fn, args))
+        if threading.current_thread() is threading.main_thread():
+            self._ensure_polling()
+
+    def _deliver(self, handle, callback, value, owner):
+        if handle.cancelled or callback is None:
+            return
+        if owner is not None:
+            try:
+                if not owner.winfo_exists():
+                    return
+            except Exception:
+                return
+        callback(value)
+
+    def _report_unhandled(self, handle, error):
+        print(f"[Worker] Job '{handle.name}' has no error handler; reporting failure.")
+        if self.on_unhandled_error is not None:
+            self.on_unhandled_error(handle.name, error)
+
+    def _job_finished(self):
+        self._in_flight = max(0, self._in_flight - 1)
+
+    def _ensure_polling(self):
+        if self._polling or self._shutdown:
+            return
+        try:
+            self.root.after(self.poll_ms, self._poll)
+            self._polling = True
+        except Exception as e:
+            print(f"[Worker] Cannot schedule UI poll: {e}")
+
+    def _poll(self):
+        self._polling = False
+        while True:
+            try:
+                fn, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"[Worker] UI callback failed: {e}")
+                traceback.print_exc()
+        # poll only while work is outstanding so an idle app has no periodic wakeups
+        if self._in_flight > 0 or not self._ui_queue.empty():
+            self._ensure_polling()
+
+    def shutdown(self):
+        self._shutdown = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class WorklogJournal:
+    """Append-only JSONL journal of timer events and worklogs that still have to reach Jira.
+
+    Each record is fsynced before append() returns, so anything journaled survives a crash;
+    replay() rebuilds the pending worklogs from the file and compacts it.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.open_timer = None
+        self._pending = OrderedDict()
+        self._failed = OrderedDict()
+        self._lock = threading.Lock()
+
+    def append(self, event, **fields):
+        record = dict(fields, event=event, ts=round(time.time(), 3))
+        line = json.dumps(record, separators=(',', ':'))
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            self._apply(record)
+        return record
+
+    def _apply(self, record):
+        event = record.get('event')
+        if event == 'start':
+            self.open_timer = record
+        elif event == 'checkpoint' and self.open_timer is not None:
+            self.open_timer = dict(self.open_timer, seconds=record.get('seconds'))
+        elif event == 'stop':
+            self.open_timer = None
+        elif event == 'worklog' and record.get('failed'):
+            self._failed[record['id']] = record
+        elif event == 'worklog':
+            self._pending[record['id']] = dict(record, attempts=record.get('attempts', 0))
+        elif event == 'attempt' and record.get('id') in self._pending:
+            self._pending[record['id']]['attempts'] += 1
+        elif event == 'posted':
+            self._pending.pop(record.get('id'), None)
+        elif event == 'failed':
+            entry = self._pending.pop(record.get('id'), None)
+            if entry is not None:
+                self._failed[entry['id']] = dict(entry, event='worklog', failed=record.get('error', ''))
+
+    def record_start(self, issue_key, started, summary="", seconds=0):
+        return self.append('start', issue=issue_key, started=started, summary=summary, seconds=seconds)
+
+    def record_checkpoint(self, issue_key, seconds):
+        return self.append('checkpoint', issue=issue_key, seconds=seconds)
+
+    def record_stop(self, issue_key, seconds):
+        return self.append('stop', issue=issue_key, seconds=seconds)
+
+    def add_worklog(self, issue_key, seconds, started):
+        return self.append('worklog', id=uuid.uuid4().hex[:12], issue=issue_key, seconds=seconds, started=started)
+
+    def pending(self):
+        with self._lock:
+            return [dict(entry) for entry in self._pending.values()]
+
+    def replay(self):
+        """Load the journal from disk, then rewrite it with only what is still open."""
+        with self._lock:
+            self.open_timer = None
+            self._pending.clear()
+            self._failed.clear()
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    for line_no, line in enumerate(f, 1):
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            self._apply(json.loads(line))
+                        except (json.JSONDecodeError, KeyError, TypeError) as e:
+                            # a crash mid-write can leave a torn last line
+                            print(f"[Journal] Skipping unreadable line {line_no}: {e}")
+            except FileNotFoundError:
+                return []
+            self._compact()
+            return [dict(entry) for entry in self._pending.values()]
+
+    def _compact(self):
+        records = list(self._failed.values()) + list(self._pending.values())
+        if self.open_timer is not None:
+            records.append(self.open_timer)
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for record in records:
+                    f.write(json.dumps(record, separators=(',', ':')) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[Journal] Cannot compact {self.path}: {e}")
+
+
+class BootstrapSnapshot:
+    """Last known projects, issue types and account id, so the UI is usable before Jira answers.
+
+    The file is tied to one server and user; a snapshot for any other account is ignored.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path, server, username):
+        self.path = path
+        self.server = server
+        self.username = username
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"[Snapshot] Ignoring unreadable {self.path}: {e}")
+            return None
+        if (not isinstance(data, dict) or data.get('version') != self.VERSION
+                or data.get('server') != self.server or data.get('user') != self.username):
+            return None
+        return data
+
+    def save(self, data):
+        data = dict(data, version=self.VERSION, server=self.server, user=self.username, saved_at=time.time())
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=1)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[Snapshot] Cannot write {self.path}: {e}")
+
+
+class TransitionGraph:
+    """Workflow transitions learned from Jira, keyed by (project, issue type, status).
+
+    Each node maps a target status to the transition id that reaches it, so a status button
+    resolves without a GET, and shortest_path() finds multi-hop routes through statuses already seen.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._nodes = {}
+        self._lock = threading.Lock()
+        self.dirty = False
+
+    @staticmethod
+    def _node_key(project_key, issue_type, status):
+        return "|".join(str(part or '').lower() for part in (project_key, issue_type, status))
+
+    def learn(self, project_key, issue_type, status, transitions):
+        edges = {}
+        for t in transitions:
+            to_name = t.get('to', {}).get('name')
+            if t.get('id') and to_name:
+                edges[to_name.lower()] = {'id': t['id'], 'name': t.get('name', ''), 'to': to_name}
+        key = self._node_key(project_key, issue_type, status)
+        with self._lock:
+            if self._nodes.get(key) != edges:
+                self._nodes[key] = edges
+                self.dirty = True
+
+    def forget(self, project_key, issue_type, status):
+        with self._lock:
+            if self._nodes.pop(self._node_key(project_key, issue_type, status), None) is not None:
+                self.dirty = True
+
+    def knows(self, project_key, issue_type, status):
+        with self._lock:
+            return self._node_key(project_key, issue_type, status) in self._nodes
+
+    def shortest_path(self, project_key, issue_type, status, target_status, max_hops=TRANSITION_MAX_HOPS):
+        """Shortest list of transition edges from status to target_status (BFS), or None if not known."""
+        target = target_status.lower()
+        start = (status or '').lower()
+        if start == target:
+            return []
+        with self._lock:
+            previous = {start: None}
+            frontier = [start]
+            for _hop in range(max_hops):
+                next_frontier = []
+                for current in frontier:
+                    for to_status, edge in self._nodes.get(self._node_key(project_key, issue_type, current), {}).items():
+                        if to_status in previous:
+                            continue
+                        previous[to_status] = (current, edge)
+                        if to_status == target:
+                            hops = []
+                            while previous[to_status] is not None:
+                                to_status, hop = previous[to_status][0], previous[to_status][1]
+                                hops.append(hop)
+                            return hops[::-1]
+                        next_frontier.append(to_status)
+                frontier = next_frontier
+                if not frontier:
+                    break
+        return None
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            with self._lock:
+                self._nodes = dict(data.get('nodes', {})) if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            pass
+        except (OSError, json.JSONDecodeError, AttributeError) as e:
+            print(f"[Transitions] Ignoring unreadable {self.path}: {e}")
+
+    def save(self):
+        with self._lock:
+            data = {'nodes': dict(self._nodes)}
+            self.dirty = False
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=1)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[Transitions] Cannot write {self.path}: {e}")
+
+
+class NoticeBar(ctk.CTkFrame):
+    """Non-modal one-line notice: info fades after a few seconds, errors stay until dismissed."""
+
+    def __init__(self, master, **kwargs):
+        kwargs.setdefault('fg_color', WIDGET_BACKGROUND)
+        kwargs.setdefault('corner_radius', 8)
+        super().__init__(master, **kwargs)
+        self.label = ctk.CTkLabel(self, text="", font=FONT_MONO_SMALL, anchor='w', justify='left', wraplength=400)
+        self.label.pack(side='left', fill='x', expand=True, padx=(8, 4), pady=4)
+        self.close_button = ctk.CTkButton(self, text="x", width=22, height=22, font=FONT_MONO_SMALL, corner_radius=6,
+                                          fg_color="transparent", text_color=TEXT_COLOR_DIM,
+                                          hover_color=HOVER_COLOR_BTN, command=self.hide)
+        self.close_button.pack(side='right', padx=4)
+        self._pack_options = {}
+        self._hide_after_id = None
+
+    def place_in(self, **pack_options):
+        """Remember where the bar goes; it is only packed while a notice is showing."""
+        self._pack_options = pack_options
+
+    def show(self, text, kind="info", timeout_ms=NOTICE_INFO_MS):
+        self.label.configure(text=text, text_color=ERROR_RED if kind == "error" else TEXT_COLOR_NORMAL)
+        if not self.winfo_ismapped():
+            self.pack(**self._pack_options)
+        if self._hide_after_id is not None:
+            self.after_cancel(self._hide_after_id)
+            self._hide_after_id = None
+        if kind != "error":
+            self._hide_after_id = self.after(timeout_ms, self.hide)
+
+    def hide(self):
+        self._hide_after_id = None
+        if self.winfo_exists():
+            self.pack_forget()
+
+
+class VirtualList(ctk.CTkFrame):
+    """Scrollable list that keeps a fixed pool of row widgets and rebinds them to the visible items.
+
+    create_row(parent) builds one row widget, row_height - 1 tall (CTk widgets only take a height in
+    their constructor); bind_row(row, item, index) fills it for an item.
+    Cost depends on the window height, not on len(items).
+    """
+
+    def __init__(self, master, create_row, bind_row, row_height=30, on_view_changed=None, **kwargs):
+        kwargs.setdefault('fg_color', WIDGET_BACKGROUND)
+        kwargs.setdefault('corner_radius', 0)
+        super().__init__(master, **kwargs)
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.row_height = row_height
+        self.on_view_changed = on_view_changed
+        self.items = []
+        self.first_index = 0
+        self._rows = []
+        self._visible_rows = 0
+
+        self.body = ctk.CTkFrame(self, fg_color="transparent", corner_radius=0)
+        self.body.pack(side='left', fill='both', expand=True, padx=(2, 0), pady=2)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar,
+                                          button_color=TERMINAL_GREEN, button_hover_color=TERMINAL_GREEN_BRIGHT)
+        self.scrollbar.pack(side='right', fill='y')
+        self.message_label = ctk.CTkLabel(self.body, text="", font=FONT_MONO_NORMAL, text_color=TEXT_COLOR_DIM,
+                                          wraplength=700)
+
+        self.body.bind("<Configure>", self._on_resize)
+        self._bind_wheel(self.body)
+
+    def _bind_wheel(self, widget):
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            widget.bind(sequence, self._on_mousewheel, add="+")
+        # composite rows list the children that cover them; Tk does not pass wheel events up to the frame
+        for child in getattr(widget, 'wheel_targets', ()):
+            self._bind_wheel(child)
+
+    def _on_mousewheel(self, event):
+        if getattr(event, 'num', None) == 4 or getattr(event, 'delta', 0) > 0:
+            self.scroll_to(self.first_index - 3)
+        else:
+            self.scroll_to(self.first_index + 3)
+        return "break"
+
+    def _on_scrollbar(self, action, *args):
+        if action == "moveto":
+            self.scroll_to(int(round(float(args[0]) * len(self.items))))
+        elif action == "scroll":
+            amount = int(args[0])
+            step = max(1, self._visible_rows - 1) if len(args) > 1 and args[1] == "pages" else 1
+            self.scroll_to(self.first_index + amount * step)
+
+    def _on_resize(self, event=None):
+        height = self.body.winfo_height()
+        needed = max(1, height // self.row_height + 1)
+        while len(self._rows) < needed:
+            row = self.create_row(self.body)
+            self._bind_wheel(row)
+            self._rows.append(row)
+        self._visible_rows = needed
+        self.scroll_to(self.first_index)
+
+    def set_items(self, items, keep_position=False):
+        self.items = items
+        self.message_label.place_forget()
+        self.scroll_to(self.first_index if keep_position else 0)
+
+    def show_message(self, text, text_color=None):
+        self.items = []
+        self.scroll_to(0)
+        self.message_label.configure(text=text, text_color=text_color or TEXT_COLOR_DIM)
+        self.message_label.place(relx=0.5, y=20, anchor='n')
+
+    def scroll_to(self, index):
+        max_first = max(0, len(self.items) - max(1, self._visible_rows - 1))
+        self.first_index = max(0, min(index, max_first))
+        self.refresh()
+
+    def refresh(self):
+        for slot, row in enumerate(self._rows):
+            index = self.first_index + slot
+            if slot < self._visible_rows and index < len(self.items):
+                self.bind_row(row, self.items[index], index)
+                # CTk widgets refuse a place() height; rows get theirs from create_row (row_height - 1)
+                row.place(x=0, y=slot * self.row_height, relwidth=1)
+            else:
+                row.place_forget()
+        total = len(self.items)
+        if total:
+            last = min(total, self.first_index + self._visible_rows)
+            self.scrollbar.set(self.first_index / total, last / total)
+        else:
+            self.scrollbar.set(0, 1)
+        if self.on_view_changed:
+            self.on_view_changed(self.first_index, min(total, self.first_index + self._visible_rows))
+
+
+class PagedItems:
+    """Sparse sequence over a paged server result, for use as VirtualList items.
+
+    Unloaded positions read as `placeholder`; fetch_page(page_no) is called to start loading a
+    page, which must later be handed to store(). At most max_pages pages are held; storing
+    more drops the pages farthest from the last viewed position.
+    """
+
+    def __init__(self, page_size, max_pages, placeholder, fetch_page):
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.placeholder = placeholder
+        self.fetch_page = fetch_page
+        self.total = 0
+        self.pages = {}
+        self.pending = set()
+        self.view_page = 0
+
+    def __len__(self):
+        return self.total
+
+    def __getitem__(self, index):
+        page = self.pages.get(index // self.page_size)
+        offset = index % self.page_size
+        if page is None or offset >= len(page):
+            return self.placeholder
+        return page[offset]
+
+    def pages_for(self, first, last, prefetch=1):
+        """Page numbers covering [first, last) plus `prefetch` pages after it, clipped to total."""
+        if not self.total:
+            return []
+        last_page = (max(first, last - 1)) // self.page_size + prefetch
+        max_page = (self.total - 1) // self.page_size
+        self.view_page = first // self.page_size
+        return list(range(first // self.page_size, min(last_page, max_page) + 1))
+
+    def ensure(self, first, last, prefetch=1):
+        """Request the pages under [first, last) and `prefetch` pages beyond it that are not held."""
+        for page_no in self.pages_for(first, last, prefetch):
+            if page_no not in self.pages and page_no not in self.pending:
+                self.pending.add(page_no)
+                self.fetch_page(page_no)
+
+    def store(self, page_no, entries):
+        self.pending.discard(page_no)
+        self.pages[page_no] = entries
+        while len(self.pages) > self.max_pages:
+            farthest = max(self.pages, key=lambda p: abs(p - self.view_page))
+            if farthest == page_no:
+                break
+            del self.pages[farthest]
+
 
 class LabelEditorWindow(ctk.CTkToplevel):
     def __init__(self, parent_gui):
@@ -84,8 +1279,22 @@ class LabelEditorWindow(ctk.CTkToplevel):
         self._y = None
 
         self.initial_labels_for_existing_task = set()
-        self.current_selection_vars = {}
         self.project_available_labels = []
+        self.label_names = []
+        self._known_labels = set()
+        self.label_index = PrefixIndex()
+        self.selected_label_names = set()
+        self.new_label_names = set()
+        self._preselected_labels = set()
+        self._empty_text = "loading labels..."
+        self._filter_cache = ("", [], -1)
+        self._labels_version = 0
+        self._scan_job = None
+        self._scan_done = False
+        self._typeahead_after_id = None
+        self._typeahead_job = None
+        self._queried_prefixes = set()
+        self._empty_prefixes = set()
 
         if not self.parent_gui.selected_project_key and not self.parent_gui.current_jira_issue_key:
             if self.parent_gui.root and self.parent_gui.root.winfo_exists():
@@ -99,13 +1308,13 @@ class LabelEditorWindow(ctk.CTkToplevel):
             self.title(f"LABELS::{self.parent_gui.current_jira_issue_key}")
         else:
             self.title(f"LABELS::NEW_TASK::{self.parent_gui.selected_project_key}")
-        self.geometry("400x450")
+        self.geometry("400x500")
 
         try:
             if self.parent_gui.root and self.parent_gui.root.winfo_exists():
                 main_x, main_y = self.parent_gui.root.winfo_x(), self.parent_gui.root.winfo_y()
                 main_w, main_h = self.parent_gui.root.winfo_width(), self.parent_gui.root.winfo_height()
-                win_w, win_h = 400, 450
+                win_w, win_h = 400, 500
                 self.geometry(
                     f"{win_w}x{win_h}+{main_x + (main_w // 2) - (win_w // 2)}+{main_y + (main_h // 2) - (win_h // 2)}")
         except Exception as e:
@@ -119,15 +1328,38 @@ class LabelEditorWindow(ctk.CTkToplevel):
                                        text_color=TEXT_COLOR_NORMAL)
         self.info_label.pack(pady=(10, 5), padx=10)
 
-        self.labels_scroll_frame = ctk.CTkScrollableFrame(
-            self, height=250,
-            fg_color=WIDGET_BACKGROUND,
-            label_text_color=TEXT_COLOR_NORMAL, label_font=FONT_MONO_SMALL,
-            scrollbar_button_color=BORDER_COLOR, scrollbar_button_hover_color=TERMINAL_GREEN_BRIGHT,
-            corner_radius=10, border_width=0
+        self.status_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.status_frame.pack(fill='x', padx=10)
+        self.progress_label = ctk.CTkLabel(self.status_frame, text="", font=FONT_MONO_SMALL,
+                                           text_color=TEXT_COLOR_DIM)
+        self.progress_label.pack(side='left')
+        self.exhaustive_var = ctk.StringVar(
+            value="on" if self.parent_gui.label_editor_mode == "exhaustive" else "off")
+        self.exhaustive_switch = ctk.CTkSwitch(
+            self.status_frame, text="FULL SCAN", font=FONT_MONO_SMALL, variable=self.exhaustive_var,
+            onvalue="on", offvalue="off", command=self._on_exhaustive_toggled,
+            progress_color=TERMINAL_GREEN, text_color=TEXT_COLOR_DIM, switch_width=30, switch_height=14
+        )
+        self.exhaustive_switch.pack(side='right')
+        self.progress_bar = ctk.CTkProgressBar(self, height=4, corner_radius=2, progress_color=TERMINAL_GREEN,
+                                               fg_color=WIDGET_BACKGROUND)
+        self.progress_bar.set(0)
+        self.progress_bar.pack(fill='x', padx=10, pady=(0, 5))
+
+        self.filter_entry = ctk.CTkEntry(
+            self, placeholder_text="filter labels >", font=FONT_MONO_SMALL, corner_radius=8, height=26,
+            fg_color=WIDGET_BACKGROUND, text_color=TEXT_COLOR_NORMAL,
+            placeholder_text_color=TEXT_COLOR_DIM, border_width=1, border_color=BORDER_COLOR
         )
-        self.labels_scroll_frame.pack(fill='x', padx=10, pady=(0, 5))
-        self.labels_scroll_frame.grid_columnconfigure(0, weight=1)
+        self.filter_entry.pack(fill='x', padx=10, pady=(0, 5))
+        self.filter_entry.bind("<KeyRelease>", self._on_filter_typed)
+
+        self.labels_list = VirtualList(
+            self, row_height=LABEL_ROW_HEIGHT, create_row=self._create_label_row, bind_row=self._bind_label_row,
+            height=250, corner_radius=10
+        )
+        self.labels_list.message_label.configure(wraplength=340)
+        self.labels_list.pack(fill='both', expand=True, padx=10, pady=(0, 5))
 
         self.add_label_frame = ctk.CTkFrame(self, fg_color="transparent")
         self.add_label_frame.pack(fill='x', padx=10, pady=(5, 10))
@@ -140,6 +1372,7 @@ class LabelEditorWindow(ctk.CTkToplevel):
         )
         self.new_label_entry.pack(side='left', fill='x', expand=True, padx=(0, 5))
         self.new_label_entry.bind("<Return>", self._add_new_label_from_entry)
+        self.new_label_entry.bind("<KeyRelease>", self._on_label_entry_typed)
 
         self.add_label_button = ctk.CTkButton(
             self.add_label_frame, text="ADD", font=FONT_MONO_BOLD,
@@ -181,124 +1414,271 @@ class LabelEditorWindow(ctk.CTkToplevel):
         self._load_data_and_populate()
 
     def _load_data_and_populate(self):
-        loading_label = ctk.CTkLabel(self.labels_scroll_frame, text="loading labels...", font=FONT_MONO_SMALL,
-                                     text_color=TEXT_COLOR_NORMAL)
-        loading_label.pack(pady=10)
-        try:
-            self.update_idletasks()
-        except Exception:
-            pass
-
-        try:
-            project_labels = self._fetch_project_labels()
-            self.project_available_labels = project_labels
+        self.labels_list.show_message(self._empty_text, TEXT_COLOR_NORMAL)
+        span = self.parent_gui.perf.span('action', '_load_data_and_populate')
+        if self.exhaustive_var.get() == "on":
+            self._scan_job = self.parent_gui._run_in_background(
+                self._fetch_label_data, True, on_done=span.then(self._on_label_scan_finished),
+                on_error=span.then(self._show_load_error), owner=self)
+        else:
+            self.parent_gui._run_in_background(
+                self._fetch_label_data, False,
+                on_done=span.then(lambda labels: self._on_suggestions_loaded("", labels)),
+                on_error=span.then(self._show_load_error), owner=self)
 
-            task_labels = set()
-            if self.parent_gui.current_jira_issue_key:
-                task_labels = self._fetch_current_task_labels()
-                self.initial_labels_for_existing_task = task_labels.copy()
+    def _fetch_label_data(self, exhaustive):
+        """Runs on a worker thread - must not touch widgets. Partial results are posted to the Tk thread."""
+        task_labels = set()
+        if self.parent_gui.current_jira_issue_key:
+            task_labels = self._fetch_current_task_labels()
+        self.parent_gui._call_on_ui(self._show_initial_labels, task_labels)
+        if not exhaustive:
+            return self._fetch_label_suggestions("")
+        return self._fetch_project_labels(on_progress=self._post_label_page)
+
+    def _post_label_page(self, new_labels, pages_done, pages_total):
+        self.parent_gui._call_on_ui(self._on_label_page_loaded, new_labels, pages_done, pages_total)
+
+    def _on_exhaustive_toggled(self):
+        if self.exhaustive_var.get() == "on":
+            if self._scan_done or (self._scan_job and not self._scan_job.done()):
+                return
+            self.progress_label.configure(text="scanning project labels...", text_color=TEXT_COLOR_DIM)
+            self.progress_bar.set(0)
+            self._scan_job = self.parent_gui._run_in_background(
+                self._fetch_project_labels, on_progress=self._post_label_page,
+                on_done=self._on_label_scan_finished, on_error=self._show_load_error, owner=self)
+        elif self._scan_job and not self._scan_job.done():
+            self._scan_job.cancel()
+            self._scan_job = None
+            self.progress_label.configure(text=f"scan stopped - {len(self.label_names)} labels")
+
+    def _fetch_label_suggestions(self, prefix):
+        """Ask Jira's JQL autocomplete for label values starting with prefix (worker thread).
+
+        Returns None when the request failed, so a network blip is not mistaken for "no such labels".
+        """
+        endpoint = f"jql/autocompletedata/suggestions?fieldName=labels&fieldValue={urllib.parse.quote(prefix)}"
+        result = self.parent_gui._make_jira_request("GET", endpoint)
+        if result and result['success'] and 'data' in result:
+            return [r['value'] for r in result['data'].get('results', []) if r.get('value')]
+        print(f"[Editor] Label suggestions for '{prefix}' failed: {(result or {}).get('error', 'no data?')}")
+        return None
 
-            combined_labels = set(project_labels)
-            if self.parent_gui.current_jira_issue_key:
-                combined_labels.update(task_labels)
-            else:
-                combined_labels.update(self.parent_gui.selected_labels)
-            sorted_labels_to_display = sorted(list(combined_labels))
+    def _on_label_entry_typed(self, event=None):
+        if event is not None and event.keysym in ("Return", "KP_Enter"):
+            return
+        self._schedule_typeahead(self.new_label_entry.get().strip())
 
-            if loading_label and loading_label.winfo_exists(): loading_label.destroy()
+    def _on_filter_typed(self, event=None):
+        self._apply_filter()
+        self._schedule_typeahead(self.filter_entry.get().strip())
 
-            for widget in self.labels_scroll_frame.winfo_children():
-                if isinstance(widget, (ctk.CTkLabel, ctk.CTkCheckBox)):
-                    if widget.winfo_exists(): widget.destroy()
-            self.current_selection_vars = {}
+    def _schedule_typeahead(self, prefix):
+        if self._typeahead_after_id is not None:
+            self.after_cancel(self._typeahead_after_id)
+        self._typeahead_after_id = self.after(LABEL_TYPEAHEAD_DEBOUNCE_MS, lambda: self._run_typeahead(prefix))
 
-            if not sorted_labels_to_display:
-                ctk.CTkLabel(self.labels_scroll_frame, text="// no labels found", font=FONT_MONO_SMALL,
-                             text_color=TEXT_COLOR_DIM).pack(pady=5)
+    def _run_typeahead(self, prefix):
+        self._typeahead_after_id = None
+        if not self.winfo_exists(): return
+        if not prefix:
+            return
+        # labels already seen answer at once from the local prefix index; the server query only adds to them
+        local_matches = self.label_index.search(prefix)
+        if local_matches:
+            self._scroll_to_label(local_matches[0])
+            self.progress_label.configure(text=f"{len(local_matches)} known label(s) start with '{prefix}'",
+                                          text_color=TEXT_COLOR_DIM)
+
+        if self._scan_done or prefix in self._queried_prefixes:
+            return
+        if any(prefix.lower().startswith(p) for p in self._empty_prefixes):
+            return
+        if self._typeahead_job is not None and not self._typeahead_job.done():
+            self._typeahead_job.cancel()
+        self.progress_label.configure(text=f"searching '{prefix}'...", text_color=TEXT_COLOR_DIM)
+        self._typeahead_job = self.parent_gui._run_in_background(
+            self._fetch_label_suggestions, prefix, owner=self,
+            on_done=lambda labels, p=prefix: self._on_suggestions_loaded(p, labels))
+
+    def _on_suggestions_loaded(self, prefix, labels):
+        # only answered queries are remembered; cancelled or failed ones are asked again next time
+        if labels is None:
+            labels = []
+            if prefix:
+                self.progress_label.configure(text=f"label search for '{prefix}' failed - keep typing to retry",
+                                              text_color=ERROR_RED)
+                return
+        else:
+            self._queried_prefixes.add(prefix)
+            if prefix and not labels:
+                self._empty_prefixes.add(prefix.lower())
+        self._empty_text = "// no labels found"
+        self._merge_labels(labels)
+        if self._scan_job is None or self._scan_job.done():
+            hint = f"{len(labels)} match(es) for '{prefix}'" if prefix else "type to search labels"
+            self.progress_label.configure(text=f"{hint} ({len(self.label_names)} known)",
+                                          text_color=TEXT_COLOR_DIM)
+            self.progress_bar.set(1)
+
+    def _show_initial_labels(self, task_labels):
+        if not self.winfo_exists(): return
+        if self.parent_gui.current_jira_issue_key:
+            self.initial_labels_for_existing_task = task_labels.copy()
+            self._preselected_labels = set(task_labels)
+        else:
+            self._preselected_labels = set(self.parent_gui.selected_labels)
+        self._merge_labels(self._preselected_labels)
+        scanning = self._scan_job is not None and not self._scan_job.done()
+        self.progress_label.configure(text="scanning project labels..." if scanning else "loading suggestions...")
+
+    def _on_label_page_loaded(self, new_labels, pages_done, pages_total):
+        if not self.winfo_exists(): return
+        self._merge_labels(new_labels)
+        self.progress_label.configure(text=f"scanning project labels: page {pages_done}/{pages_total}")
+        self.progress_bar.set(pages_done / pages_total if pages_total else 1)
+
+    def _on_label_scan_finished(self, project_labels):
+        self._scan_done = True
+        self.project_available_labels = project_labels
+        self._empty_text = "// no labels found"
+        self._merge_labels(project_labels)
+        self.progress_bar.set(1)
+        self.progress_label.configure(text=f"{len(self.label_names)} labels")
+
+    def _merge_labels(self, label_names):
+        """Add labels not known yet; selection of existing labels is untouched."""
+        added = False
+        for label_name in set(label_names).difference(self._known_labels):
+            self._known_labels.add(label_name)
+            self.label_index.add(label_name)
+            bisect.insort(self.label_names, label_name)
+            if label_name in self._preselected_labels:
+                self.selected_label_names.add(label_name)
+            added = True
+        if added:
+            self._labels_version += 1
+        self._apply_filter()
+
+    def _apply_filter(self):
+        text = self.filter_entry.get().strip().lower() if self.filter_entry.winfo_exists() else ""
+        previous_text, previous_items, version = self._filter_cache
+        if not text:
+            items = self.label_names
+        else:
+            # prefix matches come from the index and are listed first; substring matches follow
+            prefix_matches = self.label_index.search(text)
+            if version == self._labels_version and previous_text and text.startswith(previous_text):
+                # narrowing the same list: only re-check what matched before
+                candidates = previous_items
             else:
-                for label_name in sorted_labels_to_display:
-                    var = ctk.StringVar(value="off")
-                    is_selected = False
-
-                    if self.parent_gui.current_jira_issue_key:
-                        if label_name in task_labels:
-                            var.set("on")
-                            is_selected = True
-                    else:
-                        if label_name in self.parent_gui.selected_labels:
-                            var.set("on")
-                            is_selected = True
-
-                    cb = ctk.CTkCheckBox(
-                        self.labels_scroll_frame, text=label_name, variable=var,
-                        onvalue="on", offvalue="off",
-                        font=FONT_MONO_NORMAL,
-                        text_color=TEXT_COLOR_NORMAL if is_selected else TEXT_COLOR_DIM,
-                        fg_color=TERMINAL_GREEN if is_selected else WIDGET_BACKGROUND,
-                        hover_color=TERMINAL_GREEN_BRIGHT,
-                        checkmark_color=BACKGROUND_COLOR,
-                        corner_radius=0, border_width=1, border_color=BORDER_COLOR
-                    )
-                    cb.configure(command=lambda v=var, c=cb: c.configure(
-                        text_color=TEXT_COLOR_NORMAL if v.get() == "on" else TEXT_COLOR_DIM,
-                        fg_color=TERMINAL_GREEN if v.get() == "on" else WIDGET_BACKGROUND
-                    )
-                                 )
-                    cb.pack(anchor='w', padx=5, pady=1, fill='x')
-                    self.current_selection_vars[label_name] = var
+                candidates = self.label_names
+            starts = set(prefix_matches)
+            items = prefix_matches + [name for name in candidates if name not in starts and text in name.lower()]
+        self._filter_cache = (text, items, self._labels_version)
+
+        if items:
+            self.labels_list.set_items(items, keep_position=True)
+        elif text and self.label_names:
+            self.labels_list.show_message("// no labels match filter")
+        else:
+            self.labels_list.show_message(self._empty_text)
 
-        except Exception as e:
-            print(f"[Editor] ERROR loading/populating labels: {e}")
-            traceback.print_exc()
-            if loading_label and loading_label.winfo_exists(): loading_label.destroy()
-            try:
-                for widget in self.labels_scroll_frame.winfo_children():
-                    if isinstance(widget, (ctk.CTkLabel, ctk.CTkCheckBox)):
-                        if widget.winfo_exists(): widget.destroy()
-                ctk.CTkLabel(self.labels_scroll_frame, text=f"!! LOAD ERROR !!\n{e}", font=FONT_MONO_SMALL,
-                             text_color=ERROR_RED, wraplength=350).pack(pady=10)
-            except Exception as e_disp:
-                print(f"Cannot display error in label editor window: {e_disp}")
-
-    def _fetch_project_labels(self):
-        if not self.parent_gui.selected_project_key: return []
-        print(f"[Editor] Fetching labels for project {self.parent_gui.selected_project_key}...")
-        jql = f'project = "{self.parent_gui.selected_project_key}" ORDER BY updated DESC'
+    def _create_label_row(self, parent):
+        row = ctk.CTkCheckBox(
+            parent, text="", font=FONT_MONO_NORMAL, height=LABEL_ROW_HEIGHT - 1,
+            hover_color=TERMINAL_GREEN_BRIGHT, checkmark_color=BACKGROUND_COLOR,
+            corner_radius=0, border_width=1, border_color=BORDER_COLOR
+        )
+        row.label_name = None
+        row.configure(command=lambda r=row: self._toggle_label(r))
+        return row
+
+    def _bind_label_row(self, row, label_name, index):
+        row.label_name = label_name
+        is_selected = label_name in self.selected_label_names
+        if is_selected:
+            row.select()
+        else:
+            row.deselect()
+        is_new = label_name in self.new_label_names
+        row.configure(
+            text=label_name,
+            text_color=LABEL_NEW_FG if is_new else (TEXT_COLOR_NORMAL if is_selected else TEXT_COLOR_DIM),
+            fg_color=TERMINAL_GREEN if is_selected else WIDGET_BACKGROUND,
+            border_color=LABEL_NEW_FG if is_new else BORDER_COLOR
+        )
+
+    def _toggle_label(self, row):
+        label_name = row.label_name
+        if label_name is None: return
+        if label_name in self.selected_label_names:
+            self.selected_label_names.discard(label_name)
+        else:
+            self.selected_label_names.add(label_name)
+        self._bind_label_row(row, label_name, 0)
+
+    def _show_load_error(self, e):
+        print(f"[Editor] ERROR loading/populating labels: {e}")
+        if self.label_names:
+            # keep the labels that already arrived usable; just flag the incomplete scan
+            self.progress_label.configure(text=f"!! label scan incomplete: {e}", text_color=ERROR_RED)
+            return
+        self.labels_list.show_message(f"!! LOAD ERROR !!\n{e}", ERROR_RED)
+
+    def _fetch_project_labels(self, on_progress=None):
+        """Scan the project's issues for labels. on_progress(new_labels, pages_done, pages_total) is
+        called from the worker thread after every page."""
+        project_key = self.parent_gui.selected_project_key
+        if not project_key: return []
+        print(f"[Editor] Fetching labels for project {project_key}...")
+        jql = f'project = "{project_key}" ORDER BY updated DESC'
         fields = "labels"
         max_results_per_page = 200
-        start_at = 0
-        all_labels_list = []
-        total_fetched = 0
+        label_counts = Counter()
 
-        while True:
-            endpoint = f"search?jql={requests.utils.quote(jql)}&fields={fields}&maxResults={max_results_per_page}&startAt={start_at}"
-            result = self.parent_gui._make_jira_request("GET", endpoint)
+        def fetch_page(start_at):
+            endpoint = f"search?jql={urllib.parse.quote(jql)}&fields={fields}&maxResults={max_results_per_page}&startAt={start_at}"
+            return start_at, self.parent_gui._make_jira_request("GET", endpoint)
 
+        def count_page(start_at, result):
             if result and result['success'] and 'data' in result and 'issues' in result['data']:
                 issues = result['data']['issues']
-                if not issues: break
-
-                batch_labels = [label for issue in issues if issue.get('fields', {}).get('labels')
-                                for label in issue.get('fields', {}).get('labels', [])]
-                all_labels_list.extend(batch_labels)
-
-                total_fetched += len(issues)
-                start_at += max_results_per_page
-
-                if total_fetched >= result['data'].get('total', 0) or len(issues) < max_results_per_page:
-                    break
-            else:
-                print(
-                    f"[Editor] Failed fetching labels chunk for project {self.parent_gui.selected_project_key} at startAt={start_at}. Reason: {result.get('error', 'no data?')}")
-                break
+                page_labels = [label for issue in issues for label in issue.get('fields', {}).get('labels') or []]
+                new_labels = set(page_labels).difference(label_counts)
+                label_counts.update(page_labels)
+                return issues, new_labels
+            print(
+                f"[Editor] Failed fetching labels chunk for project {project_key} at startAt={start_at}. Reason: {(result or {}).get('error', 'no data?')}")
+            return None, set()
+
+        _, first_result = fetch_page(0)
+        first_issues, first_labels = count_page(0, first_result)
+        total_fetched = len(first_issues or [])
+        if first_issues:
+            total = first_result['data'].get('total', 0)
+            # the server may cap maxResults below what we asked for; step by what it actually used
+            page_size = first_result['data'].get('maxResults') or len(first_issues)
+            remaining_offsets = list(range(page_size, total, page_size))
+            pages_total = 1 + len(remaining_offsets)
+            if on_progress: on_progress(first_labels, 1, pages_total)
+            if remaining_offsets:
+                print(f"[Editor] Fetching {len(remaining_offsets)} more label pages "
+                      f"({self.parent_gui.label_scan_concurrency} in parallel)...")
+            for pages_done, (start_at, result) in enumerate(
+                    self.parent_gui._fan_out(fetch_page, remaining_offsets, self.parent_gui.label_scan_concurrency),
+                    start=2):
+                issues, new_labels = count_page(start_at, result)
+                total_fetched += len(issues or [])
+                if on_progress: on_progress(new_labels, pages_done, pages_total)
 
         project_labels = []
-        if all_labels_list:
-            label_counts = Counter(all_labels_list)
+        if label_counts:
             project_labels = sorted(label_counts.keys(), key=lambda x: (-label_counts[x], x))
             print(f"[Editor] Found {len(project_labels)} unique project labels from {total_fetched} issues checked.")
         else:
-            print(f"[Editor] No labels found across checked issues for project {self.parent_gui.selected_project_key}.")
+            print(f"[Editor] No labels found across checked issues for project {project_key}.")
 
         return project_labels
 
@@ -318,8 +1698,7 @@ class LabelEditorWindow(ctk.CTkToplevel):
             print(f"[Editor] Failed to fetch labels for task {self.parent_gui.current_jira_issue_key}.")
             error_msg = f"Cannot fetch labels for {self.parent_gui.current_jira_issue_key}."
             if result and not result['success']: error_msg += f"\nAPI Error: {result.get('error', 'None')[:100]}..."
-            if self.winfo_exists():
-                messagebox.showerror("Label Fetch Error", error_msg, parent=self)
+            self.parent_gui._show_message("showerror", "Label Fetch Error", error_msg, parent=self)
         return task_labels
 
     def _add_new_label_from_entry(self, event=None):
@@ -330,60 +1709,34 @@ class LabelEditorWindow(ctk.CTkToplevel):
             messagebox.showwarning("Invalid Label", f"Label '{new_label}' contains spaces.", parent=self)
             return
 
-        if new_label in self.current_selection_vars:
+        if new_label in self._known_labels:
             print(f"[Editor] Label '{new_label}' already exists. Selecting...")
-            if self.current_selection_vars[new_label]:
-                try:
-                    self.current_selection_vars[new_label].set("on")
-                    for child in self.labels_scroll_frame.winfo_children():
-                        if isinstance(child, ctk.CTkCheckBox) and child.cget("text") == new_label:
-                            child.select()
-                            child.configure(text_color=TEXT_COLOR_NORMAL, fg_color=TERMINAL_GREEN)
-                            break
-                except Exception as e_set:
-                    print(f"Cannot set variable/update checkbox for {new_label}: {e_set}")
-            if self.new_label_entry.winfo_exists(): self.new_label_entry.delete(0, "end")
-            return
-
-        print(f"[Editor] Adding new UI label: {new_label}")
-        var = ctk.StringVar(value="on")
-        cb = ctk.CTkCheckBox(
-            self.labels_scroll_frame, text=new_label, variable=var,
-            onvalue="on", offvalue="off",
-            font=FONT_MONO_NORMAL,
-            text_color=LABEL_NEW_FG,
-            fg_color=TERMINAL_GREEN,
-            hover_color=TERMINAL_GREEN_BRIGHT,
-            checkmark_color=BACKGROUND_COLOR,
-            corner_radius=0, border_width=1,
-            border_color=LABEL_NEW_FG,
-        )
-        cb.configure(command=lambda v=var, c=cb: c.configure(
-            text_color=TEXT_COLOR_NORMAL if v.get() == "on" else TEXT_COLOR_DIM,
-            fg_color=TERMINAL_GREEN if v.get() == "on" else WIDGET_BACKGROUND,
-            border_color=BORDER_COLOR
-        )
-                     )
-
-        try:
-            cb.pack(anchor='w', padx=5, pady=1, fill='x')
-            self.current_selection_vars[new_label] = var
-            if self.new_label_entry.winfo_exists(): self.new_label_entry.delete(0, "end")
-        except Exception as e_pack:
-            print(f"Error adding new checkbox UI for '{new_label}': {e_pack}")
-            traceback.print_exc()
-            if cb and cb.winfo_exists(): cb.destroy()
+            self.selected_label_names.add(new_label)
+        else:
+            print(f"[Editor] Adding new UI label: {new_label}")
+            self.new_label_names.add(new_label)
+            self._known_labels.add(new_label)
+            self.label_index.add(new_label)
+            self.selected_label_names.add(new_label)
+            bisect.insort(self.label_names, new_label)
+            self._labels_version += 1
+
+        if self.new_label_entry.winfo_exists(): self.new_label_entry.delete(0, "end")
+        self._apply_filter()
+        self._scroll_to_label(new_label)
+
+    def _scroll_to_label(self, label_name):
+        items = self.labels_list.items
+        if items is self.label_names:
+            position = bisect.bisect_left(items, label_name)
+            if position < len(items) and items[position] == label_name:
+                self.labels_list.scroll_to(position)
+        elif label_name in items:
+            # filtered lists put prefix matches first, so they are not sorted
+            self.labels_list.scroll_to(items.index(label_name))
 
     def _get_selected_labels_from_ui(self):
-        selected = set()
-        for label_name, var in self.current_selection_vars.items():
-            if var:
-                try:
-                    if var.get() == "on":
-                        selected.add(label_name)
-                except Exception as e_get:
-                    print(f"Error reading var for label '{label_name}': {e_get}")
-        return selected
+        return set(self.selected_label_names)
 
     def _update_jira_labels(self):
         if not self.parent_gui.current_jira_issue_key:
@@ -396,37 +1749,13 @@ class LabelEditorWindow(ctk.CTkToplevel):
 
         if current_selection == self.initial_labels_for_existing_task:
             print("[Editor] No changes detected in labels. Update request not sent.")
-            if self.winfo_exists():
-                messagebox.showinfo("Info", "No changes detected in labels.", parent=self)
-                self.destroy()
+            if self.winfo_exists(): self.destroy()
             return
 
         valid_labels_list = sorted([lbl for lbl in current_selection if lbl and not re.search(r"\s", lbl)])
-
-        update_data = {"fields": {"labels": valid_labels_list}}
-        print(f"[Editor] Sending label update data: {json.dumps(update_data)}")
-        endpoint = f"issue/{self.parent_gui.current_jira_issue_key}"
-        result = self.parent_gui._make_jira_request("PUT", endpoint, data=json.dumps(update_data))
-
-        if result and result['success'] and result.get('status_code') in [200, 204]:
-            print(f"[Editor] Successfully updated labels for {self.parent_gui.current_jira_issue_key}.")
-            if self.winfo_exists():
-                messagebox.showinfo("Success", f"Labels for task {self.parent_gui.current_jira_issue_key} updated.",
-                                    parent=self)
-                self.destroy()
-        else:
-            print(f"[Editor] Failed to update labels for {self.parent_gui.current_jira_issue_key}.")
-            error_msg = f"Failed to update labels for {self.parent_gui.current_jira_issue_key}."
-            if result and result.get('error'):
-                error_msg += f"\nAPI Error: {result['error']}"
-            elif result and 'data' in result:
-                api_errors = result['data'].get('errorMessages', []);
-                api_details = result['data'].get('errors', {})
-                if api_errors: error_msg += "\n" + "\n".join(api_errors)
-                if api_details: error_msg += "\nDetails: " + ", ".join([f"{k}: {v}" for k, v in api_details.items()])
-            elif result and result.get('raw_response'):
-                error_msg += f"\nServer Response ({result.get('status_code')}): {result['raw_response'][:200]}..."
-            if self.winfo_exists(): messagebox.showerror("Label Update Error", error_msg, parent=self)
+        self.parent_gui.write_labels(self.parent_gui.current_jira_issue_key, self.initial_labels_for_existing_task,
+                                     valid_labels_list)
+        if self.winfo_exists(): self.destroy()
 
     def _save_labels_for_new_task_and_close(self):
         try:
@@ -511,7 +1840,7 @@ class CreateTaskDialog(ctk.CTkToplevel):
         self.issue_types = issue_types or []
 
         self.title(f"NEW TASK::{project_key}")
-        self.geometry("400x250")
+        self.geometry("400x290")
         self.configure(fg_color=BACKGROUND_COLOR)
 
         self.transient(parent_window)
@@ -522,7 +1851,7 @@ class CreateTaskDialog(ctk.CTkToplevel):
         try:
             parent_x, parent_y = parent_window.winfo_x(), parent_window.winfo_y()
             parent_w, parent_h = parent_window.winfo_width(), parent_window.winfo_height()
-            win_w, win_h = 400, 250
+            win_w, win_h = 400, 290
             self.geometry(
                 f"{win_w}x{win_h}+{parent_x + (parent_w // 2) - (win_w // 2)}+{parent_y + (parent_h // 2) - (win_h // 2)}")
         except Exception as e:
@@ -554,17 +1883,40 @@ class CreateTaskDialog(ctk.CTkToplevel):
             self.type_combobox.set("NO TYPES FOUND")
             self.type_combobox.configure(state='disabled')
 
-        self.summary_label = ctk.CTkLabel(self.main_frame, text="Summary:", anchor='w', font=FONT_MONO_NORMAL,
+        self.labels_entry = ctk.CTkEntry(
+            self.main_frame, font=FONT_MONO_NORMAL, corner_radius=0,
+            fg_color=WIDGET_BACKGROUND, text_color=TEXT_COLOR_NORMAL,
+            placeholder_text_color=TEXT_COLOR_DIM, border_width=1, border_color=BORDER_COLOR,
+            placeholder_text="labels (optional, space separated) >"
+        )
+        self.labels_entry.pack(fill='x', pady=(5, 0))
+
+        summary_header = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+        summary_header.pack(fill='x', pady=(10, 2))
+        self.summary_label = ctk.CTkLabel(summary_header, text="Summary:", anchor='w', font=FONT_MONO_NORMAL,
                                           text_color=TEXT_COLOR_NORMAL)
-        self.summary_label.pack(fill='x', pady=(10, 2))
+        self.summary_label.pack(side='left')
+        self.bulk_var = ctk.BooleanVar(value=False)
+        self.bulk_switch = ctk.CTkSwitch(summary_header, text="BULK", font=FONT_MONO_SMALL, variable=self.bulk_var,
+                                         command=self._toggle_bulk_mode, progress_color=TERMINAL_GREEN,
+                                         text_color=TEXT_COLOR_DIM)
+        self.bulk_switch.pack(side='right')
+
+        self.summary_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+        self.summary_frame.pack(fill='both', expand=True)
         self.summary_entry = ctk.CTkEntry(
-            self.main_frame, font=FONT_MONO_NORMAL, corner_radius=0,
+            self.summary_frame, font=FONT_MONO_NORMAL, corner_radius=0,
             fg_color=WIDGET_BACKGROUND, text_color=TEXT_COLOR_NORMAL,
             placeholder_text_color=TEXT_COLOR_DIM, border_width=1, border_color=BORDER_COLOR,
             placeholder_text="enter task summary >"
         )
         self.summary_entry.pack(fill='x')
         self.summary_entry.bind("<Return>", self._on_create)
+        # bulk mode: one summary per line, created through issue/bulk
+        self.summaries_text = ctk.CTkTextbox(
+            self.summary_frame, font=FONT_MONO_NORMAL, corner_radius=0, height=160,
+            fg_color=WIDGET_BACKGROUND, text_color=TEXT_COLOR_NORMAL, border_width=1, border_color=BORDER_COLOR
+        )
 
         self.button_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
         self.button_frame.pack(pady=(15, 0), fill='x')
@@ -590,13 +1942,33 @@ class CreateTaskDialog(ctk.CTkToplevel):
 
         self.summary_entry.focus_set()
 
+    def _toggle_bulk_mode(self):
+        if self.bulk_var.get():
+            self.summary_entry.pack_forget()
+            self.summaries_text.pack(fill='both', expand=True)
+            self.summary_label.configure(text="Summaries (one per line):")
+            self.geometry("500x460")
+            self.summaries_text.focus_set()
+        else:
+            self.summaries_text.pack_forget()
+            self.summary_entry.pack(fill='x')
+            self.summary_label.configure(text="Summary:")
+            self.geometry("400x290")
+            self.summary_entry.focus_set()
+
+    def _get_labels(self):
+        return [lbl for lbl in re.split(r"[\s,]+", self.labels_entry.get()) if lbl]
+
     def _on_create(self, event=None):
-        summary = self.summary_entry.get().strip()
         issue_type = self.type_combobox.get()
 
         if not issue_type or issue_type == "NO TYPES FOUND":
             messagebox.showerror("Error", "No valid issue type selected.", parent=self)
             return
+        if self.bulk_var.get():
+            self._on_bulk_create(issue_type)
+            return
+        summary = self.summary_entry.get().strip()
         if not summary:
             messagebox.showwarning("Input Error", "Task summary cannot be empty.", parent=self)
             self.summary_entry.focus_set()
@@ -605,7 +1977,47 @@ class CreateTaskDialog(ctk.CTkToplevel):
         print(
             f"Attempting creation from dialog: Summary='{summary}', Type='{issue_type}', Project='{self.project_key}'")
 
-        new_issue_key = self.parent_gui.create_jira_issue(summary, issue_type, labels_list=None)
+        self.create_button.configure(state='disabled', text="CREATING...")
+        self.parent_gui._run_in_background(self.parent_gui.create_jira_issue, summary, issue_type,
+                                           labels_list=self._get_labels(), on_done=self._on_created,
+                                           on_error=self._on_create_failed, owner=self)
+
+    def _on_bulk_create(self, issue_type):
+        summaries = [line.strip() for line in self.summaries_text.get("1.0", "end").splitlines() if line.strip()]
+        if not summaries:
+            messagebox.showwarning("Input Error", "Enter at least one summary, one per line.", parent=self)
+            self.summaries_text.focus_set()
+            return
+        print(f"Bulk creating {len(summaries)} issue(s) in {self.project_key}: Type='{issue_type}'")
+        self.create_button.configure(state='disabled', text=f"CREATING {len(summaries)}...")
+        self.parent_gui._run_in_background(self.parent_gui.create_jira_issues_bulk, self.project_key, summaries,
+                                           issue_type, labels_list=self._get_labels(), owner=self,
+                                           on_done=self._on_bulk_created, on_error=self._on_create_failed)
+
+    def _on_bulk_created(self, outcomes):
+        if self.create_button.winfo_exists():
+            self.create_button.configure(state='normal', text="CREATE")
+        created = [(summary, key) for summary, key, _error in outcomes if key]
+        failed = [(summary, error) for summary, key, error in outcomes if not key]
+        print(f"Bulk create: {len(created)} created, {len(failed)} failed.")
+        if created:
+            self.parent_gui._notify(f"Created {len(created)} task(s) in {self.project_key}"
+                                    f"{f', {len(failed)} failed' if failed else ''}.",
+                                    "error" if failed else "info")
+        if not failed:
+            self.destroy()
+            self.parent_gui.refresh_task_list_window(self.parent_task_list_window)
+            return
+        # leave only the failed lines, so CREATE retries exactly those
+        self.summaries_text.delete("1.0", "end")
+        self.summaries_text.insert("1.0", "\n".join(summary for summary, _error in failed))
+        lines = [f"{key:<12} {summary}" for summary, key in created]
+        lines += [f"{'!! FAILED':<12} {summary}\n{'':<12} {error}" for summary, error in failed]
+        self.parent_gui._show_bulk_report(self, "create tasks", lines)
+
+    def _on_created(self, new_issue_key):
+        if self.create_button.winfo_exists():
+            self.create_button.configure(state='normal', text="CREATE")
 
         if new_issue_key:
             print(f"Task {new_issue_key} created successfully via dialog.")
@@ -616,9 +2028,177 @@ class CreateTaskDialog(ctk.CTkToplevel):
             print("Task creation failed via dialog.")
             self.summary_entry.focus_set()
 
+    def _on_create_failed(self, error):
+        if self.create_button.winfo_exists():
+            self.create_button.configure(state='normal', text="CREATE")
+        print(f"Task creation raised via dialog: {error}")
+        messagebox.showerror("Create Failed", f"Could not create task:\n{error}", parent=self)
+
+
+class PerfPanel(ctk.CTkToplevel):
+    """Live p50/p95 per endpoint class and user action, refreshed while open, with JSON/CSV export."""
+
+    def __init__(self, parent_gui):
+        super().__init__(parent_gui.root)
+        self.parent_gui = parent_gui
+        self.title("PERF")
+        self.configure(fg_color=BACKGROUND_COLOR)
+        self.geometry("720x380")
+        self.attributes('-alpha', 0.97)
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
+        self.bind("<Escape>", lambda e: self.destroy())
+
+        self.table = ctk.CTkTextbox(self, font=FONT_MONO_SMALL, fg_color=WIDGET_BACKGROUND,
+                                    text_color=TEXT_COLOR_NORMAL, corner_radius=0, wrap='none')
+        self.table.pack(fill='both', expand=True, padx=10, pady=(10, 5))
+
+        btn_frame = ctk.CTkFrame(self, fg_color="transparent")
+        btn_frame.pack(fill='x', padx=10, pady=(0, 10))
+        btn_frame.grid_columnconfigure((0, 1, 2, 3), weight=1)
+        for column, (text, command) in enumerate((("EXPORT JSON", lambda: self._export(".json")),
+                                                  ("EXPORT CSV", lambda: self._export(".csv")),
+                                                  ("CLEAR", self._clear), ("CLOSE", self.destroy))):
+            ctk.CTkButton(btn_frame, text=text, font=FONT_MONO_BOLD, corner_radius=0, command=command,
+                          fg_color=WIDGET_BACKGROUND, text_color=TEXT_COLOR_NORMAL, border_color=BORDER_COLOR,
+                          border_width=1, hover_color=HOVER_COLOR_BTN).grid(row=0, column=column, padx=2, sticky='ew')
+        self._refresh_after_id = None
+        self._refresh()
+
+    def _refresh(self):
+        self._refresh_after_id = None
+        if not self.winfo_exists(): return
+        lines = [f"{'KIND':<7} {'NAME':<28} {'N':>5} {'P50 ms':>9} {'P95 ms':>9} {'KB IN':>8} {'CACHED':>6} {'RETRY':>5}"]
+        for kind, name, count, p50, p95, kb_in, cached, retries in self.parent_gui.perf.summary():
+            lines.append(f"{kind:<7} {name[:28]:<28} {count:>5} {p50:>9.1f} {p95:>9.1f} {kb_in:>8.1f} "
+                         f"{cached:>6} {retries:>5}")
+        if len(lines) == 1:
+            lines.append("// no spans recorded yet")
+        self.table.configure(state='normal')
+        self.table.delete("1.0", "end")
+        self.table.insert("1.0", "\n".join(lines))
+        self.table.configure(state='disabled')
+        self._refresh_after_id = self.after(PERF_PANEL_REFRESH_MS, self._refresh)
+
+    def _clear(self):
+        self.parent_gui.perf.clear()
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+        self._refresh()
+
+    def _export(self, extension):
+        path = filedialog.asksaveasfilename(
+            parent=self, defaultextension=extension,
+            initialfile=f"jira_focus_perf_{datetime.datetime.now():%Y%m%d-%H%M%S}{extension}",
+            filetypes=[("JSON", "*.json"), ("CSV", "*.csv")] if extension == ".json" else [("CSV", "*.csv")])
+        if not path: return
+        try:
+            count = self.parent_gui.perf.export(path)
+        except OSError as e:
+            messagebox.showerror("Export Error", f"Cannot write {path}:\n{e}", parent=self)
+            return
+        print(f"[Perf] Exported {count} spans to {path}")
+        self.parent_gui._notify(f"Exported {count} spans to {os.path.basename(path)}.")
+
+    def destroy(self):
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+        super().destroy()
+
+
+class ProjectPicker(ctk.CTkToplevel):
+    """Searchable project list: type to filter by key or any word of the name, Enter picks the top match."""
+
+    def __init__(self, parent_gui):
+        super().__init__(parent_gui.root)
+        self.parent_gui = parent_gui
+        self.title("PROJECTS")
+        self.configure(fg_color=BACKGROUND_COLOR)
+        self.transient(parent_gui.root)
+        self.attributes('-alpha', 0.97)
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
+        win_w, win_h = 420, 420
+        try:
+            root = parent_gui.root
+            self.geometry(f"{win_w}x{win_h}+{root.winfo_x() + (root.winfo_width() // 2) - (win_w // 2)}"
+                          f"+{root.winfo_y() + 60}")
+        except Exception as e:
+            print(f"Could not center project picker: {e}")
+            self.geometry(f"{win_w}x{win_h}")
+
+        self.search_entry = ctk.CTkEntry(
+            self, placeholder_text="project key or name >", font=FONT_MONO_NORMAL, corner_radius=8,
+            fg_color=WIDGET_BACKGROUND, text_color=TEXT_COLOR_NORMAL,
+            placeholder_text_color=TEXT_COLOR_DIM, border_width=1, border_color=BORDER_COLOR
+        )
+        self.search_entry.pack(fill='x', padx=10, pady=(10, 5))
+        self.search_entry.bind("<KeyRelease>", self._on_typed)
+        self.search_entry.bind("<Return>", self._pick_first)
+        self.bind("<Escape>", lambda e: self.destroy())
+
+        self.count_label = ctk.CTkLabel(self, text="", font=FONT_MONO_SMALL, text_color=TEXT_COLOR_DIM)
+        self.count_label.pack(anchor='w', padx=12)
+
+        self.results = VirtualList(self, row_height=TASK_ROW_HEIGHT, create_row=self._create_row,
+                                   bind_row=self._bind_row, corner_radius=10)
+        self.results.message_label.configure(wraplength=360)
+        self.results.pack(fill='both', expand=True, padx=10, pady=(0, 10))
+
+        self._last_query = None
+        self._filter()
+        self.after(50, self._focus_entry)
+
+    def _focus_entry(self):
+        if self.winfo_exists():
+            self.grab_set()
+            self.search_entry.focus_set()
+
+    def _on_typed(self, event=None):
+        if event is not None and event.keysym in ("Return", "KP_Enter", "Escape"):
+            return
+        self._filter()
+
+    def _filter(self):
+        query = self.search_entry.get().strip().lower()
+        if query == self._last_query:
+            return
+        self._last_query = query
+        matches = self.parent_gui._search_projects(query)
+        self.count_label.configure(text=f"{len(matches)} of {len(self.parent_gui.projects)} projects")
+        if matches:
+            self.results.set_items(matches)
+        else:
+            self.results.show_message("// no matching projects")
+
+    def _create_row(self, parent):
+        row = ctk.CTkButton(parent, text="", font=FONT_MONO_NORMAL, anchor='w', corner_radius=0,
+                            height=TASK_ROW_HEIGHT - 1, fg_color=WIDGET_BACKGROUND, text_color=TEXT_COLOR_NORMAL, hover_color=HOVER_COLOR_BTN)
+        row.display = None
+        row.configure(command=lambda r=row: self._pick(r.display))
+        return row
+
+    def _bind_row(self, row, display, index):
+        row.display = display
+        is_recent = self.parent_gui.project_keys.get(display) in self.parent_gui.recent_projects
+        row.configure(text=("* " if is_recent else "  ") + display,
+                      fg_color=WIDGET_BACKGROUND if index % 2 == 0 else "#282828")
+
+    def _pick_first(self, event=None):
+        self._filter()
+        if self.results.items:
+            self._pick(self.results.items[0])
+
+    def _pick(self, display):
+        if not display:
+            return
+        self.destroy()
+        self.parent_gui._select_project_display(display)
+
 
 class GUI:
-    def __init__(self):
+    def __init__(self, profiler=None):
+        self.profiler = profiler or StartupProfiler()
+        self._bootstrap_pending = {'myself', 'projects'}
         self.root = None
         self.jira_server = None
         self.jira_username = None
@@ -634,10 +2214,14 @@ class GUI:
         self.current_task_name = ""
         self.current_jira_issue_key = None
         self.start_time = 0
+        self._start_monotonic = 0
+        self._timer_tick_after_id = None
+        self._timer_checkpoint_after_id = None
         self.elapsed_time = 0
         self.timer_running = False
         self.selected_labels = set()
         self.current_theme = "dark"
+        self.busy_actions = set()
 
         config_path = os.path.join(os.path.dirname(__file__), 'config.json')
         config = None
@@ -684,14 +2268,75 @@ class GUI:
             messagebox.showerror("Config Error", f"Unexpected error processing configuration:\n{e}")
             sys.exit(1)
 
+        self.profiler.mark("config loaded")
         self.auth = (self.jira_username, self.jira_api_token)
         self.headers = {"Content-Type": "application/json", "Accept": "application/json"}
 
+        try:
+            pool_size = int(config.get('http_pool_size', HTTP_POOL_SIZE))
+            connect_timeout = float(config.get('http_connect_timeout', HTTP_CONNECT_TIMEOUT))
+            read_timeout = float(config.get('http_read_timeout', HTTP_READ_TIMEOUT))
+        except (TypeError, ValueError) as e:
+            print(f"Warning: Invalid HTTP settings in config ({e}). Using defaults.")
+            pool_size, connect_timeout, read_timeout = HTTP_POOL_SIZE, HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT
+        try:
+            self.http_max_attempts = max(1, int(config.get('http_max_attempts', HTTP_MAX_ATTEMPTS)))
+            rate_limit = float(config.get('rate_limit_per_second', RATE_LIMIT_PER_SECOND))
+        except (TypeError, ValueError):
+            self.http_max_attempts, rate_limit = HTTP_MAX_ATTEMPTS, RATE_LIMIT_PER_SECOND
+        self.rate_limiter = TokenBucket(rate_limit)
+        self.adaptive_timeouts = bool(config.get('adaptive_timeouts', True))
+        self.hedge_gets = bool(config.get('hedge_gets', False))
+        self.latency = LatencyTracker()
+        self.perf = PerfRecorder()
+        self.perf_panel = None
+        self._hedge_pool = None
+        try:
+            self.label_scan_concurrency = max(1, int(config.get('label_scan_concurrency', LABEL_SCAN_CONCURRENCY)))
+        except (TypeError, ValueError):
+            self.label_scan_concurrency = LABEL_SCAN_CONCURRENCY
+        self.label_editor_mode = str(config.get('label_editor_mode', LABEL_EDITOR_MODES[0])).lower()
+        if self.label_editor_mode not in LABEL_EDITOR_MODES:
+            print(f"Warning: Unknown label_editor_mode '{self.label_editor_mode}'. Using typeahead.")
+            self.label_editor_mode = LABEL_EDITOR_MODES[0]
+        self.transport = JiraTransport(self.auth, self.headers, pool_size=pool_size,
+                                       connect_timeout=connect_timeout, read_timeout=read_timeout)
+        self.response_cache = ResponseCache()
+        self.single_flight = SingleFlight()
+        self.circuit = CircuitBreaker(on_change=lambda is_open: self._call_on_ui(self._on_circuit_changed, is_open))
+        self._circuit_probe_after_id = None
+        self._circuit_probe_delay_ms = CIRCUIT_PROBE_MIN_MS
+        journal_path = config.get('worklog_journal') or os.path.join(os.path.dirname(config_path),
+                                                                     WORKLOG_JOURNAL_FILE)
+        self.worklog_journal = WorklogJournal(journal_path)
+        self._worklog_flush_job = None
+        self._worklog_flush_after_id = None
+        self._worklog_retry_ms = WORKLOG_RETRY_MIN_MS
+        self._last_worklog_id = None
+        snapshot_path = config.get('bootstrap_snapshot') or os.path.join(os.path.dirname(config_path),
+                                                                         BOOTSTRAP_SNAPSHOT_FILE)
+        self.bootstrap_snapshot = BootstrapSnapshot(snapshot_path, self.jira_server, self.jira_username)
+        self.issue_types_by_project = {}
+        self._issue_types_loaded_at = {}
+        self.recent_projects = []
+        self.project_index = PrefixIndex()
+        self._snapshot_save_after_id = None
+        graph_path = config.get('transition_graph') or os.path.join(os.path.dirname(config_path),
+                                                                    TRANSITION_GRAPH_FILE)
+        self.transition_graph = TransitionGraph(graph_path)
+        self.transition_graph.load()
+        # last known status / issue type per issue key, used to resolve status buttons locally
+        self.known_issue_state = {}
+        # per bulk endpoint: None until tried, then whether this server/user can use it
+        self._bulk_api_supported = {}
 
         self._apply_theme(self.current_theme)
 
         self.root = ctk.CTk()
         self._root_ref = weakref.ref(self.root)
+        self.runner = BackgroundRunner(self.root, max_workers=max(IO_WORKERS, self.transport.pool_size),
+                                       on_unhandled_error=self._on_unhandled_job_error)
+        self.profiler.mark("root window")
         self.root.configure(fg_color=BACKGROUND_COLOR)
         self.root.geometry("500x500")
         self.root.title("JIRA Focus")
@@ -710,6 +2355,9 @@ class GUI:
 
         self.root.bind("<Control-q>", self.minimize_window)
         self.root.bind("<Control-Shift-q>", self.restore_window)
+        self.root.bind("<Control-p>", lambda e: self.open_project_picker())
+        self.root.bind("<F12>", lambda e: self.toggle_perf_panel())
+        self.root.bind("<Map>", lambda e: self._resume_timer_display() if e.widget is self.root else None, add="+")
 
         self.label = ctk.CTkLabel(self.content_frame, text="JIRA FOCUS", font=FONT_MONO_XLARGE,
                                   text_color=TERMINAL_GREEN)
@@ -843,24 +2491,199 @@ class GUI:
         )
         self.bstatus_done.grid(row=0, column=2, padx=(5, 0), sticky='ew')
 
-        self._fetch_my_account_id()
-        self.load_projects_from_jira()
+        self.notice_bar = NoticeBar(self.content_frame)
+        self.notice_bar.place_in(fill='x', padx=10, pady=(5, 0))
+
+        self.profiler.mark("widgets built")
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        # let the first frame paint before any startup work runs
+        self.root.after_idle(self._start_bootstrap)
         self.root.mainloop()
 
-    @lru_cache(maxsize=32)
-    def _cached_get_request(self, endpoint):
-        """Cached wrapper for GET requests to improve performance"""
-        return self._make_jira_request_internal("GET", endpoint)
+    def _start_bootstrap(self):
+        """Fire the independent startup requests together; each one fills in its part of the UI on arrival."""
+        self.profiler.mark("first frame")
+        if self._apply_bootstrap_snapshot():
+            self.profiler.mark("snapshot applied")
+        self._fetch_my_account_id()
+        self.load_projects_from_jira()
+        self._replay_worklog_journal()
+        self.profiler.mark("bootstrap dispatched")
+
+    def _apply_bootstrap_snapshot(self):
+        """Fill the UI from the last session's snapshot; the startup requests then only revalidate it."""
+        snapshot = self.bootstrap_snapshot.load()
+        if not snapshot:
+            return False
+        print(f"Bootstrap snapshot loaded ({len(snapshot.get('projects', {}))} projects).")
+        self.my_account_id = snapshot.get('account_id') or self.my_account_id
+        self.issue_types_by_project = dict(snapshot.get('issue_types') or {})
+        self.recent_projects = list(snapshot.get('recent_projects') or [])[:RECENT_PROJECTS_MAX]
+        self._apply_projects(snapshot.get('projects') or {})
+        last_project = snapshot.get('last_project')
+        display = next((disp for disp, key in self.project_keys.items() if key == last_project), None)
+        if display and not self.selected_project_key:
+            self.project_combobox.set(display)
+            self.on_project_select(display)
+        self._update_action_button_states()
+        return True
+
+    def _schedule_snapshot_save(self):
+        if self._snapshot_save_after_id is None and self._is_root_valid():
+            self._snapshot_save_after_id = self.root.after(BOOTSTRAP_SNAPSHOT_SAVE_DELAY_MS, self._save_snapshot)
+
+    def _save_snapshot(self):
+        self._snapshot_save_after_id = None
+        data = {'account_id': self.my_account_id, 'projects': dict(self.project_keys),
+                'issue_types': {k: list(v) for k, v in self.issue_types_by_project.items()},
+                'last_project': self.selected_project_key, 'recent_projects': list(self.recent_projects)}
+        self._run_in_background(self.bootstrap_snapshot.save, data)
+
+    def _bootstrap_step_done(self, step):
+        if step not in self._bootstrap_pending:
+            return
+        self._bootstrap_pending.discard(step)
+        self.profiler.mark(f"{step} loaded")
+        if not self._bootstrap_pending:
+            self.profiler.mark("interactive")
+            self.profiler.report()
+
+    def _run_in_background(self, fn, *args, on_done=None, on_error=None, owner=None, quiet=False, **kwargs):
+        """Run blocking work (usually Jira I/O) off the Tk thread; callbacks run back on the Tk thread.
+
+        When `owner` is a window, the job is cancelled as soon as that window is destroyed.
+        """
+        handle = self.runner.submit(fn, *args, on_done=on_done, on_error=on_error, owner=owner, quiet=quiet,
+                                    **kwargs)
+        if owner is not None:
+            self._track_job(owner, handle)
+        return handle
+
+    def _track_job(self, window, handle):
+        jobs = getattr(window, '_pending_jobs', None)
+        if jobs is None:
+            jobs = window._pending_jobs = []
+            try:
+                window.bind("<Destroy>", lambda e, w=window: self._cancel_window_jobs(w) if e.widget is w else None,
+                            add="+")
+            except Exception as e:
+                print(f"Cannot bind job cancellation to window: {e}")
+        jobs[:] = [j for j in jobs if not j.done()]
+        jobs.append(handle)
+
+    def _cancel_window_jobs(self, window):
+        jobs = getattr(window, '_pending_jobs', None) or []
+        pending = [j for j in jobs if not j.done()]
+        for job in pending:
+            job.cancel()
+        if pending:
+            print(f"Cancelled {len(pending)} pending job(s) for closed window.")
+        jobs.clear()
+
+    def _fan_out(self, fn, items, max_workers):
+        """Call fn(item) for every item with at most max_workers in flight, yielding results as they complete.
+
+        Stops early (dropping queued items) once the enclosing background job is cancelled. Workers
+        inherit the job's cancel handle and quiet flag, and their requests are paced by rate_limiter.
+        """
+        items = list(items)
+        if not items:
+            return
+        handle, quiet = getattr(_job_context, 'handle', None), current_job_quiet()
+
+        def run(item):
+            _job_context.handle, _job_context.quiet, _job_context.paced = handle, quiet, True
+            try:
+                return fn(item)
+            finally:
+                _job_context.handle, _job_context.quiet, _job_context.paced = None, False, False
+
+        pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items))), thread_name_prefix="jira-fanout")
+        try:
+            futures = [pool.submit(run, item) for item in items]
+            for future in as_completed(futures):
+                if current_job_cancelled():
+                    print(f"Fan-out cancelled with {sum(not f.done() for f in futures)} item(s) pending.")
+                    return
+                yield future.result()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _on_unhandled_job_error(self, job_name, error):
+        """Fallback for background jobs submitted without on_error, so failures are never silent."""
+        self._show_message("showerror", "Background Error", f"'{job_name}' failed:\n{error}")
+
+    def _notify(self, text, kind="info"):
+        """Non-modal feedback for background writes (see NoticeBar)."""
+        print(f"[Notice:{kind}] {text}")
+        if self._is_root_valid() and hasattr(self, 'notice_bar'):
+            self.notice_bar.show(text.replace("\n", " | "), kind)
+
+    def _call_on_ui(self, fn, *args):
+        """Call fn on the Tk thread - directly if already there, otherwise via the runner."""
+        if threading.current_thread() is threading.main_thread():
+            fn(*args)
+        elif getattr(self, 'runner', None) is not None:
+            self.runner.post(fn, *args)
+
+    def _show_message(self, kind, title, message, parent=None):
+        """Thread-safe messagebox: kind is a messagebox function name (showerror, showwarning, showinfo)."""
+        self._call_on_ui(self._show_message_now, kind, title, message, parent)
+
+    def _show_message_now(self, kind, title, message, parent=None):
+        if not self._is_root_valid():
+            return
+        if parent is not None:
+            try:
+                if not parent.winfo_exists(): parent = None
+            except Exception:
+                parent = None
+        getattr(messagebox, kind)(title, message, parent=parent or self.root)
 
     def _make_jira_request(self, method, endpoint, **kwargs):
-        """Make a request to the JIRA API with caching for GET requests"""
+        """Make a request to the JIRA API with caching for GET requests.
+
+        Identical GETs already in flight are joined rather than sent again (see SingleFlight).
+        """
         if method == "GET" and not kwargs:
-            return self._cached_get_request(endpoint)
-        return self._make_jira_request_internal(method, endpoint, **kwargs)
+            offline = self.circuit.is_open
+            cached = self.response_cache.get(endpoint, allow_stale=offline)
+            if cached is not None:
+                print(f"<-- JIRA_API: {'OFFLINE, CACHED' if offline else 'CACHE HIT'} {endpoint.split('?')[0]}")
+                self.perf.add('request', LatencyTracker.key_for(method, endpoint), 0,
+                              cache='stale' if offline else 'hit', retries=0, status=cached.get('status_code'),
+                              ok=True)
+                return cached
+            return self.single_flight.do(self.response_cache.normalize_key(endpoint),
+                                         lambda: self._get_and_cache(endpoint))
+
+        result = self._make_jira_request_internal(method, endpoint, **kwargs)
+        if method in ("POST", "PUT", "DELETE"):
+            self.response_cache.invalidate_for_write(method, endpoint)
+        return result
+
+    def _get_and_cache(self, endpoint):
+        # a flight that finished just before this one started may already have filled the cache
+        cached = self.response_cache.get(endpoint)
+        if cached is not None:
+            return cached
+        result = self._make_jira_request_internal("GET", endpoint)
+        self.response_cache.put(endpoint, result)
+        return result
 
     def _make_jira_request_internal(self, method, endpoint, **kwargs):
-        """Internal implementation of JIRA API request handling"""
+        """Internal implementation of JIRA API request handling, recorded as one 'request' span."""
+        span = self.perf.span('request', LatencyTracker.key_for(method, endpoint))
+        stats = {'attempts': 0, 'bytes_in': 0}
+        result = self._request_with_retries(method, endpoint, stats, **kwargs)
+        data = kwargs.get('data')
+        span.finish(bytes_out=len(data) if isinstance(data, (str, bytes)) else 0, bytes_in=stats['bytes_in'],
+                    cache='miss' if method == "GET" else None, retries=max(0, stats['attempts'] - 1),
+                    status=result.get('status_code'), ok=bool(result.get('success')))
+        return result
+
+    def _request_with_retries(self, method, endpoint, stats, **kwargs):
+        _requests()
         if not self.jira_server:
             print("!! ERROR: Jira server address not configured.")
             return {'success': False, 'error': 'Jira server address not configured.', 'status_code': None}
@@ -873,38 +2696,172 @@ class GUI:
             log_data_summary = " with data"
         print(f"--> JIRA_API: {method} {log_url}{log_data_summary}")
 
-        try:
-            response = requests.request(
-                method, url,
-                auth=self.auth,
-                headers=self.headers,
-                timeout=30,
-                **kwargs
-            )
+        paced = getattr(_job_context, 'paced', False)
+        on_ui_thread = threading.current_thread() is threading.main_thread()
+        use_ceiling = False
+        attempt = 0
+        while True:
+            attempt += 1
+            stats['attempts'] = attempt
+            if self.circuit.is_open and not getattr(_job_context, 'probe', False):
+                print(f"<-- JIRA_API: OFFLINE, not sending {method} {log_url}")
+                return {'success': False, 'error': 'Jira server unreachable (offline mode).', 'status_code': None,
+                        'offline': True}
+            if not on_ui_thread and not self.rate_limiter.acquire(paced):
+                return {'success': False, 'error': 'Cancelled.', 'status_code': None}
+            try:
+                response = self._send(method, url, endpoint, stats, ceiling=use_ceiling, **kwargs)
+                stats['bytes_in'] += len(response.content or b'')
+                self.circuit.record_success()
+                delay = self._retry_delay(method, attempt, response=response, on_ui_thread=on_ui_thread)
+                if delay is not None:
+                    print(f"<-- JIRA_API: {response.status_code}, retry {attempt}/{self.http_max_attempts - 1} "
+                          f"in {delay:.1f}s")
+                    if self._wait_before_retry(delay):
+                        continue
+
+                response.raise_for_status()
+
+                if response.status_code == 204:
+                    print(f"<-- JIRA_API: {response.status_code} NO_CONTENT")
+                    return {'success': True, 'status_code': response.status_code}
+                else:
+                    try:
+                        data = response.json()
+                        print(f"<-- JIRA_API: {response.status_code} OK")
+                        return {'success': True, 'status_code': response.status_code, 'data': data}
+                    except json.JSONDecodeError:
+                        print(f"<-- JIRA_API: {response.status_code} OK (Non-JSON)")
+                        is_success = 200 <= response.status_code < 300
+                        return {'success': is_success, 'status_code': response.status_code,
+                                'raw_response': response.text}
+
+            except requests.exceptions.HTTPError as http_err:
+                return self._handle_http_error(http_err, method, log_url)
+            except requests.exceptions.ConnectionError as conn_err:
+                self.circuit.record_failure()
+                # nothing reached the server, so idempotent calls can simply go again
+                delay = None if self.circuit.is_open else self._retry_delay(method, attempt, on_ui_thread=on_ui_thread)
+                if delay is not None:
+                    print(f"!! Connection error for {method} {log_url}, retry {attempt}/{self.http_max_attempts - 1} "
+                          f"in {delay:.1f}s")
+                    if self._wait_before_retry(delay):
+                        continue
+                return self._handle_connection_error(conn_err, method, log_url)
+            except requests.exceptions.Timeout as timeout_err:
+                # connect timeouts are ConnectionErrors above; a read timeout means the server is up but slow,
+                # so it never counts towards the circuit breaker
+                read_timeout = stats.get('read_timeout') or self.transport.read_timeout
+                if method == "GET" and not use_ceiling and read_timeout < self.transport.read_timeout:
+                    print(f"!! Read timeout after {read_timeout:.1f}s for GET {log_url}, "
+                          f"retrying with {self.transport.read_timeout:.0f}s")
+                    use_ceiling = True
+                    continue
+                return self._handle_timeout_error(timeout_err, method, log_url)
+            except requests.exceptions.RequestException as req_err:
+                return self._handle_request_exception(req_err, method, log_url)
+
+    def _send(self, method, url, endpoint, stats, ceiling=False, **kwargs):
+        """One HTTP attempt with per-class timeouts, recording its latency; GETs may be hedged.
+
+        ceiling=True uses the configured timeouts instead of the adaptive ones. The read timeout
+        used is left in stats['read_timeout'].
+        """
+        key = self.latency.key_for(method, endpoint)
+        if 'timeout' not in kwargs:
+            if self.adaptive_timeouts and not ceiling:
+                kwargs['timeout'] = self.latency.timeouts(key, self.transport.connect_timeout,
+                                                          self.transport.read_timeout)
+            else:
+                kwargs['timeout'] = (self.transport.connect_timeout, self.transport.read_timeout)
+        timeout = kwargs['timeout']
+        stats['read_timeout'] = timeout[1] if isinstance(timeout, tuple) else timeout
+        hedge_after = None
+        if self.hedge_gets and method == "GET":
+            hedge_after = self.latency.percentile(key, HEDGE_PERCENTILE)
+        started = time.monotonic()
+        try:
+            if hedge_after is not None and hedge_after >= HEDGE_MIN_DELAY_SECONDS:
+                response = self._hedged_get(url, hedge_after, **kwargs)
+            else:
+                response = self.transport.request(method, url, **kwargs)
+        except requests.exceptions.Timeout:
+            # count the wait we gave up on, so the next timeout for this class is not tighter
+            self.latency.record(key, time.monotonic() - started)
+            raise
+        self.latency.record(key, time.monotonic() - started)
+        return response
+
+    def _hedged_get(self, url, hedge_after, **kwargs):
+        """GET that sends a second copy once the first is slower than hedge_after; first answer wins."""
+        if self._hedge_pool is None:
+            self._hedge_pool = ThreadPoolExecutor(max_workers=self.transport.pool_size,
+                                                  thread_name_prefix="jira-hedge")
+        first = self._hedge_pool.submit(self.transport.request, "GET", url, **kwargs)
+        try:
+            return first.result(timeout=hedge_after)
+        except FutureTimeout:
+            pass
+        print(f"[Hedge] GET {url.split('?')[0]} slower than {hedge_after:.2f}s; sending a second request.")
+        second = self._hedge_pool.submit(self.transport.request, "GET", url, **kwargs)
+        done, _pending = wait([first, second], return_when=FIRST_COMPLETED)
+        winner = done.pop()
+        loser = second if winner is first else first
+        if winner.exception() is not None:
+            return loser.result()
+        loser.add_done_callback(lambda f: f.exception() is None and f.result().close())
+        return winner.result()
+
+    def _retry_delay(self, method, attempt, response=None, on_ui_thread=False):
+        """Seconds to wait before retrying, or None when the call should not be retried.
+
+        Idempotent methods retry 429/502/503/504 and connection failures; others only retry when
+        the server says the request was not processed (429, or 503 with Retry-After). Server hints
+        win over exponential backoff with full jitter.
+        """
+        retry_after = None
+        if response is not None:
+            headers = response.headers
+            if str(headers.get('X-RateLimit-NearLimit', '')).lower() == 'true':
+                self.rate_limiter.near_limit()
+            if response.status_code not in RETRY_STATUSES:
+                if response.status_code < 400:
+                    self.rate_limiter.succeeded()
+                return None
+            retry_after = _retry_after_seconds(headers, use_reset=response.status_code in (429, 503))
+            if retry_after is not None and retry_after > RETRY_MAX_DELAY_SECONDS:
+                # a hint this far out is not worth waiting for; fail now rather than pause everyone
+                print(f"!! Server asked to wait {retry_after:.0f}s; not retrying.")
+                if response.status_code == 429:
+                    self.rate_limiter.throttled()
+                return None
+            if response.status_code == 429:
+                self.rate_limiter.throttled(retry_after)
+            elif method not in IDEMPOTENT_METHODS and not (response.status_code == 503 and retry_after is not None):
+                return None
+        elif method not in IDEMPOTENT_METHODS:
+            return None
 
-            response.raise_for_status()
+        # checked after the rate-limiter bookkeeping so the last attempt still feeds the token bucket
+        if attempt >= self.http_max_attempts:
+            return None
+        if retry_after is None:
+            delay = random.uniform(0, min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1)))
+        else:
+            delay = retry_after + random.uniform(0, RETRY_BASE_DELAY_SECONDS)
+        limit = RETRY_UI_THREAD_MAX_DELAY_SECONDS if on_ui_thread else RETRY_MAX_DELAY_SECONDS
+        return delay if delay <= limit else None
 
-            if response.status_code == 204:
-                print(f"<-- JIRA_API: {response.status_code} NO_CONTENT")
-                return {'success': True, 'status_code': response.status_code}
-            else:
-                try:
-                    data = response.json()
-                    print(f"<-- JIRA_API: {response.status_code} OK")
-                    return {'success': True, 'status_code': response.status_code, 'data': data}
-                except json.JSONDecodeError:
-                    print(f"<-- JIRA_API: {response.status_code} OK (Non-JSON)")
-                    is_success = 200 <= response.status_code < 300
-                    return {'success': is_success, 'status_code': response.status_code, 'raw_response': response.text}
-
-        except requests.exceptions.HTTPError as http_err:
-            return self._handle_http_error(http_err, method, log_url)
-        except requests.exceptions.ConnectionError as conn_err:
-            return self._handle_connection_error(conn_err, method, log_url)
-        except requests.exceptions.Timeout as timeout_err:
-            return self._handle_timeout_error(timeout_err, method, log_url)
-        except requests.exceptions.RequestException as req_err:
-            return self._handle_request_exception(req_err, method, log_url)
+    def _wait_before_retry(self, delay):
+        """Sleep out a retry delay in short slices; False if the job was cancelled meanwhile."""
+        deadline = time.monotonic() + delay
+        while True:
+            if current_job_cancelled():
+                return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+            time.sleep(min(remaining, 0.25))
 
     def _handle_http_error(self, http_err, method, log_url):
         """Handle HTTP errors from JIRA API"""
@@ -938,18 +2895,18 @@ class GUI:
         """Handle connection errors from JIRA API"""
         err_msg = f"!! Connection Error for {method} {log_url}: {conn_err}"
         print(f"[API ERROR] {err_msg}")
-        if self._is_root_valid():
-            messagebox.showerror("Connection Error",
-                                 "Cannot connect to Jira server.\nCheck server address and network connection.",
-                                 parent=self.root)
+        # once the circuit is open the offline indicator says it all
+        if not current_job_quiet() and not self.circuit.is_open:
+            self._call_on_ui(self._notify, "Cannot connect to Jira server. Check server address and network.",
+                             "error")
         return {'success': False, 'error': err_msg, 'status_code': None}
 
     def _handle_timeout_error(self, timeout_err, method, log_url):
         """Handle timeout errors from JIRA API"""
         err_msg = f"!! Timeout Error for {method} {log_url}: {timeout_err}"
         print(f"[API ERROR] {err_msg}")
-        if self._is_root_valid():
-            messagebox.showerror("Timeout", "Jira API request timed out.", parent=self.root)
+        if not current_job_quiet() and not self.circuit.is_open:
+            self._call_on_ui(self._notify, "Jira API request timed out.", "error")
         return {'success': False, 'error': err_msg, 'status_code': None}
 
     def _handle_request_exception(self, req_err, method, log_url):
@@ -957,19 +2914,66 @@ class GUI:
         err_msg = f"!! Request Exception for {method} {log_url}: {req_err}"
         print(f"[API ERROR] {err_msg}")
         traceback.print_exc()
-        if self._is_root_valid():
-            messagebox.showerror("Request Error", f"An unexpected request error occurred: {req_err}",
-                                 parent=self.root)
+        if not current_job_quiet():
+            self._show_message("showerror", "Request Error", f"An unexpected request error occurred: {req_err}")
         return {'success': False, 'error': err_msg, 'status_code': None}
 
+    def _on_circuit_changed(self, is_open):
+        if not self._is_root_valid(): return
+        if self._circuit_probe_after_id is not None:
+            self.root.after_cancel(self._circuit_probe_after_id)
+            self._circuit_probe_after_id = None
+        if hasattr(self, 'title_label') and self.title_label.winfo_exists():
+            self.title_label.configure(text="JIRA FOCUS // OFFLINE" if is_open else "JIRA FOCUS",
+                                       text_color=ERROR_RED if is_open else TEXT_COLOR_NORMAL)
+        if is_open:
+            print("[Circuit] Jira unreachable; offline mode, serving cached data.")
+            self._notify("Jira unreachable: offline mode, showing cached data. Reconnecting in the background.",
+                         "error")
+            self._circuit_probe_delay_ms = CIRCUIT_PROBE_MIN_MS
+            self._schedule_circuit_probe()
+        else:
+            print("[Circuit] Jira reachable again.")
+            self._notify("Back online.")
+            self._schedule_worklog_flush(0)
+
+    def _schedule_circuit_probe(self):
+        if not self._is_root_valid() or not self.circuit.is_open: return
+        self._circuit_probe_after_id = self.root.after(self._circuit_probe_delay_ms, self._start_circuit_probe)
+
+    def _start_circuit_probe(self):
+        self._circuit_probe_after_id = None
+        self._run_in_background(self._probe_jira, quiet=True, on_done=self._on_circuit_probe_done)
+
+    def _probe_jira(self):
+        """Cheap GET myself that is allowed through the open circuit (worker thread)."""
+        _job_context.probe = True
+        try:
+            return self._make_jira_request_internal("GET", "myself")
+        finally:
+            _job_context.probe = False
+
+    def _on_circuit_probe_done(self, result):
+        # a successful probe closes the circuit inside the request layer
+        if self.circuit.is_open:
+            self._circuit_probe_delay_ms = min(CIRCUIT_PROBE_MAX_MS, self._circuit_probe_delay_ms * 2)
+            print(f"[Circuit] Probe failed; next in {self._circuit_probe_delay_ms // 1000}s.")
+            self._schedule_circuit_probe()
+
     def _fetch_my_account_id(self):
         """Fetch the current user's account ID from JIRA - optimized version"""
         print("Fetching user info (accountId)...")
-        result = self._make_jira_request("GET", "myself")
+        self._run_in_background(self._make_jira_request, "GET", "myself", on_done=self._on_my_account_id_loaded)
 
+    def _on_my_account_id_loaded(self, result):
+        self._bootstrap_step_done('myself')
         if result and result['success'] and 'data' in result and 'accountId' in result['data']:
-            self.my_account_id = result['data']['accountId']
+            if result['data']['accountId'] != self.my_account_id:
+                self.my_account_id = result['data']['accountId']
+                self._schedule_snapshot_save()
             print(f">> My accountId: {self.my_account_id}")
+        elif self.my_account_id:
+            print("!! Could not revalidate accountId; keeping the one from the snapshot.")
         else:
             self.my_account_id = None
             print("!! ERROR: Failed to fetch user accountId.")
@@ -1006,26 +3010,76 @@ class GUI:
 
     def load_projects_from_jira(self):
         print("Fetching projects from Jira...")
-        result = self._make_jira_request("GET", "project/search")
-
-        self.projects = []
-        self.project_keys = {}
+        if hasattr(self, 'project_combobox') and self.project_combobox.winfo_exists():
+            self.project_combobox.set("loading projects...")
+        self._run_in_background(self._fetch_all_projects, on_done=self._on_projects_loaded)
+
+    def _fetch_all_projects(self):
+        """Read every page of project/search: the first one for the total, the rest concurrently (worker thread)."""
+        def fetch_page(start_at):
+            return self._make_jira_request("GET", f"project/search?startAt={start_at}&maxResults={PROJECT_PAGE_SIZE}")
+
+        first = fetch_page(0)
+        if not first or not first['success'] or 'values' not in first.get('data', {}):
+            return first
+        values = list(first['data']['values'])
+        total = first['data'].get('total', len(values))
+        page_size = first['data'].get('maxResults') or len(values) or PROJECT_PAGE_SIZE
+        offsets = list(range(page_size, total, page_size))
+        if offsets:
+            print(f"Fetching {len(offsets)} more project pages ({PROJECT_LOAD_CONCURRENCY} in parallel)...")
+        for result in self._fan_out(fetch_page, offsets, PROJECT_LOAD_CONCURRENCY):
+            if not result or not result['success'] or 'values' not in result.get('data', {}):
+                # a partial list would look complete; keep whatever the UI already shows instead
+                return result or {'success': False, 'error': 'Project page request failed.', 'status_code': None}
+            values.extend(result['data']['values'])
+        return {'success': True, 'status_code': first.get('status_code'), 'data': {'values': values, 'total': total}}
+
+    def _on_projects_loaded(self, result):
+        self._bootstrap_step_done('projects')
 
         if result and result['success'] and 'data' in result and 'values' in result['data']:
             all_projects = result['data']['values']
-            self.projects = sorted([f"{p['name']} ({p['key']})" for p in all_projects if 'name' in p and 'key' in p])
-            self.project_keys = {f"{p['name']} ({p['key']})": p['key'] for p in all_projects if
-                                 'name' in p and 'key' in p}
-            print(f"Loaded {len(self.projects)} projects.")
-        else:
-            print("Failed to load projects or no projects found.")
-            if result and not result['success'] and hasattr(self, 'root') and self.root.winfo_exists():
-                messagebox.showerror("API Project Error",
-                                     f"Could not fetch project list.\nDetails: {result.get('error', 'N/A')}",
-                                     parent=self.root)
+            project_keys = {f"{p['name']} ({p['key']})": p['key'] for p in all_projects if
+                            'name' in p and 'key' in p}
+            print(f"Loaded {len(project_keys)} projects.")
+            if self._apply_projects(project_keys):
+                self._schedule_snapshot_save()
+            self._prefetch_recent_issue_types()
+            return
+
+        print("Failed to load projects or no projects found.")
+        if self.projects:
+            print("Keeping the project list from the snapshot.")
+            return
+        if result and not result['success'] and hasattr(self, 'root') and self.root.winfo_exists():
+            messagebox.showerror("API Project Error",
+                                 f"Could not fetch project list.\nDetails: {result.get('error', 'N/A')}",
+                                 parent=self.root)
+        self._apply_projects({})
+
+    def _apply_projects(self, project_keys):
+        """Show a project list (display name -> key). Returns False when nothing changed."""
+        if project_keys == self.project_keys and self.projects:
+            print("Project list unchanged.")
+            return False
+        self.project_keys = dict(project_keys)
+        self.projects = sorted(self.project_keys)
+        self.project_index = PrefixIndex()
+        for display, key in self.project_keys.items():
+            self.project_index.add(display, key, display, *display[:-len(key) - 3].split())
+        self.recent_projects = [key for key in self.recent_projects if key in self.project_keys.values()]
+        self._refresh_project_combobox()
+
+        current_display = next(
+            (disp for disp, key in self.project_keys.items() if key == self.selected_project_key), None)
+        if current_display or self.timer_running:
+            # the selected project survived the refresh (or a restored timer owns it): only its name may change
+            if current_display and hasattr(self, 'project_combobox') and self.project_combobox.winfo_exists():
+                self.project_combobox.set(current_display)
+            return True
 
         if hasattr(self, 'project_combobox') and self.project_combobox.winfo_exists():
-            self.project_combobox.configure(values=self.projects)
             self.project_combobox.set("select project >" if self.projects else "no projects/API error")
 
         self.selected_project_key = None
@@ -1044,8 +3098,54 @@ class GUI:
 
         if hasattr(self, 'root') and self.root.winfo_exists():
             self._update_action_button_states()
+        return True
+
+    def _refresh_project_combobox(self):
+        """The dropdown only holds the recently used projects; everything else goes through the picker."""
+        if not hasattr(self, 'project_combobox') or not self.project_combobox.winfo_exists():
+            return
+        displays = {key: disp for disp, key in self.project_keys.items()}
+        recent = [displays[key] for key in self.recent_projects if key in displays]
+        self.project_combobox.configure(values=recent + [PROJECT_SEARCH_ENTRY] if self.projects else [])
+
+    def _search_projects(self, query):
+        """Projects whose key, name or any name word starts with the first query word, recent ones first."""
+        words = query.lower().split()
+        if not words:
+            matches = self.projects
+        else:
+            matches = self.project_index.search(words[0])
+            for word in words[1:]:
+                matches = [disp for disp in matches if word in disp.lower()]
+        recent_rank = {key: i for i, key in enumerate(self.recent_projects)}
+        return sorted(matches, key=lambda disp: (recent_rank.get(self.project_keys.get(disp), len(recent_rank)),
+                                                 disp.lower()))
+
+    def _note_recent_project(self, project_key):
+        self.recent_projects = ([project_key] + [k for k in self.recent_projects if k != project_key]
+                                )[:RECENT_PROJECTS_MAX]
+        self._refresh_project_combobox()
+
+    def open_project_picker(self):
+        if not self.projects:
+            return
+        picker = ProjectPicker(self)
+        picker.focus_force()
+
+    def _select_project_display(self, display):
+        if hasattr(self, 'project_combobox') and self.project_combobox.winfo_exists():
+            self.project_combobox.set(display)
+        self.on_project_select(display)
 
     def on_project_select(self, choice):
+        if choice == PROJECT_SEARCH_ENTRY:
+            current_display = next(
+                (disp for disp, key in self.project_keys.items() if key == self.selected_project_key), None)
+            if hasattr(self, 'project_combobox') and self.project_combobox.winfo_exists():
+                self.project_combobox.set(current_display or "select project >")
+            if not self.timer_running:
+                self.open_project_picker()
+                return
         if self.timer_running:
             messagebox.showwarning("Timer Active", "Stop the timer before changing project.", parent=self.root)
             current_display = next(
@@ -1069,6 +3169,8 @@ class GUI:
                 if hasattr(self, 'edit_labels_button') and self.edit_labels_button.winfo_exists():
                     self.edit_labels_button.configure(text="LABELS [0]")
                 self.load_categories_from_jira()
+                self._note_recent_project(self.selected_project_key)
+                self._schedule_snapshot_save()
             else:
                 print(f"Invalid project selection or reset: {choice}")
                 self.selected_project_key = None
@@ -1089,7 +3191,11 @@ class GUI:
     def load_categories_from_jira(self):
         self.categories = []
 
-        if hasattr(self, 'category_display_label') and self.category_display_label.winfo_exists():
+        cached_types = self.issue_types_by_project.get(self.selected_project_key)
+        if cached_types:
+            # show the cached types right away; a stale entry is revalidated below
+            self._apply_categories(cached_types)
+        elif hasattr(self, 'category_display_label') and self.category_display_label.winfo_exists():
             self.category_display_label.configure(text="loading types...")
 
         if not self.selected_project_key:
@@ -1099,36 +3205,99 @@ class GUI:
             if hasattr(self, 'root') and self.root.winfo_exists(): self._update_action_button_states()
             return
 
+        if cached_types and self._issue_types_fresh(self.selected_project_key):
+            print(f"Issue types for {self.selected_project_key} served from cache.")
+            return
+
         print(f"Fetching issue types for project: {self.selected_project_key}...")
-        endpoint = f"issue/createmeta?projectKeys={self.selected_project_key}&expand=projects.issuetypes"
-        result = self._make_jira_request("GET", endpoint)
+        self._run_in_background(self._fetch_issue_types, self.selected_project_key,
+                                on_done=lambda result, key=self.selected_project_key:
+                                self._on_categories_loaded(key, result))
 
-        loaded_categories = []
-        if result and result['success'] and 'data' in result and result['data'].get('projects'):
-            project_meta_list = result['data'].get('projects', [])
-            project_meta = next((p for p in project_meta_list if p.get('key') == self.selected_project_key), None)
-            if project_meta:
-                issue_types = project_meta.get('issuetypes', [])
-                loaded_categories = sorted(
-                    [it['name'] for it in issue_types if not it.get('subtask', False) and 'name' in it])
-                if not loaded_categories:
-                    print(f"Warning: No standard issue types found for {self.selected_project_key}.")
-                else:
-                    print(f"Loaded {len(loaded_categories)} standard issue types for {self.selected_project_key}.")
+    def _issue_types_fresh(self, project_key):
+        loaded_at = self._issue_types_loaded_at.get(project_key)
+        return loaded_at is not None and time.monotonic() - loaded_at < ISSUE_TYPES_TTL_SECONDS
+
+    def _fetch_issue_types(self, project_key):
+        """Page through issue/createmeta/{project}/issuetypes and return the standard type names (worker thread)."""
+        issue_types = []
+        start_at = 0
+        while True:
+            endpoint = (f"issue/createmeta/{urllib.parse.quote(project_key)}/issuetypes"
+                        f"?startAt={start_at}&maxResults={ISSUE_TYPES_PAGE_SIZE}")
+            result = self._make_jira_request("GET", endpoint)
+            if not result or not result['success'] or not isinstance(result.get('data'), dict):
+                return result
+            data = result['data']
+            # Jira Cloud answers with 'issueTypes', Data Center with 'values'
+            page = data.get('issueTypes', data.get('values')) or []
+            issue_types.extend(page)
+            start_at += len(page)
+            if not page or start_at >= data.get('total', start_at) or data.get('isLast', False):
+                break
+        names = sorted({it['name'] for it in issue_types if not it.get('subtask', False) and 'name' in it})
+        return {'success': True, 'status_code': result.get('status_code'), 'data': names}
+
+    def _prefetch_recent_issue_types(self):
+        """Warm the issue-type cache for recently used projects so switching between them needs no request."""
+        stale = [key for key in self.recent_projects
+                 if key != self.selected_project_key and not self._issue_types_fresh(key)]
+        if not stale:
+            return
+        print(f"Prefetching issue types for {len(stale)} recent project(s)...")
+
+        def fetch_all():
+            return list(self._fan_out(lambda key: (key, self._fetch_issue_types(key)), stale,
+                                      PROJECT_LOAD_CONCURRENCY))
+
+        self._run_in_background(fetch_all, on_done=self._on_recent_issue_types_loaded)
+
+    def _on_recent_issue_types_loaded(self, results):
+        for project_key, result in results:
+            self._on_categories_loaded(project_key, result)
+
+    def _on_categories_loaded(self, project_key, result):
+        if result and result['success'] and isinstance(result.get('data'), list):
+            loaded_categories = result['data']
+            self._issue_types_loaded_at[project_key] = time.monotonic()
+            if not loaded_categories:
+                print(f"Warning: No standard issue types found for {project_key}.")
             else:
-                print(f"Warning: No metadata found for project {self.selected_project_key} in API response.")
-        else:
-            print(f"Failed to load issue type metadata for {self.selected_project_key}.")
-            if result and not result['success'] and hasattr(self, 'root') and self.root.winfo_exists():
-                messagebox.showerror("API Issue Type Error",
-                                     f"Could not fetch issue types.\nDetails: {result.get('error', 'N/A')}",
-                                     parent=self.root)
+                print(f"Loaded {len(loaded_categories)} standard issue types for {project_key}.")
+            if loaded_categories != self.issue_types_by_project.get(project_key):
+                if loaded_categories:
+                    self.issue_types_by_project[project_key] = loaded_categories
+                else:
+                    self.issue_types_by_project.pop(project_key, None)
+                self._schedule_snapshot_save()
+            if project_key != self.selected_project_key:
+                return
+            if loaded_categories == self.categories and self.categories:
+                print("Issue types unchanged.")
+                return
+            self._apply_categories(loaded_categories)
+            return
 
-        self.categories = loaded_categories
+        if project_key != self.selected_project_key:
+            print(f"Ignoring failed issue types for {project_key} (current: {self.selected_project_key}).")
+            return
+        print(f"Failed to load issue type metadata for {self.selected_project_key}.")
+        if self.categories:
+            print("Keeping the issue types from the snapshot.")
+            return
+        if result and not result['success'] and hasattr(self, 'root') and self.root.winfo_exists():
+            messagebox.showerror("API Issue Type Error",
+                                 f"Could not fetch issue types.\nDetails: {result.get('error', 'N/A')}",
+                                 parent=self.root)
+        self._apply_categories([])
+
+    def _apply_categories(self, categories):
+        current = self.category_display_label.cget("text") if hasattr(self, 'category_display_label') else None
+        self.categories = list(categories)
         if hasattr(self, 'category_display_label') and self.category_display_label.winfo_exists():
             if not self.categories:
                 self.category_display_label.configure(text="no types/error")
-            else:
+            elif current not in self.categories:
                 self.category_display_label.configure(text=self.categories[0])
 
         if hasattr(self, 'root') and self.root.winfo_exists():
@@ -1136,43 +3305,19 @@ class GUI:
 
     def create_jira_issue(self, task_name, issue_type_name, labels_list=None):
         if not self.selected_project_key:
-            if hasattr(self, 'root') and self.root.winfo_exists(): messagebox.showerror("Error", "No project selected.",
-                                                                                        parent=self.root)
+            self._show_message("showerror", "Error", "No project selected.")
             return None
         if not task_name:
-            if hasattr(self, 'root') and self.root.winfo_exists(): messagebox.showerror("Error",
-                                                                                        "Task summary cannot be empty.",
-                                                                                        parent=self.root)
+            self._show_message("showerror", "Error", "Task summary cannot be empty.")
             return None
         if not issue_type_name or issue_type_name.startswith(("select ", "loading", "no types")):
-            if hasattr(self, 'root') and self.root.winfo_exists(): messagebox.showerror("Error",
-                                                                                        "Invalid issue type selected.",
-                                                                                        parent=self.root)
+            self._show_message("showerror", "Error", "Invalid issue type selected.")
             return None
 
         print(f"Creating issue in {self.selected_project_key}: Type='{issue_type_name}', Summary='{task_name}'")
         if labels_list: print(f"  with labels: {labels_list}")
 
-        summary = task_name.strip()
-        description_text = f"Task created via JIRA Focus: {summary}"
-        adf_description = {"type": "doc", "version": 1,
-                           "content": [{"type": "paragraph", "content": [{"type": "text", "text": description_text}]}]}
-
-        issue_data = {
-            "fields": {
-                "project": {"key": self.selected_project_key},
-                "summary": summary,
-                "description": adf_description,
-                "issuetype": {"name": issue_type_name},
-            }
-        }
-
-        if labels_list:
-            valid_labels = [lbl for lbl in labels_list if lbl and not re.search(r"\s", lbl)]
-            if valid_labels:
-                issue_data["fields"]["labels"] = valid_labels
-                print(f"  Adding valid labels: {valid_labels}")
-
+        issue_data = self._issue_create_payload(self.selected_project_key, task_name, issue_type_name, labels_list)
         result = self._make_jira_request("POST", "issue", data=json.dumps(issue_data))
 
         if result and result['success'] and 'data' in result and 'key' in result['data']:
@@ -1191,19 +3336,79 @@ class GUI:
                 if api_details: error_msg += "\nDetails: " + ", ".join([f"{k}: {v}" for k, v in api_details.items()])
             elif result and result.get('raw_response'):
                 error_msg += f"\nServer Response ({result.get('status_code')}): {result['raw_response'][:200]}..."
-            if hasattr(self, 'root') and self.root.winfo_exists():
-                messagebox.showerror("Issue Creation Error", error_msg, parent=self.root)
+            self._show_message("showerror", "Issue Creation Error", error_msg)
             return None
 
-    def log_work_to_jira(self, issue_key, elapsed_seconds):
-        if not issue_key:
-            print("Cannot log time: missing issue key.")
-            return False
+    def _issue_create_payload(self, project_key, task_name, issue_type_name, labels_list=None):
+        summary = task_name.strip()
+        description_text = f"Task created via JIRA Focus: {summary}"
+        adf_description = {"type": "doc", "version": 1,
+                           "content": [{"type": "paragraph", "content": [{"type": "text", "text": description_text}]}]}
 
-        if elapsed_seconds <= 0:
-            print(f"Work duration <= 0 ({elapsed_seconds}s). Time not logged.")
-            return True
+        issue_data = {
+            "fields": {
+                "project": {"key": project_key},
+                "summary": summary,
+                "description": adf_description,
+                "issuetype": {"name": issue_type_name},
+            }
+        }
+
+        if labels_list:
+            valid_labels = [lbl for lbl in labels_list if lbl and not re.search(r"\s", lbl)]
+            if valid_labels:
+                issue_data["fields"]["labels"] = valid_labels
+        return issue_data
+
+    def create_jira_issues_bulk(self, project_key, summaries, issue_type_name, labels_list=None):
+        """Create one issue per summary via POST issue/bulk, BULK_CREATE_CHUNK per request (worker thread).
+
+        Returns [(summary, key or None, error or None)] in input order.
+        """
+        outcomes = []
+        for i in range(0, len(summaries), BULK_CREATE_CHUNK):
+            chunk = summaries[i:i + BULK_CREATE_CHUNK]
+            if current_job_cancelled():
+                outcomes.extend((summary, None, "Not attempted (cancelled).") for summary in chunk)
+                continue
+            payload = {"issueUpdates": [self._issue_create_payload(project_key, summary, issue_type_name, labels_list)
+                                        for summary in chunk]}
+            result = self._make_jira_request("POST", "issue/bulk", data=json.dumps(payload))
+            data = result.get('data') if result else None
+            if data is None and result and result.get('raw_response'):
+                # partial failure comes back as HTTP 400 with the same body as a success
+                try:
+                    data = json.loads(result['raw_response'])
+                except json.JSONDecodeError:
+                    data = None
+            if not isinstance(data, dict) or ('issues' not in data and 'errors' not in data):
+                error = self._bulk_error_text(result)
+                outcomes.extend((summary, None, error) for summary in chunk)
+                continue
+
+            errors = {}
+            for failure in data.get('errors') or []:
+                element_errors = failure.get('elementErrors') or {}
+                messages = list(element_errors.get('errorMessages', []))
+                messages += [f"{k}: {v}" for k, v in (element_errors.get('errors') or {}).items()]
+                errors[failure.get('failedElementNumber')] = "; ".join(messages) or f"HTTP {failure.get('status')}"
+            # created issues are listed in request order, skipping the failed elements
+            created = iter(data.get('issues') or [])
+            for index, summary in enumerate(chunk):
+                if index in errors:
+                    outcomes.append((summary, None, errors[index]))
+                    continue
+                issue = next(created, None)
+                if issue and issue.get('key'):
+                    outcomes.append((summary, issue['key'], None))
+                else:
+                    outcomes.append((summary, None, "No key returned."))
+            print(f"Bulk create chunk {i // BULK_CREATE_CHUNK}: {len(data.get('issues') or [])} created, "
+                  f"{len(errors)} failed.")
+        return outcomes
 
+    def log_work_to_jira(self, issue_key, elapsed_seconds, started=None, journal_id=None):
+        """POST one worklog and return the API result; `journal_id` is tagged into the comment."""
         print(f"Logging work for task: {issue_key}")
         jira_duration_string = self._format_seconds_to_jira_duration(elapsed_seconds)
         if jira_duration_string == "0m": jira_duration_string = "1m"
@@ -1211,44 +3416,210 @@ class GUI:
         print(f"Formatted time for Jira: {jira_duration_string} (from {elapsed_seconds}s)")
 
         comment_text = f"Worklog ({int(elapsed_seconds)}s -> {jira_duration_string}) added via JIRA Focus."
+        if journal_id:
+            comment_text += f" [{journal_id}]"
         adf_comment = {"type": "doc", "version": 1,
                        "content": [{"type": "paragraph", "content": [{"type": "text", "text": comment_text}]}]}
 
         worklog_data = {"timeSpent": jira_duration_string, "comment": adf_comment}
+        if started:
+            worklog_data["started"] = started
 
         endpoint = f"issue/{issue_key}/worklog"
         result = self._make_jira_request("POST", endpoint, data=json.dumps(worklog_data))
 
         if result and result['success'] and 'data' in result and 'id' in result['data']:
             print(f">> Successfully logged work ({jira_duration_string}) for {issue_key}.")
-            return True
         else:
             print(f"!! Failed to log work for {issue_key}.")
-            error_msg = f"Failed to log work for {issue_key}."
-            if result and result.get('error'):
-                error_msg += f"\nAPI Error: {result.get('error')}"
-            elif result and 'data' in result:
-                api_errors = result['data'].get('errorMessages', []);
-                api_details = result['data'].get('errors', {})
-                if api_errors: error_msg += "\n" + "\n".join(api_errors)
-                if api_details: error_msg += "\nDetails: " + ", ".join([f"{k}: {v}" for k, v in api_details.items()])
-            elif result and result.get('raw_response'):
-                error_msg += f"\nServer Response ({result.get('status_code')}): {result['raw_response'][:200]}..."
-            if hasattr(self, 'root') and self.root.winfo_exists():
-                messagebox.showerror("Worklog Error", error_msg, parent=self.root)
-            return False
+        return result
+
+    def _worklog_error_text(self, issue_key, result):
+        error_msg = f"Failed to log work for {issue_key}."
+        if result and result.get('error'):
+            error_msg += f"\nAPI Error: {result.get('error')}"
+        elif result and 'data' in result:
+            api_errors = result['data'].get('errorMessages', []);
+            api_details = result['data'].get('errors', {})
+            if api_errors: error_msg += "\n" + "\n".join(api_errors)
+            if api_details: error_msg += "\nDetails: " + ", ".join([f"{k}: {v}" for k, v in api_details.items()])
+        elif result and result.get('raw_response'):
+            error_msg += f"\nServer Response ({result.get('status_code')}): {result['raw_response'][:200]}..."
+        return error_msg
+
+    @staticmethod
+    def _jira_timestamp(wall_time):
+        """Format an epoch time the way Jira's worklog 'started' field expects."""
+        return datetime.datetime.fromtimestamp(wall_time).astimezone().strftime('%Y-%m-%dT%H:%M:%S.000%z')
+
+    def _queue_worklog(self, issue_key, elapsed_seconds, started_wall_time):
+        """Journal a finished timer run; the flusher posts it to Jira in the background."""
+        self.worklog_journal.record_stop(issue_key, elapsed_seconds)
+        if elapsed_seconds <= 0:
+            return None
+        entry = self.worklog_journal.add_worklog(issue_key, elapsed_seconds, self._jira_timestamp(started_wall_time))
+        print(f"Worklog {entry['id']} queued: {issue_key} {elapsed_seconds}s.")
+        return entry
+
+    def _replay_worklog_journal(self):
+        try:
+            pending = self.worklog_journal.replay()
+        except OSError as e:
+            print(f"!! Cannot read worklog journal {self.worklog_journal.path}: {e}")
+            return
+        open_timer = self.worklog_journal.open_timer
+        if open_timer is not None:
+            self._restore_crashed_timer(open_timer)
+        if pending:
+            print(f"Worklog journal: {len(pending)} worklog(s) still to post.")
+            self._schedule_worklog_flush()
+
+    def _restore_crashed_timer(self, open_timer):
+        """Resume a timer that was running when the app died, from its last checkpoint."""
+        issue_key = open_timer.get('issue')
+        seconds = int(open_timer.get('seconds') or 0)
+        if not issue_key or seconds <= 0:
+            print(f"!! Previous session ended with a timer running on {issue_key} "
+                  f"since {open_timer.get('started')}; no checkpoint, its time was not recorded.")
+            self.worklog_journal.record_stop(issue_key, None)
+            return
+        print(f"Restoring timer on {issue_key} from checkpoint ({seconds}s).")
+        self.current_task_name = open_timer.get('summary', '')
+        if hasattr(self, 'task_entry'):
+            self.task_entry.configure(state='normal')
+            self.task_entry.delete(0, "end")
+            self.task_entry.insert(0, self.current_task_name)
+            self.task_entry.configure(state='disabled')
+        started_wall_time = time.time() - seconds
+        try:
+            started_wall_time = datetime.datetime.strptime(open_timer['started'],
+                                                           '%Y-%m-%dT%H:%M:%S.%f%z').timestamp()
+        except (KeyError, TypeError, ValueError):
+            pass
+        self._begin_timer(issue_key, resumed_seconds=seconds, started_wall_time=started_wall_time)
+
+    def _schedule_worklog_flush(self, delay_ms=0):
+        if self._worklog_flush_job is not None and not self._worklog_flush_job.done():
+            return
+        if self._worklog_flush_after_id is not None:
+            if delay_ms:
+                return
+            self.root.after_cancel(self._worklog_flush_after_id)
+        self._worklog_flush_after_id = self.root.after(delay_ms, self._start_worklog_flush)
+
+    def _start_worklog_flush(self):
+        self._worklog_flush_after_id = None
+        if not self.worklog_journal.pending():
+            return
+        self._worklog_flush_job = self._run_in_background(self._flush_worklogs, on_done=self._on_worklogs_flushed,
+                                                          on_error=lambda _e: self._on_worklogs_flushed(None),
+                                                          quiet=True)
+
+    def _flush_worklogs(self):
+        """Post every pending worklog in journal order (worker thread). Stops at the first retryable failure."""
+        posted, failed = [], []
+        for entry in self.worklog_journal.pending():
+            if current_job_cancelled():
+                return {'posted': posted, 'failed': failed, 'retry': True}
+            already_posted = self._worklog_already_posted(entry) if entry['attempts'] else False
+            if already_posted is None:
+                # cannot tell whether the earlier attempt landed; posting again could double-book
+                return {'posted': posted, 'failed': failed, 'retry': True}
+            if already_posted:
+                print(f"Worklog {entry['id']} was already posted by an earlier attempt.")
+                self.worklog_journal.append('posted', id=entry['id'])
+                posted.append(entry)
+                continue
+            self.worklog_journal.append('attempt', id=entry['id'])
+            result = self.log_work_to_jira(entry['issue'], entry['seconds'], entry.get('started'), entry['id'])
+            if result and result['success'] and 'id' in result.get('data', {}):
+                self.worklog_journal.append('posted', id=entry['id'], worklog_id=result['data']['id'])
+                posted.append(entry)
+                continue
+            status = result.get('status_code') if result else None
+            if not isinstance(status, int) or status >= 500 or status in WORKLOG_RETRY_STATUSES:
+                return {'posted': posted, 'failed': failed, 'retry': True}
+            error_msg = self._worklog_error_text(entry['issue'], result)
+            self.worklog_journal.append('failed', id=entry['id'], error=error_msg[:500])
+            failed.append((entry, error_msg))
+        return {'posted': posted, 'failed': failed, 'retry': False}
+
+    def _worklog_already_posted(self, entry):
+        """Look for the journal id in the issue's worklog comments, so a retry never double-books.
+
+        Pages through every worklog started around the entry's start; None if that could not be checked.
+        """
+        base = f"issue/{entry['issue']}/worklog?maxResults={WORKLOG_PAGE_SIZE}"
+        try:
+            started = datetime.datetime.strptime(entry['started'], '%Y-%m-%dT%H:%M:%S.%f%z')
+            base += f"&startedAfter={int(started.timestamp() * 1000) - 60000}"
+        except (KeyError, TypeError, ValueError):
+            pass
+        tag = f"[{entry['id']}]"
+        start_at = 0
+        while True:
+            result = self._make_jira_request("GET", f"{base}&startAt={start_at}")
+            if not result or not result['success'] or 'data' not in result:
+                return None
+            data = result['data']
+            worklogs = data.get('worklogs', [])
+            if any(tag in json.dumps(wl.get('comment', '')) for wl in worklogs):
+                return True
+            start_at += len(worklogs)
+            if not worklogs or start_at >= data.get('total', 0):
+                return False
+
+    def _on_worklogs_flushed(self, summary):
+        self._worklog_flush_job = None
+        if summary is None:
+            summary = {'posted': [], 'failed': [], 'retry': True}
+        for entry in summary['posted']:
+            if entry['id'] == self._last_worklog_id:
+                self._show_logged_time(entry['seconds'], True)
+        for entry, error_msg in summary['failed']:
+            if entry['id'] == self._last_worklog_id:
+                self._show_logged_time(entry['seconds'], False)
+        if summary['failed']:
+            # 401/403 land here too: the user must learn their time is not being logged
+            issues = ", ".join(sorted({entry['issue'] for entry, _error in summary['failed']}))
+            first_error = summary['failed'][0][1].replace("\n", " ")
+            self._notify(f"{len(summary['failed'])} worklog(s) NOT logged ({issues}): {first_error} "
+                         f"Kept in {os.path.basename(self.worklog_journal.path)}.", "error")
+
+        if summary['retry']:
+            remaining = len(self.worklog_journal.pending())
+            print(f"Worklog flush incomplete, {remaining} pending. Retrying in {self._worklog_retry_ms // 1000}s.")
+            if not self.timer_running and self._last_worklog_id and hasattr(self, 'timer_label'):
+                if self.timer_label.winfo_exists():
+                    self.timer_label.configure(text=f"QUEUED: {remaining} worklog(s), retrying...")
+            self._schedule_worklog_flush(self._worklog_retry_ms)
+            self._worklog_retry_ms = min(self._worklog_retry_ms * 2, WORKLOG_RETRY_MAX_MS)
+        else:
+            self._worklog_retry_ms = WORKLOG_RETRY_MIN_MS
+            if self.worklog_journal.pending():
+                # queued while this flush was already running
+                self._schedule_worklog_flush()
 
     def _get_available_transitions(self, issue_key):
+        """Fetch the issue's status, type and transitions in one GET and teach them to the transition graph.
+
+        Returns (status_name, issue_type_name, transitions), or None on failure.
+        """
         if not issue_key: return None
         print(f"Fetching transitions for task: {issue_key}")
-        endpoint = f"issue/{issue_key}/transitions"
+        endpoint = f"issue/{issue_key}?fields=status,issuetype,project&expand=transitions"
         result = self._make_jira_request("GET", endpoint)
 
         if result and result['success'] and 'data' in result and 'transitions' in result['data']:
+            fields = result['data'].get('fields', {})
+            status_name = (fields.get('status') or {}).get('name')
+            issue_type_name = (fields.get('issuetype') or {}).get('name')
+            project_key = (fields.get('project') or {}).get('key') or issue_key.rsplit('-', 1)[0]
             transitions = result['data']['transitions']
             print(
                 f"  Found transitions: {[t.get('name', 'N/A') + ' (ID:' + t.get('id', '?') + ' -> ' + t.get('to', {}).get('name', '??') + ')' for t in transitions]}")
-            return transitions
+            self.transition_graph.learn(project_key, issue_type_name, status_name, transitions)
+            return status_name, issue_type_name, transitions
         else:
             print(f"!! Failed to get transitions for {issue_key} or none available.")
             if result and not result['success']:
@@ -1257,73 +3628,86 @@ class GUI:
                 print("   No transitions available or unexpected response structure.")
             return None
 
-    def _transition_issue(self, issue_key, target_status_name):
+    def _transition_error_text(self, issue_key, target_status_name, result):
+        error_msg = f"Error changing status of {issue_key} to '{target_status_name}'."
+        if result and result.get('error'):
+            error_msg += f"\nAPI Error: {result['error']}"
+        elif result and 'data' in result:
+            api_errors = result['data'].get('errorMessages', []);
+            api_details = result['data'].get('errors', {})
+            if api_errors: error_msg += "\n" + "\n".join(api_errors)
+            if api_details: error_msg += "\nDetails: " + ", ".join([f"{k}: {v}" for k, v in api_details.items()])
+        elif result:
+            error_msg += f"\nServer response code {result.get('status_code', 'N/A')}"
+        if result and result.get(
+                'raw_response'): error_msg += f"\nResponse: {result.get('raw_response', '')[:200]}..."
+        return error_msg
+
+    def _transition_issue(self, issue_key, target_status_name, known_state=None):
+        """Move issue_key to target_status_name, over several transitions if the learned graph knows a path.
+
+        With a known current status the first POST goes out without any GET. Returns
+        {'success', 'status', 'type'} with the last status the issue is known to be in.
+        """
         if not issue_key:
-            if hasattr(self, 'root') and self.root.winfo_exists(): messagebox.showerror("Error",
-                                                                                        "Select/create task first.",
-                                                                                        parent=self.root)
-            return False
-
-        transitions = self._get_available_transitions(issue_key)
-
-        if transitions is None:
-            if hasattr(self, 'root') and self.root.winfo_exists(): messagebox.showerror("Transition Error",
-                                                                                        f"Failed to get transitions for {issue_key}.",
-                                                                                        parent=self.root)
-            return False
-        if not transitions:
-            if hasattr(self, 'root') and self.root.winfo_exists(): messagebox.showwarning("No Transitions",
-                                                                                          f"No status changes possible for {issue_key} from current state.",
-                                                                                          parent=self.root)
-            return False
-
-        target_transition_id = None
-        target_status_name_lower = target_status_name.lower()
-        found_transition_name = "N/A"
-        for t in transitions:
-            to_status_name = t.get('to', {}).get('name', '').lower()
-            if to_status_name == target_status_name_lower:
-                target_transition_id = t.get('id')
-                found_transition_name = t.get('name', 'N/A')
-                print(
-                    f"  Found transition: '{found_transition_name}' (ID: {target_transition_id}) to status '{target_status_name}'.")
-                break
-
-        if not target_transition_id:
-            available_names = sorted(list(set([t.get('to', {}).get('name', 'N/A') for t in transitions])))
-            print(f"!! Transition to '{target_status_name}' not found for {issue_key}.")
-            print(f"   Available targets: {available_names}")
-            if hasattr(self, 'root') and self.root.winfo_exists():
-                messagebox.showerror("Transition Error",
-                                     f"Cannot change status to '{target_status_name}'.\nAvailable: {', '.join(available_names)}",
-                                     parent=self.root)
-            return False
+            return {'success': False, 'status': None, 'type': None, 'error': "Select/create task first."}
+
+        project_key = issue_key.rsplit('-', 1)[0]
+        status_name = (known_state or {}).get('status')
+        issue_type_name = (known_state or {}).get('type')
+        hops = None
+        if status_name and issue_type_name:
+            hops = self.transition_graph.shortest_path(project_key, issue_type_name, status_name, target_status_name)
+            if hops == []:
+                print(f"{issue_key} is already in '{target_status_name}'.")
+                return {'success': True, 'status': status_name, 'type': issue_type_name}
+
+        refreshed = False
+        while True:
+            if hops is None:
+                if refreshed:
+                    break
+                fetched = self._get_available_transitions(issue_key)
+                refreshed = True
+                if fetched is None:
+                    return {'success': False, 'status': None, 'type': issue_type_name,
+                            'error': f"Failed to get transitions for {issue_key}."}
+                status_name, issue_type_name, transitions = fetched
+                if not transitions:
+                    return {'success': False, 'status': status_name, 'type': issue_type_name,
+                            'error': f"No status changes possible for {issue_key} from current state."}
+                hops = self.transition_graph.shortest_path(project_key, issue_type_name, status_name, target_status_name)
+                if hops is None:
+                    break
+                if hops == []:
+                    return {'success': True, 'status': status_name, 'type': issue_type_name}
+
+            for hop_no, edge in enumerate(hops, 1):
+                print(f"Executing transition '{edge['name']}' (ID: {edge['id']}) for {issue_key} "
+                      f"[{hop_no}/{len(hops)}] -> '{edge['to']}'...")
+                endpoint = f"issue/{issue_key}/transitions"
+                payload = {"transition": {"id": edge['id']}}
+                result = self._make_jira_request("POST", endpoint, data=json.dumps(payload))
+                if result and result['success'] and result.get('status_code') == 204:
+                    status_name = edge['to']
+                    continue
+                print(f"!! Failed to execute transition ID {edge['id']} for {issue_key}.")
+                if result and result.get('status_code') in (400, 404, 409) and not refreshed:
+                    # learned edge no longer valid (workflow edited or status changed elsewhere): relearn once
+                    self.transition_graph.forget(project_key, issue_type_name, status_name)
+                    hops = None
+                    break
+                return {'success': False, 'status': status_name if hop_no > 1 else None, 'type': issue_type_name,
+                        'error': self._transition_error_text(issue_key, target_status_name, result)}
+            else:
+                print(f">> Successfully changed status of {issue_key} to '{target_status_name}'"
+                      f"{f' in {len(hops)} steps' if len(hops) > 1 else ''}.")
+                return {'success': True, 'status': status_name, 'type': issue_type_name}
 
-        print(f"Executing transition '{found_transition_name}' (ID: {target_transition_id}) for {issue_key}...")
-        endpoint = f"issue/{issue_key}/transitions"
-        payload = {"transition": {"id": target_transition_id}}
-        result = self._make_jira_request("POST", endpoint, data=json.dumps(payload))
-
-        if result and result['success'] and result.get('status_code') == 204:
-            print(f">> Successfully changed status of {issue_key} to '{target_status_name}'.")
-            return True
-        else:
-            print(f"!! Failed to execute transition ID {target_transition_id} for {issue_key}.")
-            error_msg = f"Error changing status of {issue_key} to '{target_status_name}'."
-            if result and result.get('error'):
-                error_msg += f"\nAPI Error: {result['error']}"
-            elif result and 'data' in result:
-                api_errors = result['data'].get('errorMessages', []);
-                api_details = result['data'].get('errors', {})
-                if api_errors: error_msg += "\n" + "\n".join(api_errors)
-                if api_details: error_msg += "\nDetails: " + ", ".join([f"{k}: {v}" for k, v in api_details.items()])
-            elif result:
-                error_msg += f"\nServer response code {result.get('status_code', 'N/A')}"
-            if result and result.get(
-                    'raw_response'): error_msg += f"\nResponse: {result.get('raw_response', '')[:200]}..."
-            if hasattr(self, 'root') and self.root.winfo_exists():
-                messagebox.showerror("Transition Error", error_msg, parent=self.root)
-            return False
+        print(f"!! No known path to '{target_status_name}' for {issue_key} from '{status_name}'.")
+        available = sorted({t.get('to', {}).get('name', 'N/A') for t in (fetched[2] if refreshed and fetched else [])})
+        return {'success': False, 'status': status_name, 'type': issue_type_name,
+                'error': f"Cannot change status to '{target_status_name}'.\nAvailable: {', '.join(available)}"}
 
     def change_status_to(self, target_status_name):
         print(f"--- Requesting status change to: {target_status_name} ---")
@@ -1331,7 +3715,50 @@ class GUI:
             if hasattr(self, 'root') and self.root.winfo_exists():
                 messagebox.showwarning("No Task", "Select a task first.", parent=self.root)
             return
-        self._transition_issue(self.current_jira_issue_key, target_status_name)
+        issue_key = self.current_jira_issue_key
+        previous_state = dict(self.known_issue_state.get(issue_key, {}))
+        # optimistic: show the target status now, roll back if Jira refuses
+        self.known_issue_state[issue_key] = dict(previous_state, status=target_status_name)
+        self.busy_actions.add('status')
+        self._update_action_button_states()
+        self._run_in_background(self._transition_issue, issue_key, target_status_name, previous_state, quiet=True,
+                                on_done=lambda result: self._on_status_change_done(issue_key, previous_state, result),
+                                on_error=lambda e: self._on_status_change_done(
+                                    issue_key, previous_state, {'success': False, 'status': None, 'error': str(e)}))
+
+    def _save_transition_graph(self):
+        if self.transition_graph.dirty:
+            self._run_in_background(self.transition_graph.save)
+
+    def _on_status_change_done(self, issue_key, previous_state, result):
+        state = self.known_issue_state.setdefault(issue_key, {})
+        if result.get('status'):
+            state.update(status=result['status'], type=result.get('type') or previous_state.get('type'))
+        elif previous_state.get('status') and not result['success']:
+            state.update(status=previous_state['status'], type=previous_state.get('type'))
+        else:
+            # unknown outcome: the next press will re-read the issue instead of trusting stale state
+            state.pop('status', None)
+            state.pop('type', None)
+        if result['success']:
+            project_key = issue_key.rsplit('-', 1)[0]
+            if not self.transition_graph.knows(project_key, result.get('type'), result['status']):
+                # learn the new status' exits in the background, so the next move from here needs no GET
+                self._run_in_background(self._get_available_transitions, issue_key, quiet=True,
+                                        on_done=lambda _r: self._save_transition_graph())
+        else:
+            self._notify(f"{issue_key}: status change failed, reverted. {result.get('error', '')}", "error")
+        self._save_transition_graph()
+        self.busy_actions.discard('status')
+        if issue_key == self.current_jira_issue_key:
+            self._show_issue_status()
+        self._update_action_button_states()
+
+    def _show_issue_status(self):
+        if not hasattr(self, 'status_label') or not self.status_label.winfo_exists():
+            return
+        status = self.known_issue_state.get(self.current_jira_issue_key, {}).get('status')
+        self.status_label.configure(text=f"CHANGE STATUS: [{status.upper()}]" if status else "CHANGE STATUS:")
 
     def _update_action_button_states(self):
         if not hasattr(self, 'root') or not self.root.winfo_exists(): return
@@ -1347,20 +3774,26 @@ class GUI:
         if hasattr(self, 'task_entry') and self.task_entry.winfo_exists():
             task_summary_present = bool(self.task_entry.get().strip())
 
-        can_start = project_selected and category_selected and task_summary_present and not self.timer_running
+        can_start = (project_selected and category_selected and task_summary_present and not self.timer_running
+                     and 'timer_start' not in self.busy_actions)
         can_stop = self.timer_running
-        can_change_status = task_selected and not self.timer_running
-        can_assign = task_selected and bool(self.my_account_id) and not self.timer_running
+        can_change_status = task_selected and not self.timer_running and 'status' not in self.busy_actions
+        can_assign = (task_selected and bool(self.my_account_id) and not self.timer_running
+                      and 'assign' not in self.busy_actions)
         can_edit_labels = (project_selected or task_selected) and not self.timer_running
         can_list = project_selected and not self.timer_running
 
+        self._show_issue_status()
         status_state = 'normal' if can_change_status else 'disabled'
         if hasattr(self, 'bstatus_todo'): self.bstatus_todo.configure(state=status_state)
         if hasattr(self, 'bstatus_inprogress'): self.bstatus_inprogress.configure(state=status_state)
         if hasattr(self, 'bstatus_done'): self.bstatus_done.configure(state=status_state)
 
         assign_state = 'normal' if can_assign else 'disabled'
-        if hasattr(self, 'assign_me_button'): self.assign_me_button.configure(state=assign_state)
+        if hasattr(self, 'assign_me_button'):
+            assigned = (task_selected and bool(self.my_account_id) and
+                        self.known_issue_state.get(self.current_jira_issue_key, {}).get('assignee') == self.my_account_id)
+            self.assign_me_button.configure(state=assign_state, text="ASSIGNED" if assigned else "ASSIGN_TO_ME")
 
         labels_state = 'normal' if can_edit_labels else 'disabled'
         if hasattr(self, 'edit_labels_button'): self.edit_labels_button.configure(state=labels_state)
@@ -1395,18 +3828,77 @@ class GUI:
             print("Assign failed: My accountId missing.")
             return
 
-        print(f"Assigning {self.current_jira_issue_key} to user: {self.my_account_id}")
-        endpoint = f"issue/{self.current_jira_issue_key}/assignee"
-        payload = {"accountId": self.my_account_id}
+        issue_key = self.current_jira_issue_key
+        previous_state = dict(self.known_issue_state.get(issue_key, {}))
+        # optimistic: show the issue as mine now, roll back if the PUT fails
+        self.known_issue_state[issue_key] = dict(previous_state, assignee=self.my_account_id)
+        self.busy_actions.add('assign')
+        self._update_action_button_states()
+        self._run_in_background(self._assign_issue, issue_key, self.my_account_id, quiet=True,
+                                on_done=lambda result: self._on_assign_done(issue_key, previous_state, result),
+                                on_error=lambda e: self._on_assign_done(
+                                    issue_key, previous_state, {'success': False, 'error': str(e)}))
+
+    def _on_assign_done(self, issue_key, previous_state, result):
+        self.busy_actions.discard('assign')
+        if result['success']:
+            self._notify(f"{issue_key} assigned to you.")
+        else:
+            state = self.known_issue_state.setdefault(issue_key, {})
+            if 'assignee' in previous_state:
+                state['assignee'] = previous_state['assignee']
+            else:
+                state.pop('assignee', None)
+            self._notify(f"{issue_key}: assignment failed, reverted. {result.get('error', '')}", "error")
+        self._update_action_button_states()
+
+    def write_labels(self, issue_key, previous_labels, new_labels):
+        """Show the new label count at once and PUT in the background; the count is rolled back on failure."""
+        update_data = {"fields": {"labels": list(new_labels)}}
+        print(f"Sending label update for {issue_key}: {json.dumps(update_data)}")
+        self._show_label_count(issue_key, len(new_labels))
+        self._run_in_background(self._make_jira_request, "PUT", f"issue/{issue_key}", data=json.dumps(update_data),
+                                quiet=True,
+                                on_done=lambda result: self._on_labels_write_done(issue_key, previous_labels, result),
+                                on_error=lambda e: self._on_labels_write_done(issue_key, previous_labels,
+                                                                              {'success': False, 'error': str(e)}))
+
+    def _show_label_count(self, issue_key, count):
+        if issue_key != self.current_jira_issue_key: return
+        if hasattr(self, 'edit_labels_button') and self.edit_labels_button.winfo_exists():
+            self.edit_labels_button.configure(text=f"LABELS [{count}]")
+
+    def _on_labels_write_done(self, issue_key, previous_labels, result):
+        if result and result['success'] and result.get('status_code') in [200, 204]:
+            print(f"Successfully updated labels for {issue_key}.")
+            self._notify(f"Labels for {issue_key} updated.")
+            return
+        print(f"!! Failed to update labels for {issue_key}.")
+        error_msg = f"Failed to update labels for {issue_key}, reverted."
+        if result and result.get('error'):
+            error_msg += f" API Error: {result['error']}"
+        elif result and 'data' in result:
+            api_errors = result['data'].get('errorMessages', [])
+            api_details = result['data'].get('errors', {})
+            if api_errors: error_msg += " " + " ".join(api_errors)
+            if api_details: error_msg += " Details: " + ", ".join([f"{k}: {v}" for k, v in api_details.items()])
+        elif result and result.get('raw_response'):
+            error_msg += f" Server Response ({result.get('status_code')}): {result['raw_response'][:200]}..."
+        self._show_label_count(issue_key, len(previous_labels))
+        self._notify(error_msg, "error")
+
+    def _assign_issue(self, issue_key, account_id):
+        print(f"Assigning {issue_key} to user: {account_id}")
+        endpoint = f"issue/{issue_key}/assignee"
+        payload = {"accountId": account_id}
         result = self._make_jira_request("PUT", endpoint, data=json.dumps(payload))
 
         if result and result['success'] and result.get('status_code') in [200, 204]:
-            print(f">> Successfully assigned {self.current_jira_issue_key} to you.")
-            if hasattr(self, 'root') and self.root.winfo_exists():
-                messagebox.showinfo("Success", f"Task {self.current_jira_issue_key} assigned to you.", parent=self.root)
+            print(f">> Successfully assigned {issue_key} to you.")
+            return {'success': True}
         else:
-            print(f"!! Failed to assign {self.current_jira_issue_key} to you.")
-            error_msg = f"Error assigning task {self.current_jira_issue_key}."
+            print(f"!! Failed to assign {issue_key} to you.")
+            error_msg = f"Error assigning task {issue_key}."
             if result and result.get('error'):
                 error_msg += f"\nAPI Error: {result['error']}"
             elif result and 'data' in result:
@@ -1416,14 +3908,15 @@ class GUI:
                 if api_details: error_msg += "\nDetails: " + ", ".join([f"{k}: {v}" for k, v in api_details.items()])
             elif result and result.get('raw_response'):
                 error_msg += f"\nServer Response ({result.get('status_code')}): {result['raw_response'][:200]}..."
-            if hasattr(self, 'root') and self.root.winfo_exists():
-                messagebox.showerror("Assignment Error", error_msg, parent=self.root)
+            return {'success': False, 'error': error_msg}
 
     def start_timer(self):
         if not hasattr(self, 'root') or not self.root.winfo_exists(): return
         if self.timer_running:
             print("Timer already running.")
             return
+        # ends once the timer runs, including a task creation round trip; refused starts are not recorded
+        span = self.perf.span('action', 'start_timer')
 
         self.current_task_name = self.task_entry.get().strip() if hasattr(self, 'task_entry') else ""
         selected_issue_type = None
@@ -1458,44 +3951,94 @@ class GUI:
             final_labels = sorted(list(self.selected_labels))
             print(f"Using labels for new task: {final_labels}")
 
-            new_issue_key = self.create_jira_issue(self.current_task_name, selected_issue_type, final_labels)
-
-            if new_issue_key:
-                issue_key_to_use = new_issue_key
-                self.current_jira_issue_key = new_issue_key
-                print(f"Current task set to new issue: {self.current_jira_issue_key}")
-                self.selected_labels = set()
-                if hasattr(self, 'edit_labels_button'): self.edit_labels_button.configure(text="LABELS [0]")
-            else:
-                print("Timer cannot start: Jira issue creation failed.")
-                return
-        else:
-            print(f"Using existing task: {issue_key_to_use}")
+            self.busy_actions.add('timer_start')
+            if hasattr(self, 'bstart'): self.bstart.configure(text='CREATING TASK...')
+            self._update_action_button_states()
+            self._run_in_background(self.create_jira_issue, self.current_task_name, selected_issue_type, final_labels,
+                                    on_done=span.then(self._on_timer_issue_created),
+                                    on_error=span.then(lambda _e: self._on_timer_issue_created(None)))
+            return
 
-        if issue_key_to_use:
-            self.current_jira_issue_key = issue_key_to_use
-            self.start_time = time.time()
-            self.elapsed_time = 0
-            self.timer_running = True
-            print(f"Timer started for: {self.current_jira_issue_key} - '{self.current_task_name}'")
+        print(f"Using existing task: {issue_key_to_use}")
+        self._begin_timer(issue_key_to_use)
+        span.finish(ok=True)
 
-            if hasattr(self, 'bstart'): self.bstart.configure(text='TIMER_RUNNING...')
+    def _on_timer_issue_created(self, new_issue_key):
+        self.busy_actions.discard('timer_start')
+        if hasattr(self, 'bstart') and self.bstart.winfo_exists(): self.bstart.configure(text='START_TIMER')
 
-            self.update_timer()
+        if not new_issue_key:
+            print("Timer cannot start: Jira issue creation failed.")
             self._update_action_button_states()
-        else:
-            print("CRITICAL ERROR: No Jira issue key available. Timer not started.")
-            if hasattr(self, 'root'): messagebox.showerror("Internal Error", "Failed to get Jira issue key.",
-                                                           parent=self.root)
+            return
 
+        self.current_jira_issue_key = new_issue_key
+        print(f"Current task set to new issue: {self.current_jira_issue_key}")
+        self.selected_labels = set()
+        if hasattr(self, 'edit_labels_button'): self.edit_labels_button.configure(text="LABELS [0]")
+        self._begin_timer(new_issue_key)
+
+    def _begin_timer(self, issue_key, resumed_seconds=0, started_wall_time=None):
+        if not self._is_root_valid(): return
+        self.current_jira_issue_key = issue_key
+        # wall time is only for Jira's 'started'; elapsed time always comes from the monotonic clock
+        self.start_time = started_wall_time or time.time()
+        self._start_monotonic = time.monotonic() - resumed_seconds
+        self.elapsed_time = 0
+        self.timer_running = True
+        self.worklog_journal.record_start(issue_key, self._jira_timestamp(self.start_time), self.current_task_name,
+                                          resumed_seconds)
+        print(f"Timer started for: {self.current_jira_issue_key} - '{self.current_task_name}'")
+
+        if hasattr(self, 'bstart'): self.bstart.configure(text='TIMER_RUNNING...')
+
+        self.update_timer()
+        self._schedule_timer_checkpoint()
+        self._update_action_button_states()
+
+    def _timer_elapsed(self):
+        return time.monotonic() - self._start_monotonic if self._start_monotonic > 0 else 0
+
+    def _cancel_timer_callbacks(self):
+        for attr in ('_timer_tick_after_id', '_timer_checkpoint_after_id'):
+            after_id = getattr(self, attr)
+            if after_id is not None:
+                try:
+                    self.root.after_cancel(after_id)
+                except Exception:
+                    pass
+                setattr(self, attr, None)
+
+    def _schedule_timer_checkpoint(self):
+        """Arm the checkpoint timer; it is separate from the display tick so it keeps running while iconified."""
+        if self._timer_checkpoint_after_id is not None:
+            try:
+                self.root.after_cancel(self._timer_checkpoint_after_id)
+            except Exception:
+                pass
+        self._timer_checkpoint_after_id = self.root.after(TIMER_CHECKPOINT_MS, self._checkpoint_timer)
+
+    def _checkpoint_timer(self):
+        """Journal the running timer's elapsed seconds so a crash can resume from here."""
+        self._timer_checkpoint_after_id = None
+        if not self.timer_running or not self._is_root_valid():
+            return
+        try:
+            self.worklog_journal.record_checkpoint(self.current_jira_issue_key, int(self._timer_elapsed()))
+        except OSError as e:
+            print(f"!! Cannot checkpoint timer: {e}")
+        self._schedule_timer_checkpoint()
+
+    @timed_action('stop_timer')
     def stop_timer(self):
         if not self.timer_running:
             print("Timer not running.")
             return
 
         self.timer_running = False
-        if self.start_time > 0:
-            self.elapsed_time = time.time() - self.start_time
+        self._cancel_timer_callbacks()
+        if self._start_monotonic > 0:
+            self.elapsed_time = self._timer_elapsed()
         else:
             self.elapsed_time = 0
             print("Warning: Invalid start_time on stop.")
@@ -1503,32 +4046,45 @@ class GUI:
         elapsed_seconds = int(self.elapsed_time)
         print(f"Timer stopped. Elapsed: {elapsed_seconds}s.")
 
-        log_success = False
-        if self.current_jira_issue_key:
-            if elapsed_seconds > 0:
-                log_success = self.log_work_to_jira(self.current_jira_issue_key, elapsed_seconds)
+        if self.current_jira_issue_key and elapsed_seconds > 0:
+            if hasattr(self, 'timer_label') and self.timer_label.winfo_exists():
+                last_log_str = self._format_seconds_to_jira_duration(elapsed_seconds)
+                self.timer_label.configure(text=f"QUEUED: {last_log_str} ({elapsed_seconds}s raw)...")
+            entry = self._queue_worklog(self.current_jira_issue_key, elapsed_seconds, self.start_time)
+            self._last_worklog_id = entry['id']
+            self._schedule_worklog_flush()
+        else:
+            self.worklog_journal.record_stop(self.current_jira_issue_key, 0)
+            if not self.current_jira_issue_key:
+                print("Warning: No Jira issue key associated. Cannot log time.")
             else:
                 print("Elapsed time zero, skipping work log.")
-                log_success = True
-        else:
-            print("Warning: No Jira issue key associated. Cannot log time.")
-            log_success = True
+            self._show_logged_time(elapsed_seconds, True)
+
+        if hasattr(self, 'bstart'): self.bstart.configure(text='START_TIMER')
+
+        self._update_action_button_states()
+        self.start_time = 0
+        self._start_monotonic = 0
 
+    def _show_logged_time(self, elapsed_seconds, log_success):
+        if self.timer_running:
+            return
         if hasattr(self, 'timer_label') and self.timer_label.winfo_exists():
             if elapsed_seconds > 0:
-                last_log_str = self._format_seconds_to_jira_duration(self.elapsed_time)
+                last_log_str = self._format_seconds_to_jira_duration(elapsed_seconds)
                 status = "LAST" if log_success else "LOG FAIL"
                 self.timer_label.configure(text=f"{status}: {last_log_str} ({elapsed_seconds}s raw)")
             else:
                 self.timer_label.configure(text=f"TIME: 00:00:00 (0s)")
 
-        if hasattr(self, 'bstart'): self.bstart.configure(text='START_TIMER')
-
-        self._update_action_button_states()
-        self.start_time = 0
-
     def update_timer(self):
-        """Update the timer display - optimized version"""
+        """Redraw the timer label, then re-arm for the next whole elapsed second.
+
+        Ticks stop while the window is iconified and resume from <Map> / restore_window;
+        journal checkpoints run on their own timer and carry on regardless.
+        """
+        self._timer_tick_after_id = None
         if not self.timer_running:
             return
 
@@ -1537,14 +4093,17 @@ class GUI:
             self.timer_running = False
             return
 
-        if self.start_time <= 0:
+        if self._start_monotonic <= 0:
             print("Warning: Timer update called but start_time invalid.")
             if hasattr(self, 'timer_label') and self.timer_label.winfo_exists():
                 self.timer_label.configure(text="TIME: ERROR")
             self.timer_running = False
             return
 
-        current_elapsed = time.time() - self.start_time
+        if self.root.state() == 'iconic':
+            return
+
+        current_elapsed = self._timer_elapsed()
         h, rem = divmod(int(current_elapsed), 3600)
         m, s = divmod(rem, 60)
         time_string = f"TIME: {h:02d}:{m:02d}:{s:02d}"
@@ -1552,8 +4111,13 @@ class GUI:
         if hasattr(self, 'timer_label') and self.timer_label.winfo_exists():
             self.timer_label.configure(text=time_string)
 
-        if self.timer_running:
-            self.root.after(1000, self.update_timer)
+        # aim just past the next second boundary so the display never lags or skips a second
+        delay_ms = int((1.0 - current_elapsed % 1.0) * 1000) + 5
+        self._timer_tick_after_id = self.root.after(delay_ms, self.update_timer)
+
+    def _resume_timer_display(self):
+        if self.timer_running and self._timer_tick_after_id is None:
+            self.update_timer()
 
     def open_label_editor_window(self):
         if self.timer_running:
@@ -1582,6 +4146,8 @@ class GUI:
             return
 
         task_window = ctk.CTkToplevel(self.root)
+        # ends when the first page is on screen (see _on_task_page_loaded)
+        task_window.open_span = self.perf.span('action', 'show_task_list')
         task_window.configure(fg_color=BACKGROUND_COLOR)
         task_window.title(f"TASK_LIST::{self.selected_project_key}")
         task_window.geometry("800x550")
@@ -1602,83 +4168,57 @@ class GUI:
 
         task_window.after(100, set_grab)
 
-        scroll_frame = ctk.CTkScrollableFrame(
-            task_window, label_text=f"RECENT TASKS IN PROJECT: {self.selected_project_key}",
-            label_font=FONT_MONO_BOLD, label_text_color=TERMINAL_GREEN,
-            fg_color=WIDGET_BACKGROUND, corner_radius=0, border_width=1, border_color=BORDER_COLOR,
-            scrollbar_button_color=TERMINAL_GREEN, scrollbar_button_hover_color=TERMINAL_GREEN_BRIGHT
+        header = ctk.CTkLabel(task_window, text=f"RECENT TASKS IN PROJECT: {self.selected_project_key}",
+                              font=FONT_MONO_BOLD, text_color=TERMINAL_GREEN)
+        header.pack(padx=10, pady=(5, 0))
+        ctk.CTkLabel(task_window, text="// tick tasks for bulk actions, right-click one for its worklog breakdown",
+                     font=FONT_MONO_SMALL, text_color=TEXT_COLOR_DIM).pack(padx=10)
+        task_window.bulk_selected = {}
+        task_window.bulk_busy = False
+
+        project_key = self.selected_project_key
+        pager = PagedItems(
+            TASK_PAGE_SIZE, TASK_MAX_PAGES,
+            {'key': None, 'text': "  ... loading ...", 'error': False, 'placeholder': True},
+            fetch_page=lambda page_no: self._fetch_task_page(task_window, task_list, header, pager, project_key,
+                                                             page_no)
         )
-        scroll_frame.pack(fill='both', padx=10, pady=(5, 0), expand=True)
-
-        loading = ctk.CTkLabel(scroll_frame, text="fetching tasks...", font=FONT_MONO_NORMAL,
-                               text_color=TEXT_COLOR_NORMAL)
-        loading.pack(pady=20)
-        if hasattr(self, 'root'): self.root.update_idletasks()
-
-        print(f"Fetching tasks for project {self.selected_project_key}...")
-
-        cache_buster = int(time.time())
-        jql = f'project = "{self.selected_project_key}" AND status NOT IN ("Done", "Resolved", "Canceled", "Closed") ORDER BY updated DESC'
-        fields = "summary,status,issuetype,worklog,labels,assignee"
-        max_res = 50
-        endpoint = f"search?jql={requests.utils.quote(jql)}&fields={fields}&maxResults={max_res}&_={cache_buster}"
-        result = self._make_jira_request("GET", endpoint)
-
-        if loading.winfo_exists(): loading.destroy()
-
-        for widget in scroll_frame.winfo_children():
-            if isinstance(widget, (ctk.CTkLabel, ctk.CTkButton, ctk.CTkFrame)):
-                if widget.winfo_exists(): widget.destroy()
-
-        if result and result['success'] and 'data' in result and 'issues' in result['data']:
-            issues = result['data']['issues']
-            total = result['data'].get('total', len(issues))
-            print(f"Found {len(issues)} tasks (displaying max {max_res}/{total}) for {self.selected_project_key}.")
-
-            if not issues:
-                ctk.CTkLabel(scroll_frame, text="// no tasks found", font=FONT_MONO_NORMAL,
-                             text_color=TEXT_COLOR_DIM).pack(pady=10)
-            else:
-                for i, issue in enumerate(issues):
-                    try:
-                        key = issue.get('key', 'NO-KEY')
-                        flds = issue.get('fields', {})
-                        summ = flds.get('summary', '<no summary>')
-                        stat = flds.get('status', {}).get('name', 'N/A')
-                        itype = flds.get('issuetype', {}).get('name', 'N/A')
-                        lbls = flds.get('labels', [])
-                        assignee = flds.get('assignee')
-                        assignee_name = assignee.get('displayName', '<unassigned>') if assignee else '<unassigned>'
-                        time_secs = sum(
-                            wl.get('timeSpentSeconds', 0) for wl in flds.get('worklog', {}).get('worklogs', []))
-                        time_str = self._format_seconds_to_jira_duration(time_secs) if time_secs > 0 else "0m"
-                        lbl_str = f" {{{', '.join(lbls)}}}" if lbls else ""
-                        summ_disp = summ[:45] + ('...' if len(summ) > 45 else '')
-                        disp_txt = f"[{key}] {summ_disp} ({stat}) <{assignee_name}>{lbl_str} Σ:{time_str}"
-
-                        tframe = ctk.CTkFrame(scroll_frame, fg_color="transparent", corner_radius=0)
-                        tframe.pack(fill='x', pady=1, padx=0)
-                        tbtn = ctk.CTkButton(
-                            tframe, text=disp_txt, font=FONT_MONO_NORMAL, anchor='w', corner_radius=0,
-                            fg_color=WIDGET_BACKGROUND if i % 2 == 0 else "#282828",
-                            text_color=TEXT_COLOR_NORMAL, hover_color=HOVER_COLOR_BTN,
-                            command=lambda s=summ, k=key, t=itype, l=set(lbls), a=assignee,
-                                           win=task_window: self.select_task(s, k, t, l, a, win)
-                        )
-                        tbtn.pack(fill='x', expand=True)
-                    except Exception as issue_e:
-                        print(f"Error rendering task {issue.get('key', 'N/A')}: {issue_e}")
-                        traceback.print_exc()
-                        err_frame = ctk.CTkFrame(scroll_frame, fg_color="#400000", corner_radius=0)
-                        err_frame.pack(fill='x', pady=1, padx=0)
-                        ctk.CTkLabel(err_frame, text=f"!! Error rendering {issue.get('key', 'N/A')} !!",
-                                     font=FONT_MONO_SMALL, text_color=ERROR_RED).pack(pady=2, padx=5, anchor='w')
-        else:
-            print("Error fetching tasks or no results.")
-            err_text = "!! ERROR FETCHING TASKS / NO RESULTS !!"
-            if result and not result['success']: err_text += f"\nDETAILS: {result.get('error', 'N/A')[:200]}..."
-            ctk.CTkLabel(scroll_frame, text=err_text, font=FONT_MONO_NORMAL, text_color=ERROR_RED, wraplength=700).pack(
-                pady=10)
+        task_list = VirtualList(
+            task_window, row_height=TASK_ROW_HEIGHT,
+            create_row=lambda parent, win=task_window: self._create_task_row(parent, win),
+            bind_row=lambda row, entry, index, win=task_window: self._bind_task_row(row, entry, index, win),
+            on_view_changed=lambda first, last: pager.ensure(first, last) if task_list.items is pager else None,
+            border_width=1, border_color=BORDER_COLOR
+        )
+        task_list.pack(fill='both', padx=10, pady=(5, 0), expand=True)
+        task_list.show_message("fetching tasks...", TEXT_COLOR_NORMAL)
+        task_window.task_list = task_list
+        task_window.pager = pager
+
+        bulk_frame = ctk.CTkFrame(task_window, fg_color="transparent")
+        bulk_frame.pack(fill='x', padx=10, pady=(5, 0))
+        bulk_frame.grid_columnconfigure(0, weight=1)
+        task_window.bulk_label = ctk.CTkLabel(bulk_frame, text="SELECTED: 0", font=FONT_MONO_SMALL, anchor='w',
+                                              text_color=TEXT_COLOR_DIM)
+        task_window.bulk_label.grid(row=0, column=0, sticky='ew')
+        bulk_style = dict(font=FONT_MONO_SMALL, corner_radius=0, height=24, fg_color=WIDGET_BACKGROUND,
+                          text_color=TEXT_COLOR_NORMAL, border_color=BORDER_COLOR, border_width=1,
+                          hover_color=HOVER_COLOR_BTN, state='disabled')
+        task_window.bulk_buttons = [
+            ctk.CTkButton(bulk_frame, text="+LABEL", width=70,
+                          command=lambda win=task_window: self._bulk_add_label(win), **bulk_style),
+            ctk.CTkButton(bulk_frame, text="ASSIGN_TO_ME", width=110,
+                          command=lambda win=task_window: self._bulk_assign_to_me(win), **bulk_style),
+            ctk.CTkOptionMenu(bulk_frame, values=list(BULK_STATUS_TARGETS), width=130, height=24, corner_radius=0,
+                              font=FONT_MONO_SMALL, fg_color=WIDGET_BACKGROUND, button_color=BORDER_COLOR,
+                              button_hover_color=HOVER_COLOR_BTN, text_color=TEXT_COLOR_NORMAL, state='disabled',
+                              command=lambda target, win=task_window: self._bulk_transition(win, target)),
+            ctk.CTkButton(bulk_frame, text="CLEAR", width=60,
+                          command=lambda win=task_window: self._clear_task_selection(win), **bulk_style),
+        ]
+        task_window.bulk_buttons[2].set("MOVE TO >")
+        for column, widget in enumerate(task_window.bulk_buttons, start=1):
+            widget.grid(row=0, column=column, padx=(5, 0))
 
         btn_frame = ctk.CTkFrame(task_window, fg_color="transparent")
         btn_frame.pack(fill='x', padx=10, pady=(5, 10))
@@ -1709,6 +4249,438 @@ class GUI:
 
         task_window.protocol("WM_DELETE_WINDOW", task_window.destroy)
 
+        print(f"Fetching tasks for project {project_key}...")
+        pager.pending.add(0)
+        self._fetch_task_page(task_window, task_list, header, pager, project_key, 0)
+
+    def _fetch_task_page(self, task_window, task_list, header, pager, project_key, page_no):
+        """Start a background search for one page of open tasks (startAt = page_no * page size)."""
+        jql = f'project = "{project_key}" AND status NOT IN ("Done", "Resolved", "Canceled", "Closed") ORDER BY updated DESC'
+        fields = "summary,status,issuetype,labels,assignee,aggregatetimespent,timespent"
+        start_at = page_no * pager.page_size
+        endpoint = (f"search?jql={urllib.parse.quote(jql)}&fields={fields}"
+                    f"&startAt={start_at}&maxResults={pager.page_size}")
+        self._run_in_background(self._make_jira_request, "GET", endpoint, owner=task_window,
+                                on_done=lambda result: self._on_task_page_loaded(task_list, header, pager,
+                                                                                 project_key, page_no, result))
+
+    def _on_task_page_loaded(self, task_list, header, pager, project_key, page_no, result):
+        if page_no == 0:
+            task_list.master.open_span.finish(ok=bool(result and result['success']))
+        if result and result['success'] and 'data' in result and 'issues' in result['data']:
+            data = result['data']
+            issues = data['issues']
+            if page_no == 0:
+                # the server may cap maxResults below what was asked; page offsets must follow it
+                pager.page_size = max(1, int(data.get('maxResults') or pager.page_size))
+            pager.total = max(data.get('total', 0), page_no * pager.page_size + len(issues))
+            pager.store(page_no, [self._task_row_entry(issue) for issue in issues])
+            print(f"Loaded task page {page_no} ({len(issues)} of {pager.total}) for {project_key}, "
+                  f"{len(pager.pages)} page(s) held.")
+            header.configure(text=f"OPEN TASKS IN PROJECT: {project_key} ({pager.total})")
+
+            if not pager.total:
+                task_list.show_message("// no tasks found")
+            elif page_no == 0 and task_list.items is not pager:
+                task_list.set_items(pager)
+            else:
+                task_list.refresh()
+        else:
+            pager.pending.discard(page_no)
+            print(f"Error fetching task page {page_no} or no results.")
+            if page_no == 0 and task_list.items is not pager:
+                err_text = "!! ERROR FETCHING TASKS / NO RESULTS !!"
+                if result and not result['success']: err_text += f"\nDETAILS: {result.get('error', 'N/A')[:200]}..."
+                task_list.show_message(err_text, ERROR_RED)
+
+    def _task_row_entry(self, issue):
+        """Pre-compute what a task row shows, so scrolling only rebinds text."""
+        try:
+            key = issue.get('key', 'NO-KEY')
+            flds = issue.get('fields', {})
+            summ = flds.get('summary', '<no summary>')
+            stat = flds.get('status', {}).get('name', 'N/A')
+            itype = flds.get('issuetype', {}).get('name', 'N/A')
+            lbls = flds.get('labels', [])
+            assignee = flds.get('assignee')
+            assignee_name = assignee.get('displayName', '<unassigned>') if assignee else '<unassigned>'
+            # aggregatetimespent also counts sub-tasks; it is null when nothing was logged
+            time_secs = flds.get('aggregatetimespent') or flds.get('timespent') or 0
+            time_str = self._format_seconds_to_jira_duration(time_secs) if time_secs > 0 else "0m"
+            lbl_str = f" {{{', '.join(lbls)}}}" if lbls else ""
+            summ_disp = summ[:45] + ('...' if len(summ) > 45 else '')
+            disp_txt = f"[{key}] {summ_disp} ({stat}) <{assignee_name}>{lbl_str} Σ:{time_str}"
+            return {'key': key, 'id': issue.get('id'), 'summary': summ, 'type': itype, 'status': stat,
+                    'labels': set(lbls), 'assignee': assignee, 'text': disp_txt, 'error': False}
+        except Exception as issue_e:
+            print(f"Error rendering task {issue.get('key', 'N/A')}: {issue_e}")
+            traceback.print_exc()
+            return {'key': issue.get('key', 'N/A'), 'text': f"!! Error rendering {issue.get('key', 'N/A')} !!",
+                    'error': True}
+
+    def _create_task_row(self, parent, task_window):
+        row = ctk.CTkFrame(parent, fg_color=WIDGET_BACKGROUND, corner_radius=0, height=TASK_ROW_HEIGHT - 1)
+        row.entry = None
+        row.check = ctk.CTkCheckBox(
+            row, text="", width=22, checkbox_width=16, checkbox_height=16, corner_radius=0, border_width=1,
+            border_color=BORDER_COLOR, fg_color=TERMINAL_GREEN, hover_color=TERMINAL_GREEN_BRIGHT,
+            checkmark_color=BACKGROUND_COLOR,
+            command=lambda r=row, win=task_window: self._toggle_task_selection(win, r)
+        )
+        row.check.pack(side='left', padx=(4, 0))
+        row.button = ctk.CTkButton(
+            row, text="", font=FONT_MONO_NORMAL, anchor='w', corner_radius=0, height=TASK_ROW_HEIGHT - 1,
+            fg_color=WIDGET_BACKGROUND, text_color=TEXT_COLOR_NORMAL, hover_color=HOVER_COLOR_BTN
+        )
+        row.button.pack(side='left', fill='both', expand=True)
+        row.button.bind("<Button-3>", lambda e, r=row: self._show_worklog_breakdown(r.entry, r.winfo_toplevel()))
+        row.wheel_targets = (row.check, row.button)
+        return row
+
+    def _bind_task_row(self, row, entry, index, task_window):
+        row.entry = entry
+        selectable = not entry.get('placeholder') and not entry['error']
+        if selectable and entry['key'] in task_window.bulk_selected:
+            row.check.select()
+        else:
+            row.check.deselect()
+        row.check.configure(state='normal' if selectable and not task_window.bulk_busy else 'disabled')
+        if entry.get('placeholder'):
+            row.button.configure(text=entry['text'], fg_color=WIDGET_BACKGROUND, text_color=TEXT_COLOR_DIM,
+                                 command=None)
+            return
+        if entry['error']:
+            row.button.configure(text=entry['text'], fg_color="#400000", text_color=ERROR_RED, command=None)
+            return
+        row.button.configure(
+            text=entry['text'],
+            fg_color=WIDGET_BACKGROUND if index % 2 == 0 else "#282828",
+            text_color=TEXT_COLOR_NORMAL,
+            command=lambda e=entry, win=task_window: self.select_task(e['summary'], e['key'], e['type'],
+                                                                      e['labels'], e['assignee'], win,
+                                                                      status_name=e.get('status'))
+        )
+
+    def _toggle_task_selection(self, task_window, row):
+        entry = row.entry
+        if not entry or entry.get('placeholder') or entry['error']:
+            return
+        if entry['key'] in task_window.bulk_selected:
+            del task_window.bulk_selected[entry['key']]
+        else:
+            task_window.bulk_selected[entry['key']] = entry
+        self._update_bulk_controls(task_window)
+
+    def _clear_task_selection(self, task_window):
+        task_window.bulk_selected.clear()
+        self._update_bulk_controls(task_window)
+        task_window.task_list.refresh()
+
+    def _update_bulk_controls(self, task_window, text=None):
+        if not task_window.winfo_exists(): return
+        count = len(task_window.bulk_selected)
+        task_window.bulk_label.configure(text=text or f"SELECTED: {count}",
+                                         text_color=TEXT_COLOR_NORMAL if count else TEXT_COLOR_DIM)
+        state = 'normal' if count and not task_window.bulk_busy else 'disabled'
+        for widget in task_window.bulk_buttons:
+            widget.configure(state=state)
+        task_window.bulk_buttons[2].set("MOVE TO >")
+
+    def _bulk_add_label(self, task_window):
+        count = len(task_window.bulk_selected)
+        dialog = ctk.CTkInputDialog(text=f"Label to add to {count} task(s):", title="BULK_LABEL")
+        label = (dialog.get_input() or "").strip()
+        if not label: return
+        if re.search(r"\s", label):
+            messagebox.showwarning("Invalid Label", f"Label '{label}' contains spaces.", parent=task_window)
+            return
+        self._start_bulk_action(task_window, f"add label '{label}'", self._bulk_edit_labels, label)
+
+    def _bulk_assign_to_me(self, task_window):
+        if not self.my_account_id:
+            messagebox.showerror("User ID Error", "Cannot assign: User ID missing.", parent=task_window)
+            return
+        self._start_bulk_action(task_window, "assign to me", self._bulk_assign, self.my_account_id)
+
+    def _bulk_transition(self, task_window, target_status_name):
+        self._start_bulk_action(task_window, f"move to {target_status_name}", self._bulk_transition_issues,
+                                target_status_name)
+
+    def _start_bulk_action(self, task_window, title, fn, *args):
+        if task_window.bulk_busy or not task_window.bulk_selected: return
+        entries = list(task_window.bulk_selected.values())
+        print(f"--- Bulk {title} for {len(entries)} issue(s) ---")
+        task_window.bulk_busy = True
+        self._update_bulk_controls(task_window, text=f"RUNNING: {title} ({len(entries)})...")
+        task_window.task_list.refresh()
+        # no window owner: writes already sent must still be reported and invalidated if the list is closed
+        self._run_in_background(
+            fn, entries, *args, quiet=True,
+            on_done=lambda results: self._on_bulk_action_done(task_window, title, entries, results),
+            on_error=lambda e: self._on_bulk_action_done(task_window, title, entries,
+                                                         {entry['key']: str(e) for entry in entries}))
+
+    def _bulk_edit_labels(self, entries, label):
+        """Add one label to every issue: bulk edit API, else one PUT per issue (worker thread)."""
+        def payload(chunk):
+            return {"selectedIssueIdsOrKeys": [e['key'] for e in chunk], "selectedActions": ["labels"],
+                    "editedFieldsInput": {"labelsFields": [{"fieldId": "labels", "bulkEditMultiSelectFieldOption": "ADD",
+                                                            "labels": [{"name": label}]}]},
+                    "sendBulkNotification": False}
+
+        results = self._run_bulk_api("bulk/issues/fields", entries, payload)
+        if results is not None:
+            return results
+
+        def add_label(entry):
+            update = {"update": {"labels": [{"add": label}]}}
+            result = self._make_jira_request("PUT", f"issue/{entry['key']}", data=json.dumps(update))
+            if result and result['success'] and result.get('status_code') in [200, 204]:
+                return None
+            return self._bulk_error_text(result)
+
+        return self._bulk_fan_out(entries, add_label)
+
+    def _bulk_assign(self, entries, account_id):
+        """Assign every issue to account_id: bulk edit API, else one PUT per issue (worker thread)."""
+        def payload(chunk):
+            return {"selectedIssueIdsOrKeys": [e['key'] for e in chunk], "selectedActions": ["assignee"],
+                    "editedFieldsInput": {"singleSelectClearableUserPickerFields": [
+                        {"fieldId": "assignee", "user": {"accountId": account_id}}]},
+                    "sendBulkNotification": False}
+
+        results = self._run_bulk_api("bulk/issues/fields", entries, payload)
+        if results is not None:
+            return results
+        return self._bulk_fan_out(entries, lambda entry: self._assign_issue(entry['key'], account_id).get('error'))
+
+    def _bulk_transition_issues(self, entries, target_status_name):
+        """Move every issue to target_status_name (worker thread).
+
+        Issues whose next step is one known transition go through the bulk transition API in one
+        request; unknown or multi-hop routes fall back to _transition_issue per issue.
+        """
+        results = {}
+        one_hop, others = [], []
+        for entry in entries:
+            hops = self.transition_graph.shortest_path(entry['key'].rsplit('-', 1)[0], entry.get('type'),
+                                                       entry.get('status'), target_status_name)
+            if hops == []:
+                results[entry['key']] = None
+            elif hops and len(hops) == 1:
+                one_hop.append(dict(entry, transition_id=hops[0]['id']))
+            else:
+                others.append(entry)
+
+        def payload(chunk):
+            by_transition = {}
+            for e in chunk:
+                by_transition.setdefault(str(e['transition_id']), []).append(e['key'])
+            return {"bulkTransitionInputs": [{"selectedIssueIdsOrKeys": keys, "transitionId": transition_id}
+                                             for transition_id, keys in by_transition.items()],
+                    "sendBulkNotification": False}
+
+        bulk_results = self._run_bulk_api("bulk/issues/transition", one_hop, payload) if one_hop else {}
+        if bulk_results is None:
+            others.extend(one_hop)
+        else:
+            results.update(bulk_results)
+        results.update(self._bulk_fan_out(others, lambda entry: self._transition_issue(
+            entry['key'], target_status_name, {'status': entry.get('status'), 'type': entry.get('type')}).get('error')))
+        return results
+
+    def _run_bulk_api(self, endpoint, entries, build_payload):
+        """Submit entries to a Jira bulk endpoint in chunks and wait for each queued task (worker thread).
+
+        Returns {issue_key: error text or None}, or None when the bulk API is not available to
+        this user or server, so the caller can fall back to per-issue requests.
+        """
+        if self._bulk_api_supported.get(endpoint) is False:
+            return None
+        results = {}
+        for i in range(0, len(entries), BULK_MAX_ISSUES):
+            if current_job_cancelled():
+                break
+            chunk = entries[i:i + BULK_MAX_ISSUES]
+            result = self._make_jira_request("POST", endpoint, data=json.dumps(build_payload(chunk)))
+            if result and result.get('status_code') in BULK_FALLBACK_STATUSES and not results:
+                print(f"Bulk API {endpoint} unavailable ({result.get('status_code')}); using per-issue requests.")
+                self._bulk_api_supported[endpoint] = False
+                return None
+            if not result or not result['success'] or 'taskId' not in result.get('data', {}):
+                error = self._bulk_error_text(result)
+                results.update({e['key']: error for e in chunk})
+                continue
+            self._bulk_api_supported[endpoint] = True
+            results.update(self._wait_for_bulk_task(result['data']['taskId'], chunk))
+        return results
+
+    def _wait_for_bulk_task(self, task_id, chunk):
+        """Poll bulk/queue/{taskId} until it settles and map its per-issue-id outcome back to keys."""
+        keys = [e['key'] for e in chunk]
+        key_by_id = {str(e['id']): e['key'] for e in chunk if e.get('id')}
+        deadline = time.monotonic() + BULK_POLL_TIMEOUT_SECONDS
+        while True:
+            if current_job_cancelled():
+                return {}
+            result = self._make_jira_request("GET", f"bulk/queue/{task_id}")
+            if not result or not result['success'] or 'data' not in result:
+                error = f"Lost track of bulk task {task_id}: {self._bulk_error_text(result)}"
+                return {key: error for key in keys}
+            data = result['data']
+            task_status = data.get('status', 'N/A')
+            if task_status not in ('ENQUEUED', 'RUNNING'):
+                break
+            if time.monotonic() >= deadline:
+                return {key: f"Bulk task {task_id} still {task_status}; check Jira later." for key in keys}
+            time.sleep(BULK_POLL_INTERVAL_SECONDS)
+
+        results = {}
+        for issue_id, errors in (data.get('failedAccessibleIssues') or {}).items():
+            messages = errors if isinstance(errors, list) else [str(errors)]
+            results[key_by_id.get(str(issue_id), str(issue_id))] = "; ".join(messages) or "failed"
+        processed = {str(issue_id) for issue_id in data.get('processedAccessibleIssues') or []}
+        for entry in chunk:
+            if entry['key'] in results:
+                continue
+            if str(entry.get('id')) in processed or (task_status == 'COMPLETE' and not processed):
+                results[entry['key']] = None
+            else:
+                results[entry['key']] = f"Not processed (bulk task {task_status.lower()})."
+        print(f"Bulk task {task_id} {task_status}: {sum(v is None for v in results.values())}/{len(keys)} ok.")
+        return results
+
+    def _bulk_fan_out(self, entries, fn):
+        """Run fn(entry) -> error text or None for every issue, BULK_FAN_OUT_CONCURRENCY at a time."""
+        def run(entry):
+            try:
+                return entry['key'], fn(entry)
+            except Exception as e:
+                traceback.print_exc()
+                return entry['key'], str(e)
+
+        return dict(self._fan_out(run, entries, BULK_FAN_OUT_CONCURRENCY))
+
+    def _bulk_error_text(self, result):
+        if not result:
+            return "No response."
+        if result.get('error'):
+            return str(result['error'])
+        data = result.get('data')
+        if isinstance(data, dict):
+            messages = list(data.get('errorMessages', [])) + [f"{k}: {v}" for k, v in data.get('errors', {}).items()]
+            if messages:
+                return "; ".join(messages)
+        if result.get('raw_response'):
+            return f"Server Response ({result.get('status_code')}): {result['raw_response'][:200]}"
+        return f"HTTP {result.get('status_code', 'N/A')}"
+
+    def _on_bulk_action_done(self, task_window, title, entries, results):
+        failed = {key: error for key, error in results.items() if error}
+        done = [e['key'] for e in entries if e['key'] in results and not results[e['key']]]
+        skipped = [e['key'] for e in entries if e['key'] not in results]
+        print(f"Bulk {title}: {len(done)} ok, {len(failed)} failed, {len(skipped)} not attempted.")
+
+        # bulk endpoints are not issue URLs, so the cache cannot see which issues they touched
+        for key in done:
+            self.response_cache.invalidate_issue(key)
+            self.known_issue_state.pop(key, None)
+        self.response_cache.invalidate_class('search')
+        self._save_transition_graph()
+        self._update_action_button_states()
+
+        summary = f"Bulk {title}: {len(done)} ok"
+        if failed: summary += f", {len(failed)} failed"
+        if skipped: summary += f", {len(skipped)} not attempted"
+        self._notify(summary + ".", "error" if failed or skipped else "info")
+
+        window_open = task_window.winfo_exists()
+        if window_open:
+            task_window.bulk_busy = False
+            for key in done:
+                task_window.bulk_selected.pop(key, None)
+            self._update_bulk_controls(task_window)
+            # reload the visible pages so rows show the new state; failures stay ticked for a retry
+            task_window.pager.pages.clear()
+            task_window.task_list.refresh()
+        if (failed or skipped) and self._is_root_valid():
+            lines = []
+            for entry in entries:
+                key = entry['key']
+                if key not in results:
+                    lines.append(f"SKIP {key}: not attempted")
+                elif results[key]:
+                    lines.append(f"FAIL {key}: {results[key]}")
+                else:
+                    lines.append(f"OK   {key}")
+            self._show_bulk_report(task_window if window_open else self.root, title, lines)
+
+    def _show_bulk_report(self, parent, title, lines):
+        """Per-issue outcome of a bulk action, one line each, in a scrollable window."""
+        report = ctk.CTkToplevel(parent)
+        report.configure(fg_color=BACKGROUND_COLOR)
+        report.title(f"BULK::{title}")
+        report.geometry("600x320")
+        report.transient(parent)
+        textbox = ctk.CTkTextbox(report, font=FONT_MONO_SMALL, fg_color=WIDGET_BACKGROUND,
+                                 text_color=TEXT_COLOR_NORMAL, corner_radius=0, wrap='word')
+        textbox.pack(fill='both', expand=True, padx=10, pady=(10, 5))
+        textbox.insert("1.0", "\n".join(lines))
+        textbox.configure(state='disabled')
+        ctk.CTkButton(report, text="CLOSE", font=FONT_MONO_BOLD, corner_radius=0, command=report.destroy,
+                      fg_color=TEXT_COLOR_DIM, text_color=BACKGROUND_COLOR,
+                      hover_color=HOVER_COLOR_BTN).pack(fill='x', padx=10, pady=(0, 10))
+        report.after(100, lambda: report.winfo_exists() and report.grab_set())
+
+    def _show_worklog_breakdown(self, entry, window):
+        if not entry or entry.get('placeholder') or entry.get('error'):
+            return
+        issue_key = entry['key']
+        print(f"Fetching worklog breakdown for {issue_key}...")
+        self._run_in_background(
+            self._fetch_worklog_breakdown, issue_key, owner=window,
+            on_done=lambda breakdown: self._on_worklog_breakdown_loaded(issue_key, breakdown, window))
+
+    def _fetch_worklog_breakdown(self, issue_key):
+        """Page through issue/{key}/worklog and total timeSpentSeconds per author (worker thread)."""
+        per_author = Counter()
+        count = 0
+        start_at = 0
+        while True:
+            if current_job_cancelled():
+                return None
+            endpoint = f"issue/{issue_key}/worklog?startAt={start_at}&maxResults={WORKLOG_PAGE_SIZE}"
+            result = self._make_jira_request("GET", endpoint)
+            if not result or not result['success'] or 'data' not in result:
+                error = result.get('error', 'N/A') if result else 'N/A'
+                return {'success': False, 'error': error}
+            data = result['data']
+            worklogs = data.get('worklogs', [])
+            for wl in worklogs:
+                author = (wl.get('author') or {}).get('displayName', '<unknown>')
+                per_author[author] += wl.get('timeSpentSeconds', 0)
+            count += len(worklogs)
+            start_at += len(worklogs)
+            if not worklogs or start_at >= data.get('total', 0):
+                break
+        return {'success': True, 'per_author': per_author, 'count': count}
+
+    def _on_worklog_breakdown_loaded(self, issue_key, breakdown, window):
+        if breakdown is None:
+            return
+        if not breakdown['success']:
+            self._show_message("showerror", "Worklog Error",
+                               f"Cannot fetch worklogs for {issue_key}.\nAPI Error: {breakdown['error'][:150]}...",
+                               parent=window)
+            return
+        per_author = breakdown['per_author']
+        lines = [f"{self._format_seconds_to_jira_duration(secs):>8}  {author}"
+                 for author, secs in per_author.most_common()]
+        total = self._format_seconds_to_jira_duration(sum(per_author.values()))
+        text = "\n".join(lines) if lines else "// no work logged"
+        self._show_message("showinfo", f"WORKLOG::{issue_key}",
+                           f"{text}\n\nΣ {total} in {breakdown['count']} worklog(s)", parent=window)
+
     def _create_new_task_from_list_window(self, parent_window):
         print("Create Task requested from Task List...")
 
@@ -1724,11 +4696,12 @@ class GUI:
 
     def refresh_task_list_window(self, window):
         print("Refreshing task list window...")
+        self.response_cache.invalidate_class('search')
         if window and window.winfo_exists(): window.destroy()
         if hasattr(self, 'root') and self.root.winfo_exists():
             self.root.after(100, self.show_task_list)
 
-    def select_task(self, summary, issue_key, issue_type_name, labels_set, assignee_data, window):
+    def select_task(self, summary, issue_key, issue_type_name, labels_set, assignee_data, window, status_name=None):
         if not hasattr(self, 'root') or not self.root.winfo_exists():
             if window and window.winfo_exists(): window.destroy()
             return
@@ -1763,6 +4736,10 @@ class GUI:
 
         self.current_jira_issue_key = issue_key
         self.current_task_name = summary
+        state = {'assignee': assignee_data.get('accountId')} if assignee_data else {}
+        if status_name and status_name != 'N/A':
+            state.update(status=status_name, type=issue_type_name)
+        self.known_issue_state[issue_key] = state
 
         self._update_action_button_states()
 
@@ -1771,18 +4748,32 @@ class GUI:
     def minimize_window(self, event=None):
         if self.root and self.root.winfo_exists():
             self.root.iconify()
+            if self._timer_tick_after_id is not None:
+                self.root.after_cancel(self._timer_tick_after_id)
+                self._timer_tick_after_id = None
             print("// Window minimized (Ctrl+Q)")
 
     def restore_window(self, event=None):
         if self.root and self.root.winfo_exists():
             self.root.deiconify()
+            self._resume_timer_display()
             print("// Window restored (Ctrl+Shift+Q)")
 
     def on_closing(self):
         print("## Closing JIRA Focus ##")
         if self.timer_running:
-            print("!! WARNING: Timer running on close! Time not logged. !!")
             self.timer_running = False
+            elapsed_seconds = int(self._timer_elapsed())
+            if self.current_jira_issue_key:
+                self._queue_worklog(self.current_jira_issue_key, elapsed_seconds, self.start_time)
+                print(f"Timer running on close: {elapsed_seconds}s journaled, will be posted on next start.")
+
+        if getattr(self, 'runner', None) is not None:
+            self.runner.shutdown()
+        if getattr(self, '_hedge_pool', None) is not None:
+            self._hedge_pool.shutdown(wait=False, cancel_futures=True)
+        if getattr(self, 'transport', None) is not None:
+            self.transport.close()
 
         if self.root and self.root.winfo_exists(): self.root.destroy()
         print(">> Application closed.")
@@ -1798,12 +4789,12 @@ class GUI:
 
         close_btn = ctk.CTkButton(btn_frame, text="", width=14, height=14,
                                   fg_color="#FF5F56", hover_color="#FF5F56",
-                                  corner_radius=7, command=self.root.destroy)
+                                  corner_radius=7, command=self.on_closing)
         close_btn.pack(side='left', padx=(0, 8))
 
         minimize_btn = ctk.CTkButton(btn_frame, text="", width=14, height=14,
                                      fg_color="#FFBD2E", hover_color="#FFBD2E",
-                                     corner_radius=7, command=self.root.iconify)
+                                     corner_radius=7, command=self.minimize_window)
         minimize_btn.pack(side='left', padx=(0, 8))
 
         maximize_btn = ctk.CTkButton(btn_frame, text="", width=14, height=14,
@@ -1814,6 +4805,7 @@ class GUI:
         title_label = ctk.CTkLabel(title_bar, text="JIRA FOCUS",
                                    font=FONT_MONO_NORMAL, text_color=TEXT_COLOR_NORMAL)
         title_label.pack(side='left', padx=20)
+        self.title_label = title_label
 
 
         theme_btn_frame = ctk.CTkFrame(title_bar, fg_color="transparent")
@@ -1824,6 +4816,10 @@ class GUI:
                                       fg_color="transparent", hover_color=HOVER_COLOR_BTN,
                                       corner_radius=5, command=self.toggle_theme)
         self.theme_btn.pack(side='right')
+        self.perf_btn = ctk.CTkButton(theme_btn_frame, text="⏱", width=30, height=20,
+                                      fg_color="transparent", hover_color=HOVER_COLOR_BTN,
+                                      corner_radius=5, command=self.toggle_perf_panel)
+        self.perf_btn.pack(side='right', padx=(0, 4))
 
         title_bar.bind("<ButtonPress-1>", self.start_move)
         title_bar.bind("<ButtonRelease-1>", self.stop_move)
@@ -1899,6 +4895,14 @@ class GUI:
         if hasattr(self, 'root') and self.root is not None:
             self.root.configure(fg_color=BACKGROUND_COLOR)
 
+    def toggle_perf_panel(self):
+        if self.perf_panel is not None and self.perf_panel.winfo_exists():
+            self.perf_panel.destroy()
+            self.perf_panel = None
+            return
+        self.perf_panel = PerfPanel(self)
+
+    @timed_action('toggle_theme')
     def toggle_theme(self):
         """Toggle between light and dark themes."""
         new_theme = "light" if self.current_theme.lower() == "dark" else "dark"
@@ -1935,6 +4939,9 @@ class GUI:
 
             self._update_widget_colors(widget)
 
+        if self.circuit.is_open and hasattr(self, 'title_label'):
+            self.title_label.configure(text_color=ERROR_RED)
+
     def _update_widget_colors(self, parent_widget):
         """Recursively update widget colors based on their types."""
         for widget in parent_widget.winfo_children():
@@ -1999,15 +5006,12 @@ class GUI:
 
 
 if __name__ == "__main__":
-    missing_libs = []
-    try:
-        import customtkinter
-    except ImportError:
-        missing_libs.append("customtkinter")
-    try:
-        import requests
-    except ImportError:
-        missing_libs.append("requests")
+    import importlib.util
+
+    startup_profiler = StartupProfiler(enabled='--startup-profile' in sys.argv[1:])
+    # find_spec only locates the packages; requests is imported later, on the first API call
+    missing_libs = [lib for lib in ("customtkinter", "requests") if importlib.util.find_spec(lib) is None]
+    startup_profiler.mark("dependency check")
 
     if missing_libs:
         libs_str = ", ".join(missing_libs)
@@ -2029,7 +5033,7 @@ if __name__ == "__main__":
     print("## Initializing JIRA Focus ##")
     app_instance = None
     try:
-        app_instance = GUI()
+        app_instance = GUI(profiler=startup_profiler)
     except Exception as e:
         print(f"!! CRITICAL ERROR during application initialization:")
         traceback.print_exc()
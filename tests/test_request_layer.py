@@ -0,0 +1,81 @@
+import pytest
+
+pytest.importorskip("customtkinter")
+requests = pytest.importorskip("requests")
+
+import jira_focus
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {}
+    content = b"{}"
+    text = "{}"
+
+    def json(self):
+        return {}
+
+    def raise_for_status(self):
+        pass
+
+
+class SlowTransport:
+    """Answers every request, but only within a read timeout of at least `needs` seconds."""
+
+    connect_timeout = jira_focus.HTTP_CONNECT_TIMEOUT
+    read_timeout = jira_focus.HTTP_READ_TIMEOUT
+    pool_size = 1
+
+    def __init__(self, needs):
+        self.needs = needs
+        self.calls = []
+
+    def request(self, method, url, timeout=None, **kwargs):
+        self.calls.append(timeout)
+        if timeout[1] < self.needs:
+            raise requests.exceptions.ReadTimeout("read timed out")
+        return FakeResponse()
+
+
+def make_gui(transport):
+    gui = jira_focus.GUI.__new__(jira_focus.GUI)
+    gui.jira_server = "https://example.atlassian.net"
+    gui.transport = transport
+    gui.circuit = jira_focus.CircuitBreaker()
+    gui.rate_limiter = jira_focus.TokenBucket()
+    gui.latency = jira_focus.LatencyTracker()
+    gui.perf = jira_focus.PerfRecorder()
+    gui.adaptive_timeouts = True
+    gui.hedge_gets = False
+    gui.http_max_attempts = jira_focus.HTTP_MAX_ATTEMPTS
+    return gui
+
+
+def test_slow_but_successful_endpoint_never_opens_breaker():
+    transport = SlowTransport(needs=20)
+    gui = make_gui(transport)
+    # fast history tightens the adaptive read timeout well below what the endpoint needs
+    for _ in range(jira_focus.LATENCY_MIN_SAMPLES):
+        gui.latency.record("GET search", 0.1)
+
+    for _ in range(jira_focus.CIRCUIT_FAILURE_THRESHOLD + 2):
+        result = gui._make_jira_request_internal("GET", "search?jql=project%3DX")
+        assert result['success']
+
+    assert not gui.circuit.is_open
+    assert gui.circuit.failures == 0
+    assert transport.calls[0][1] < transport.needs
+    assert transport.calls[1][1] == transport.read_timeout
+
+
+def test_throttle_on_last_attempt_still_slows_the_token_bucket():
+    gui = make_gui(SlowTransport(needs=0))
+    response = FakeResponse()
+    response.status_code = 429
+    response.headers = {'Retry-After': '1'}
+    rate_before = gui.rate_limiter.rate
+
+    delay = gui._retry_delay("GET", gui.http_max_attempts, response=response)
+
+    assert delay is None
+    assert gui.rate_limiter.rate < rate_before
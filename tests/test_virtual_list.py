@@ -0,0 +1,41 @@
+import tkinter
+
+import pytest
+
+ctk = pytest.importorskip("customtkinter")
+pytest.importorskip("requests")
+
+import jira_focus
+
+
+@pytest.fixture
+def root():
+    try:
+        root = ctk.CTk()
+    except tkinter.TclError as e:
+        pytest.skip(f"no display: {e}")
+    root.geometry("300x200")
+    yield root
+    root.destroy()
+
+
+def test_refresh_places_ctk_rows(root):
+    def create_row(parent):
+        return ctk.CTkButton(parent, text="", height=jira_focus.TASK_ROW_HEIGHT - 1)
+
+    def bind_row(row, item, index):
+        row.configure(text=item)
+
+    virtual_list = jira_focus.VirtualList(root, create_row, bind_row, row_height=jira_focus.TASK_ROW_HEIGHT)
+    virtual_list.pack(fill='both', expand=True)
+    root.update()
+
+    virtual_list.set_items([f"item {n}" for n in range(100)])
+    virtual_list.refresh()
+    root.update()
+
+    placed = [row for row in virtual_list._rows if row.winfo_manager() == 'place']
+    assert placed
+    assert len(placed) == min(virtual_list._visible_rows, 100)
+    assert placed[0].cget('text') == "item 0"
+    assert placed[1].winfo_y() == jira_focus.TASK_ROW_HEIGHT